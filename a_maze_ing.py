@@ -3,8 +3,9 @@ Main entry point for the A-Maze-ing project.
 Parses the configuration file and initializes the maze generator.
 """
 
+import argparse
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 def parse_config(filepath: str) -> Dict[str, Any]:
@@ -32,11 +33,13 @@ def parse_config(filepath: str) -> Dict[str, Any]:
                     value = value.strip()
 
                     # Basic type casting based on expected keys
-                    if key in ('WIDTH', 'HEIGHT'):
+                    if key in ('WIDTH', 'HEIGHT', 'TILES', 'JOBS'):
                         config[key] = int(value)
                     elif key in ('ENTRY', 'EXIT'):
                         x_str, y_str = value.split(',')
                         config[key] = (int(x_str.strip()), int(y_str.strip()))
+                    elif key == 'LOOP_DENSITY':
+                        config[key] = float(value)
                     elif key == 'PERFECT':
                         config[key] = value.lower() in ('true', '1', 'yes')
                     else:
@@ -57,14 +60,82 @@ def parse_config(filepath: str) -> Dict[str, Any]:
     return config
 
 
-def main() -> None:
-    """Main execution function."""
-    if len(sys.argv) != 2:
-        print("Usage: python3 a_maze_ing.py <config.txt>")
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Args:
+        argv: Arguments to parse, defaults to sys.argv[1:].
+
+    Returns:
+        The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="a_maze_ing.py",
+        description="Generate, solve and display mazes."
+    )
+    parser.add_argument("config", help="path to the configuration file")
+    parser.add_argument(
+        "--batch", type=int, metavar="N",
+        help="generate N mazes without opening the interactive UI"
+    )
+    parser.add_argument(
+        "--jobs", type=int, metavar="K",
+        help="worker processes used in batch mode (default: CPU count)"
+    )
+    parser.add_argument(
+        "--out-dir", default="mazes", metavar="DIR",
+        help="output directory for batch mode (default: mazes)"
+    )
+    parser.add_argument(
+        "--cache-dir", metavar="DIR",
+        help="reuse seeded mazes stored in DIR and store new ones there"
+    )
+    parser.add_argument(
+        "--headless", "--no-ui", action="store_true",
+        help="generate and export the maze, then exit without opening "
+             "the interactive UI"
+    )
+    parser.add_argument(
+        "--profile", metavar="FILE",
+        help="record per-phase timings and write them to FILE"
+    )
+    parser.add_argument(
+        "--profile-format", choices=("json", "pstats"), default="json",
+        help="JSON phase spans, or cProfile statistics for pstats "
+             "(default: json)"
+    )
+    return parser.parse_args(argv)
+
+
+def run_batch_mode(
+    config_data: Dict[str, Any], args: argparse.Namespace
+) -> None:
+    """Generates a batch of mazes and reports where they were written."""
+    from mazegen.batch import run_batch, MANIFEST_NAME
+
+    try:
+        manifest = run_batch(
+            config_data, args.batch, args.jobs, args.out_dir
+        )
+    except (ValueError, OSError) as e:
+        print(f"Error: Batch generation failed. Details: {e}")
         sys.exit(1)
 
-    config_file: str = sys.argv[1]
-    config_data: Dict[str, Any] = parse_config(config_file)
+    print(
+        f"Generated {manifest['count']} mazes with {manifest['jobs']} "
+        f"worker(s) in {manifest['total_seconds']:.2f}s"
+    )
+    print(f"Manifest written to {args.out_dir}/{MANIFEST_NAME}")
+
+
+def run(args: argparse.Namespace) -> None:
+    """Generates, exports and displays the maze described by ``args``."""
+    from mazegen.profiling import span
+
+    config_file: str = args.config
+    with span('parse_config'):
+        config_data: Dict[str, Any] = parse_config(config_file)
 
     # Validate mandatory keys
     required_keys = {'WIDTH', 'HEIGHT', 'ENTRY',
@@ -78,37 +149,74 @@ def main() -> None:
     for key, val in config_data.items():
         print(f"  {key}: {val}")
 
-    # TODO: Instantiate MazeGenerator from your mazegen module here
-    # generator = MazeGenerator(config_data)
-    # generator.generate()
+    if args.batch is not None:
+        run_batch_mode(config_data, args)
+        return
 
     # Instantiate components from the mazegen module
-    from mazegen import (
-        MazeGenerator, MazeSolver,
-        MazeExporter, TerminalVisualizer
-    )
-
-    # 1. Generate and Export the maze to the text file as required
-    generator = MazeGenerator(config_data)
-    generator.generate()
+    from mazegen import MazeExporter
+    from mazegen.cache import MazeCache
+    from mazegen.formatters import PACKED_SUFFIX, PNG_SUFFIX, PPM_SUFFIX
 
-    solver = MazeSolver(
-        generator.grid, generator.width, generator.height,
-        generator.entry, generator.exit
-    )
-    shortest_path = solver.find_shortest_path()
+    # 1. Generate (or reuse a cached seeded maze) and solve it once
+    try:
+        cache = MazeCache(directory=args.cache_dir)
+        generator, shortest_path = cache.build(config_data)
+    except (ValueError, OSError) as e:
+        print(f"Error: Maze generation failed. Details: {e}")
+        sys.exit(1)
 
+    # 2. Export the maze to the text file as required
     output_file = config_data.get('OUTPUT_FILE', 'maze.txt')
     exporter = MazeExporter(
         generator.grid, generator.entry, generator.exit, shortest_path
     )
-    exporter.export(output_file)
+    if output_file.endswith(PACKED_SUFFIX):
+        exporter.export_packed(
+            output_file, compress=True, seed=generator.seed,
+            algorithm=generator.algorithm
+        )
+    elif output_file.lower().endswith((PNG_SUFFIX, PPM_SUFFIX)):
+        exporter.export_image(output_file, show_path=True)
+    else:
+        exporter.export(output_file)
     print(f"Maze successfully generated and saved to {output_file}\n")
+    if args.headless:
+        return
+
+    # 3. Launch the Interactive Terminal UI on the same maze
+    from mazegen import TerminalVisualizer
 
-    # 2. Launch the Interactive Terminal UI
-    visualizer = TerminalVisualizer(config_data)
+    visualizer = TerminalVisualizer(config_data, generator, shortest_path)
     visualizer.run()
 
 
+def main() -> None:
+    """Main execution function."""
+    args = parse_args()
+    if not args.profile:
+        run(args)
+        return
+
+    from mazegen.profiling import Profiler
+
+    profiler = Profiler(use_cprofile=args.profile_format == 'pstats')
+    profiler.start()
+    try:
+        run(args)
+    finally:
+        profiler.stop()
+        try:
+            if args.profile_format == 'pstats':
+                profiler.write_pstats(args.profile)
+            else:
+                profiler.write_json(args.profile)
+        except OSError as e:
+            print(f"Error: Could not write the profile. Details: {e}")
+        else:
+            print(profiler.summary())
+            print(f"Profile written to {args.profile}")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,314 @@
+"""
+Benchmarks generation, solving, export and rendering across maze sizes.
+
+Every phase is timed (best of ``--repeat`` runs) and its peak memory is
+measured with tracemalloc in one separate run, so tracing does not slow
+down the timings. Results are written as JSON and can be compared with a
+stored baseline; the script exits with status 1 if a phase got slower
+or bigger than the allowed thresholds.
+
+Usage:
+    python3 -m benchmarks.run_benchmarks --sizes 10 100 500
+    python3 -m benchmarks.run_benchmarks --update-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mazegen import (
+    MazeGenerator, MazeSolver, MazeExporter, TerminalVisualizer
+)
+
+DEFAULT_SIZES = [10, 100, 500, 1000]
+FULL_SIZES = [10, 100, 500, 1000, 2000, 4000]
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+PHASES = ("generate", "solve", "export", "render")
+
+# Regressions below this many seconds or bytes are treated as noise
+MIN_SECONDS = 0.005
+MIN_BYTES = 64 * 1024
+
+
+def _measure(
+    setup: Callable[[], Any],
+    action: Callable[[Any], Any],
+    repeat: int,
+    trace: bool
+) -> Tuple[float, Optional[int]]:
+    """
+    Times ``action(setup())`` and measures its peak traced memory.
+
+    Returns:
+        (best wall time in seconds, peak bytes or None if not traced).
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        state = setup()
+        started = time.perf_counter()
+        action(state)
+        best = min(best, time.perf_counter() - started)
+
+    peak: Optional[int] = None
+    if trace:
+        state = setup()
+        tracemalloc.start()
+        try:
+            action(state)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def bench_size(
+    size: int,
+    perfect: bool,
+    algorithm: str,
+    repeat: int,
+    trace: bool,
+    render: bool,
+    out_dir: str
+) -> List[Dict[str, Any]]:
+    """
+    Runs every phase on one size x size maze.
+
+    Returns:
+        One result record per phase.
+    """
+    config: Dict[str, Any] = {
+        'WIDTH': size, 'HEIGHT': size, 'ENTRY': (0, 0),
+        'EXIT': (size - 1, size - 1), 'PERFECT': perfect,
+        'SEED': 42, 'ALGORITHM': algorithm
+    }
+
+    def new_generator() -> MazeGenerator:
+        return MazeGenerator(config)
+
+    def generate(generator: MazeGenerator) -> None:
+        generator.generate()
+
+    # The maze used by the following phases
+    generator = new_generator()
+    generator.generate()
+
+    def new_solver() -> MazeSolver:
+        return MazeSolver(
+            generator.grid, size, size, generator.entry, generator.exit
+        )
+
+    def solve(solver: MazeSolver) -> None:
+        solver.find_shortest_path()
+
+    path = new_solver().find_shortest_path()
+    filename = os.path.join(out_dir, f"bench_{size}.txt")
+
+    def new_exporter() -> MazeExporter:
+        return MazeExporter(
+            generator.grid, generator.entry, generator.exit, path
+        )
+
+    def export(exporter: MazeExporter) -> None:
+        exporter.export(filename)
+
+    visualizer = TerminalVisualizer(config, generator, path)
+
+    def new_canvas() -> TerminalVisualizer:
+        visualizer._reset_cache()
+        return visualizer
+
+    def build_canvas(vis: TerminalVisualizer) -> None:
+        vis._build_canvas()
+
+    phases: List[Tuple[str, Callable[[], Any], Callable[[Any], Any]]] = [
+        ("generate", new_generator, generate),
+        ("solve", new_solver, solve),
+        ("export", new_exporter, export),
+    ]
+    if render:
+        phases.append(("render", new_canvas, build_canvas))
+
+    results = []
+    for name, setup, action in phases:
+        seconds, peak = _measure(setup, action, repeat, trace)
+        results.append({
+            'phase': name,
+            'width': size,
+            'height': size,
+            'perfect': perfect,
+            'seconds': round(seconds, 6),
+            'peak_bytes': peak,
+        })
+    os.remove(filename)
+    return results
+
+
+def result_key(result: Dict[str, Any]) -> str:
+    """Identifies a result, e.g. 'solve/100x100/perfect'."""
+    kind = "perfect" if result['perfect'] else "imperfect"
+    return f"{result['phase']}/{result['width']}x{result['height']}/{kind}"
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    time_threshold: float,
+    memory_threshold: float
+) -> List[str]:
+    """
+    Compares results with a baseline.
+
+    Args:
+        results: Records of the current run.
+        baseline: Records of the baseline run; only the keys present in
+            both runs are compared.
+        time_threshold: Allowed slowdown ratio, e.g. 1.5.
+        memory_threshold: Allowed peak memory growth ratio.
+
+    Returns:
+        A description of every regression, empty if there is none.
+    """
+    previous = {result_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        key = result_key(result)
+        base = previous.get(key)
+        if base is None:
+            continue
+        limit = base['seconds'] * time_threshold
+        if result['seconds'] > max(limit, base['seconds'] + MIN_SECONDS):
+            regressions.append(
+                f"{key}: {result['seconds']:.4f}s vs "
+                f"{base['seconds']:.4f}s baseline"
+            )
+        if result['peak_bytes'] is None or base['peak_bytes'] is None:
+            continue
+        limit = base['peak_bytes'] * memory_threshold
+        if result['peak_bytes'] > max(limit, base['peak_bytes'] + MIN_BYTES):
+            regressions.append(
+                f"{key}: peak {result['peak_bytes']} bytes vs "
+                f"{base['peak_bytes']} baseline"
+            )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses the benchmark command line."""
+    parser = argparse.ArgumentParser(
+        prog="python3 -m benchmarks.run_benchmarks",
+        description="Benchmark maze generation, solving, export and "
+                    "rendering."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+        metavar="N", help="square maze sizes to run"
+    )
+    parser.add_argument(
+        "--full", action="store_true",
+        help=f"run every size up to {FULL_SIZES[-1]}x{FULL_SIZES[-1]}"
+    )
+    parser.add_argument("--algorithm", default="backtracker")
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="timed runs per phase, the best one is kept (default: 3)"
+    )
+    parser.add_argument(
+        "--render-max", type=int, default=1000, metavar="N",
+        help="largest size whose text canvas is built (default: 1000)"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true",
+        help="skip the tracemalloc runs"
+    )
+    parser.add_argument(
+        "--output", default="bench_results.json", metavar="FILE",
+        help="where to write the JSON results"
+    )
+    parser.add_argument(
+        "--baseline", default=BASELINE_FILE, metavar="FILE",
+        help="baseline to compare against"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="write the results to the baseline file instead"
+    )
+    parser.add_argument(
+        "--time-threshold", type=float, default=1.5,
+        help="allowed slowdown ratio (default: 1.5)"
+    )
+    parser.add_argument(
+        "--memory-threshold", type=float, default=1.2,
+        help="allowed peak memory growth ratio (default: 1.2)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the benchmarks and returns the process exit status."""
+    args = parse_args(argv)
+    sizes = FULL_SIZES if args.full else args.sizes
+    results: List[Dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        for size in sizes:
+            for perfect in (True, False):
+                records = bench_size(
+                    size, perfect, args.algorithm, max(1, args.repeat),
+                    not args.no_memory, size <= args.render_max, out_dir
+                )
+                for record in records:
+                    peak = record['peak_bytes']
+                    memory = "" if peak is None else \
+                        f"  peak {peak / 1024:10.1f} KiB"
+                    print(
+                        f"{result_key(record):32} "
+                        f"{record['seconds']:10.4f}s{memory}"
+                    )
+                results.extend(records)
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'algorithm': args.algorithm,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    output = args.baseline if args.update_baseline else args.output
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+        file.write("\n")
+    print(f"Results written to {output}")
+    if args.update_baseline:
+        return 0
+
+    try:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        print(f"No baseline found at {args.baseline}, skipping comparison.")
+        return 0
+    if baseline.get('algorithm') != args.algorithm:
+        print("Baseline uses another algorithm, skipping comparison.")
+        return 0
+
+    regressions = compare(
+        results, baseline['results'],
+        args.time_threshold, args.memory_threshold
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against the baseline:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("No regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Benchmarks process startup: the interpreter alone, ``import mazegen``
+and a headless command line run on a small maze.
+
+Each command runs in a fresh process ``--runs`` times; the median and
+the best wall time are reported, along with the overhead over a bare
+interpreter start. The script exits with status 1 if the headless run's
+median overhead exceeds ``--max-overhead``.
+
+Usage:
+    python3 -m benchmarks.startup
+    python3 -m benchmarks.startup --runs 50 --max-overhead 0.25
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONFIG = """WIDTH=20
+HEIGHT=15
+ENTRY=0,0
+EXIT=19,14
+OUTPUT_FILE={output}
+PERFECT=True
+SEED=42
+"""
+
+
+def time_command(command: List[str], runs: int) -> Tuple[float, float]:
+    """
+    Runs a command ``runs`` times in fresh processes.
+
+    Returns:
+        (median, best) wall time in seconds.
+
+    Raises:
+        subprocess.CalledProcessError: If the command fails.
+    """
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            command, cwd=ROOT, check=True,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), min(timings)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses the benchmark command line."""
+    parser = argparse.ArgumentParser(
+        prog="python3 -m benchmarks.startup",
+        description="Benchmark interpreter, import and headless CLI "
+                    "startup."
+    )
+    parser.add_argument(
+        "--runs", type=int, default=20,
+        help="processes started per command (default: 20)"
+    )
+    parser.add_argument(
+        "--max-overhead", type=float, metavar="SECONDS",
+        help="fail if the headless run's median exceeds the bare "
+             "interpreter's by more than this"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Runs the startup benchmark and returns the process exit status."""
+    args = parse_args(argv)
+    runs = max(1, args.runs)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        config_file = os.path.join(work_dir, "config.txt")
+        with open(config_file, 'w', encoding='utf-8') as file:
+            file.write(
+                CONFIG.format(output=os.path.join(work_dir, "maze.txt"))
+            )
+
+        commands: Dict[str, List[str]] = {
+            'interpreter': [sys.executable, "-c", "pass"],
+            'import mazegen': [sys.executable, "-c", "import mazegen"],
+            'cli --headless': [
+                sys.executable, "a_maze_ing.py", config_file, "--headless"
+            ],
+        }
+        results: Dict[str, Tuple[float, float]] = {}
+        for name, command in commands.items():
+            results[name] = time_command(command, runs)
+
+    base = results['interpreter'][0]
+    print(f"{'command':16} {'median':>10} {'best':>10} {'overhead':>10}")
+    for name, (median, best) in results.items():
+        print(
+            f"{name:16} {median * 1000:8.1f}ms {best * 1000:8.1f}ms "
+            f"{(median - base) * 1000:8.1f}ms"
+        )
+
+    overhead = results['cli --headless'][0] - base
+    if args.max_overhead is not None and overhead > args.max_overhead:
+        print(
+            f"Headless startup overhead {overhead:.3f}s exceeds "
+            f"{args.max_overhead:.3f}s."
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
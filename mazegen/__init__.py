@@ -3,16 +3,67 @@ A-Maze-ing generation package.
 
 This package provides a standalone, reusable module for generating,
 solving, and exporting mazes.
+
+The public classes are imported from their submodules on first access,
+so ``import mazegen`` stays cheap and a script that only generates and
+exports a maze never loads the terminal visualizer.
 """
 
-from .generator import MazeGenerator
-from .solver import MazeSolver
-from .formatters import MazeExporter
-from .visualizer import TerminalVisualizer
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .grid import MazeGrid
+    from .generator import MazeGenerator
+    from .solver import IncrementalSolver, MazeSolver
+    from .path_index import MazePathIndex
+    from .formatters import MazeExporter
+    from .loader import MazeLoader
+    from .packed import PackedMazeReader
+    from .cache import MazeCache
+    from .shared import SharedMaze
+    from .visualizer import TerminalVisualizer
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'MazeGrid': 'grid',
+    'MazeGenerator': 'generator',
+    'MazeSolver': 'solver',
+    'IncrementalSolver': 'solver',
+    'MazePathIndex': 'path_index',
+    'MazeExporter': 'formatters',
+    'MazeLoader': 'loader',
+    'PackedMazeReader': 'packed',
+    'MazeCache': 'cache',
+    'SharedMaze': 'shared',
+    'TerminalVisualizer': 'visualizer'
+}
 
 __all__ = [
+    'MazeGrid',
     'MazeGenerator',
     'MazeSolver',
+    'IncrementalSolver',
+    'MazePathIndex',
     'MazeExporter',
+    'MazeLoader',
+    'PackedMazeReader',
+    'MazeCache',
+    'SharedMaze',
     'TerminalVisualizer'
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports a public class from its submodule on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups skip this function
+    return value
+
+
+def __dir__() -> List[str]:
+    """Lists the public classes along with the loaded attributes."""
+    return sorted(set(globals()) | set(__all__))
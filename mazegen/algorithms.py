@@ -0,0 +1,205 @@
+"""
+Registry of the maze generation algorithms selectable via ALGORITHM.
+"""
+
+from array import array
+from typing import TYPE_CHECKING, Callable, Dict
+
+if TYPE_CHECKING:
+    from .generator import MazeGenerator
+
+# A carver fills generator.grid with a maze, in place
+Carver = Callable[['MazeGenerator'], None]
+
+ALGORITHMS: Dict[str, Carver] = {}
+
+
+def register_algorithm(name: str) -> Callable[[Carver], Carver]:
+    """
+    Decorator adding a carver to the registry under ``name``.
+
+    Args:
+        name: Value of the ALGORITHM configuration key selecting it.
+    """
+    def decorator(carver: Carver) -> Carver:
+        ALGORITHMS[name] = carver
+        return carver
+    return decorator
+
+
+def get_algorithm(name: str) -> Carver:
+    """
+    Returns the carver registered under ``name``.
+
+    Raises:
+        ValueError: If no algorithm has that name.
+    """
+    try:
+        return ALGORITHMS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown algorithm '{name}'. "
+            f"Expected one of: {', '.join(ALGORITHMS)}."
+        ) from None
+
+
+@register_algorithm('backtracker')
+def carve_backtracker(generator: 'MazeGenerator') -> None:
+    """Iterative Recursive Backtracker (depth-first search)."""
+    generator._generate_backtracker()
+
+
+@register_algorithm('eller')
+def carve_eller(generator: 'MazeGenerator') -> None:
+    """Eller's algorithm, one row at a time."""
+    generator._generate_eller()
+
+
+def _blocked_cells(generator: 'MazeGenerator') -> bytearray:
+    """Reserves the '42' pattern and returns it as a per-cell flag map."""
+    generator._embed_42()
+    return bytearray(generator.visited)
+
+
+@register_algorithm('kruskal')
+def carve_kruskal(generator: 'MazeGenerator') -> None:
+    """
+    Randomized Kruskal's algorithm.
+
+    Every interior wall between two free cells is encoded as one integer
+    (``index * 2`` for the east wall, ``index * 2 + 1`` for the south
+    wall) in a flat array, which is shuffled once. Walls are then opened
+    whenever they join two different sets of an array-backed union-find
+    with path halving.
+    """
+    width, height = generator.width, generator.height
+    size = width * height
+    blocked = _blocked_cells(generator)
+
+    edges = array('i')
+    for idx in range(size):
+        if blocked[idx]:
+            continue
+        if idx % width < width - 1 and not blocked[idx + 1]:
+            edges.append(idx << 1)
+        if idx + width < size and not blocked[idx + width]:
+            edges.append(idx << 1 | 1)
+    generator.rng.shuffle(edges)
+
+    parent = array('i', range(size))
+    cells = generator.grid.cells
+    wall_n, wall_e = generator.WALL_N, generator.WALL_E
+    wall_s, wall_w = generator.WALL_S, generator.WALL_W
+
+    for edge in edges:
+        idx = edge >> 1
+        other = idx + width if edge & 1 else idx + 1
+
+        root_a = idx
+        while parent[root_a] != root_a:
+            parent[root_a] = parent[parent[root_a]]
+            root_a = parent[root_a]
+        root_b = other
+        while parent[root_b] != root_b:
+            parent[root_b] = parent[parent[root_b]]
+            root_b = parent[root_b]
+        if root_a == root_b:
+            continue
+
+        parent[root_a] = root_b
+        if edge & 1:
+            cells[idx] &= ~wall_s
+            cells[other] &= ~wall_n
+        else:
+            cells[idx] &= ~wall_e
+            cells[other] &= ~wall_w
+
+
+@register_algorithm('wilson')
+def carve_wilson(generator: 'MazeGenerator') -> None:
+    """
+    Wilson's algorithm (loop-erased random walks).
+
+    Produces a uniform spanning tree. Each walk only records the last
+    direction taken out of every cell, which erases loops implicitly.
+    """
+    width, height = generator.width, generator.height
+    size = width * height
+    blocked = _blocked_cells(generator)
+    rng = generator.rng
+    cells = generator.grid.cells
+
+    # (offset, wall, opposite_wall) for N, E, S, W
+    steps = (
+        (-width, generator.WALL_N, generator.WALL_S),
+        (1, generator.WALL_E, generator.WALL_W),
+        (width, generator.WALL_S, generator.WALL_N),
+        (-1, generator.WALL_W, generator.WALL_E)
+    )
+
+    def can_step(idx: int, direction: int) -> bool:
+        x = idx % width
+        if direction == 0:
+            return idx >= width and not blocked[idx - width]
+        if direction == 1:
+            return x < width - 1 and not blocked[idx + 1]
+        if direction == 2:
+            return idx + width < size and not blocked[idx + width]
+        return x > 0 and not blocked[idx - 1]
+
+    entry_x, entry_y = generator.entry
+    root = entry_y * width + entry_x
+    if not (0 <= entry_x < width and 0 <= entry_y < height) \
+            or blocked[root]:
+        root = blocked.find(0)
+        if root == -1:
+            return
+
+    # Walks may only start in cells connected to the root, otherwise
+    # they would never reach the tree
+    reachable = bytearray(size)
+    reachable[root] = 1
+    queue = array('i', [root])
+    head = 0
+    while head < len(queue):
+        idx = queue[head]
+        head += 1
+        for direction in range(4):
+            n_idx = idx + steps[direction][0]
+            if can_step(idx, direction) and not reachable[n_idx]:
+                reachable[n_idx] = 1
+                queue.append(n_idx)
+    del queue
+
+    in_tree = bytearray(size)
+    in_tree[root] = 1
+    walk_dir = bytearray(size)
+
+    for start in range(size):
+        if in_tree[start] or not reachable[start]:
+            continue
+
+        # Random walk until the tree is hit
+        idx = start
+        while not in_tree[idx]:
+            direction = rng.randrange(4)
+            while not can_step(idx, direction):
+                direction = rng.randrange(4)
+            walk_dir[idx] = direction
+            idx += steps[direction][0]
+
+        # Retrace the loop-erased path and add it to the tree
+        idx = start
+        while not in_tree[idx]:
+            offset, wall, opp_wall = steps[walk_dir[idx]]
+            cells[idx] &= ~wall
+            cells[idx + offset] &= ~opp_wall
+            in_tree[idx] = 1
+            idx += offset
+
+
+@register_algorithm('tiled')
+def carve_tiled(generator: 'MazeGenerator') -> None:
+    """Tiles carved in parallel worker processes, then stitched."""
+    from .tiled import carve_tiled as carve
+    carve(generator)
@@ -0,0 +1,194 @@
+"""
+Module for scoring mazes: distance field, branching and difficulty.
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+from .grid import GridLike, MazeGrid
+from .solver import MazeSolver
+from .profiling import span
+
+
+class MazeAnalysis:
+    """
+    Metrics of one maze, filled in by ``MazeAnalyzer.analyze``.
+
+    Per-cell results are row-major arrays: ``distances`` (steps from the
+    entry, -1 where unreachable), ``degrees`` (open passages of every
+    reachable cell) and ``on_path`` (1 for the cells of the solution).
+    ``degree_histogram[k]`` counts the reachable cells with ``k`` open
+    passages: dead ends have one, junctions three or more.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        entry: Tuple[int, int],
+        exit_pos: Tuple[int, int]
+    ) -> None:
+        """Initializes empty results for a maze of the given size."""
+        self.width = width
+        self.height = height
+        self.entry = entry
+        self.exit = exit_pos
+        self.distances: 'array[int]' = array('i')
+        self.degrees = bytearray()
+        self.on_path = bytearray()
+        self.path = ""
+        self.reachable = 0
+        self.max_distance = 0
+        self.degree_histogram: List[int] = [0] * 5
+        self.is_perfect = False
+        self.diameter: Optional[int] = None
+        self.diameter_ends: Optional[
+            Tuple[Tuple[int, int], Tuple[int, int]]
+        ] = None
+
+    @property
+    def dead_ends(self) -> int:
+        """Reachable cells with a single open passage."""
+        return self.degree_histogram[1]
+
+    @property
+    def junctions(self) -> int:
+        """Reachable cells with three or four open passages."""
+        return self.degree_histogram[3] + self.degree_histogram[4]
+
+    @property
+    def solution_fraction(self) -> float:
+        """Share of the reachable cells lying on the solution."""
+        if not self.reachable:
+            return 0.0
+        return sum(self.on_path) / self.reachable
+
+    @property
+    def diameter_exact(self) -> bool:
+        """
+        Whether ``diameter`` is the true longest shortest path. The
+        double BFS is exact on perfect mazes and a lower bound on mazes
+        with loops.
+        """
+        return self.diameter is not None and self.is_perfect
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the scalar metrics as a JSON-ready dict."""
+        return {
+            'width': self.width,
+            'height': self.height,
+            'reachable': self.reachable,
+            'max_distance': self.max_distance,
+            'path_length': len(self.path),
+            'solution_fraction': round(self.solution_fraction, 6),
+            'dead_ends': self.dead_ends,
+            'junctions': self.junctions,
+            'degree_histogram': list(self.degree_histogram),
+            'is_perfect': self.is_perfect,
+            'diameter': self.diameter,
+            'diameter_exact': self.diameter_exact,
+        }
+
+
+class MazeAnalyzer:
+    """
+    Computes maze metrics from breadth-first searches.
+
+    One full BFS from the entry yields the distance field and, in the
+    same pass, every cell's number of open passages; the solution is
+    then read back from the distance field instead of being searched
+    again. The diameter costs one more BFS, from the cell farthest from
+    the entry (double BFS).
+    """
+
+    def __init__(
+        self,
+        grid: GridLike,
+        width: int,
+        height: int,
+        entry: Tuple[int, int],
+        exit_pos: Tuple[int, int]
+    ) -> None:
+        """
+        Initializes the analyzer with maze data.
+
+        Args:
+            grid: The maze grid (MazeGrid or list of rows).
+            width: Maze width in cells.
+            height: Maze height in cells.
+            entry: (x, y) coordinates of the entry.
+            exit_pos: (x, y) coordinates of the exit.
+        """
+        self.grid = MazeGrid.coerce(grid)
+        self.width = width
+        self.height = height
+        self.entry = entry
+        self.exit_pos = exit_pos
+
+    def _coords(self, idx: int) -> Tuple[int, int]:
+        """Converts a flat cell index into (x, y)."""
+        return idx % self.width, idx // self.width
+
+    def analyze(self, diameter: bool = True) -> MazeAnalysis:
+        """
+        Computes every metric of the maze.
+
+        Args:
+            diameter: Also run the second BFS measuring the diameter.
+
+        Returns:
+            The analysis; ``diameter`` stays None when not requested.
+
+        Raises:
+            ValueError: If the entry is outside the maze.
+        """
+        size = self.width * self.height
+        result = MazeAnalysis(
+            self.width, self.height, self.entry, self.exit_pos
+        )
+        solver = MazeSolver(
+            self.grid, self.width, self.height, self.entry, self.exit_pos
+        )
+        with span('analyze', size):
+            degrees = bytearray(size)
+            distances = solver.distances(self.entry, degrees)
+            unreachable = distances.count(-1)
+            histogram = [degrees.count(k) for k in range(5)]
+            histogram[0] -= unreachable  # Unreached cells keep degree 0
+
+            result.distances = distances
+            result.degrees = degrees
+            result.degree_histogram = histogram
+            result.reachable = size - unreachable
+            result.max_distance = max(distances)
+            # A connected graph is a tree when it has one edge less
+            # than it has nodes
+            edges = sum(k * count for k, count in enumerate(histogram)) // 2
+            result.is_perfect = edges == result.reachable - 1
+
+            result.path = solver.path_to(distances, self.exit_pos)
+            result.on_path = self._mark_path(result.path)
+
+            if diameter:
+                start = distances.index(result.max_distance)
+                from_start = solver.distances(self._coords(start))
+                longest = max(from_start)
+                end = from_start.index(longest)
+                result.diameter = longest
+                result.diameter_ends = (
+                    self._coords(start), self._coords(end)
+                )
+        return result
+
+    def _mark_path(self, path: str) -> bytearray:
+        """Flags the cells visited by a path leaving the entry."""
+        width = self.width
+        on_path = bytearray(width * self.height)
+        if not path:
+            return on_path
+        offsets = {'N': -width, 'E': 1, 'S': width, 'W': -1}
+        idx = self.entry[1] * width + self.entry[0]
+        on_path[idx] = 1
+        for step in path:
+            idx += offsets[step]
+            on_path[idx] = 1
+        return on_path
@@ -0,0 +1,205 @@
+"""
+Module for caching generated mazes by the parameters that produced them.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from .grid import MazeGrid
+from .generator import MazeGenerator
+from .solver import MazeSolver
+from .formatters import write_maze, WRITE_BUFFER_SIZE
+
+# (algorithm, width, height, entry, exit, perfect, seed, options)
+CacheKey = Tuple[Any, ...]
+
+# A cached maze: its grid and the shortest path from entry to exit
+CachedMaze = Tuple[MazeGrid, str]
+
+
+def cache_key(config: Dict[str, Any]) -> Optional[CacheKey]:
+    """
+    Returns the key identifying the maze a configuration produces.
+
+    Defaults are resolved the same way MazeGenerator resolves them, so
+    two configurations building the same maze share a key. Settings only
+    used by one mode (TILES for ``tiled``, LOOP_DENSITY for imperfect
+    mazes) are part of the trailing options tuple.
+
+    Args:
+        config: Maze generation parameters.
+
+    Returns:
+        The key, or None if the configuration has no SEED: an unseeded
+        maze is different every time and is never cached.
+
+    Raises:
+        ValueError: If ALGORITHM is unknown.
+    """
+    if config.get('SEED') is None:
+        return None
+    generator = MazeGenerator(config)
+    options: Tuple[Tuple[str, Any], ...] = ()
+    if generator.algorithm == 'tiled':
+        options += (('TILES', generator.tiles),)
+    if not generator.is_perfect:
+        options += (('LOOP_DENSITY', generator.loop_density),)
+    return (
+        generator.algorithm,
+        generator.width,
+        generator.height,
+        tuple(generator.entry),
+        tuple(generator.exit),
+        bool(generator.is_perfect),
+        generator.seed,
+        options
+    )
+
+
+class MazeCache:
+    """
+    Two-level cache of generated and solved mazes.
+
+    The first level is an in-memory LRU of at most ``max_entries``
+    mazes. The optional second level is a directory holding one file per
+    maze in the hexadecimal text format, named after a SHA-256 digest of
+    its key, so it survives restarts and can be shared by processes.
+    """
+
+    def __init__(
+        self, max_entries: int = 64, directory: Optional[str] = None
+    ) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries: Mazes kept in memory before evicting the least
+                recently used one.
+            directory: Optional on-disk store, created if missing.
+
+        Raises:
+            ValueError: If max_entries is negative.
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries must not be negative.")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[CacheKey, CachedMaze]' = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        """Returns the number of mazes held in memory."""
+        return len(self._entries)
+
+    def _file_for(self, key: CacheKey) -> Optional[str]:
+        """Returns the on-disk file of a key, if a store is configured."""
+        if self.directory is None:
+            return None
+        # The on-disk store is optional: its modules load only when used
+        import hashlib
+
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.txt")
+
+    def _remember(self, key: CacheKey, maze: CachedMaze) -> None:
+        """Adds a maze to the in-memory LRU, evicting if it is full."""
+        if self.max_entries == 0:
+            return
+        self._entries[key] = maze
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read_file(self, key: CacheKey) -> Optional[CachedMaze]:
+        """Loads a maze from the on-disk store; None if absent or stale."""
+        filename = self._file_for(key)
+        if filename is None or not os.path.exists(filename):
+            return None
+        from .loader import MazeLoader
+
+        _, width, height, entry, exit_pos = key[:5]
+        try:
+            loader = MazeLoader(filename)
+        except (OSError, ValueError):
+            return None
+        if (loader.width, loader.height) != (width, height) \
+                or loader.entry != entry or loader.exit != exit_pos:
+            return None
+        return loader.grid, loader.path
+
+    def _write_file(self, key: CacheKey, maze: CachedMaze) -> None:
+        """Atomically writes a maze to the on-disk store."""
+        filename = self._file_for(key)
+        if filename is None:
+            return
+        import tempfile
+
+        grid, path = maze
+        _, _, _, entry, exit_pos = key[:5]
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+                write_maze(file, grid, entry, exit_pos, path)
+            os.replace(tmp_name, filename)
+        except OSError as e:
+            print(f"Warning: Could not write maze cache file. Details: {e}")
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+
+    def get(self, config: Dict[str, Any]) -> Optional[CachedMaze]:
+        """
+        Looks a maze up, first in memory and then on disk.
+
+        Returns:
+            A copy of the cached grid and its path, or None on a miss.
+        """
+        key = cache_key(config)
+        if key is None:
+            return None
+        maze = self._entries.get(key)
+        if maze is not None:
+            self._entries.move_to_end(key)
+        else:
+            maze = self._read_file(key)
+            if maze is None:
+                self.misses += 1
+                return None
+            self._remember(key, maze)
+        self.hits += 1
+        grid, path = maze
+        return grid.copy(), path
+
+    def put(self, config: Dict[str, Any], grid: MazeGrid, path: str) -> None:
+        """Stores a maze in memory and, if configured, on disk."""
+        key = cache_key(config)
+        if key is None:
+            return
+        maze = (grid.copy(), path)
+        self._remember(key, maze)
+        self._write_file(key, maze)
+
+    def build(self, config: Dict[str, Any]) -> Tuple[MazeGenerator, str]:
+        """
+        Returns a generated maze and its shortest path, from the cache
+        when possible; otherwise generates, solves and stores it.
+
+        On a cache hit the generator is not run: its ``grid`` is the
+        cached one and its ``stats`` stay empty.
+        """
+        generator = MazeGenerator(config)
+        cached = self.get(config)
+        if cached is not None:
+            generator.grid, shortest_path = cached
+            return generator, shortest_path
+
+        generator.generate()
+        solver = MazeSolver(
+            generator.grid, generator.width, generator.height,
+            generator.entry, generator.exit
+        )
+        shortest_path = solver.find_shortest_path()
+        self.put(config, generator.grid, shortest_path)
+        return generator, shortest_path
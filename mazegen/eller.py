@@ -0,0 +1,183 @@
+"""
+Module implementing Eller's algorithm, which builds a maze row by row.
+"""
+
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Wall bitmasks, identical to the ones used by MazeGenerator
+WALL_N = 1
+WALL_E = 2
+WALL_S = 4
+WALL_W = 8
+ALL_WALLS = WALL_N | WALL_E | WALL_S | WALL_W
+
+
+def _runs(blocked: Set[int], width: int) -> Iterator[Tuple[int, int]]:
+    """Yields (start, end) bounds of every run of unblocked cells."""
+    start = -1
+    for x in range(width + 1):
+        if x < width and x not in blocked:
+            if start == -1:
+                start = x
+        elif start != -1:
+            yield start, x
+            start = -1
+
+
+def _viable_rows(
+    reserved: Dict[int, Set[int]], width: int, height: int
+) -> Dict[int, bytearray]:
+    """
+    Marks which cells of the reserved rows can still reach the bottom.
+
+    A cell is viable when some cell of its run of unblocked cells has a
+    viable cell below it; in the last row every unblocked cell is
+    viable. Rows without reserved cells are entirely viable and are not
+    stored. Only a handful of rows hold reserved cells, so this is
+    computed once, bottom-up, before generation starts.
+    """
+    viable: Dict[int, bytearray] = {}
+    for y in sorted(reserved, reverse=True):
+        blocked = reserved[y]
+        below = viable.get(y + 1)
+        flags = bytearray(width)
+        for start, end in _runs(blocked, width):
+            if y == height - 1 or below is None \
+                    or any(below[start:end]):
+                flags[start:end] = b"\x01" * (end - start)
+        viable[y] = flags
+    return viable
+
+
+def eller_rows(
+    width: int,
+    height: int,
+    reserved: Iterable[Tuple[int, int]] = (),
+    rng: Optional[random.Random] = None
+) -> Iterator[bytes]:
+    """
+    Generates a perfect maze one finished row at a time.
+
+    Only the current row's set labels are kept between rows, so memory
+    is proportional to the width and ``height`` may be arbitrarily
+    large. Reserved cells stay fully closed; cells that can only be
+    reached from above (pockets around the reserved cells) are always
+    entered from the row before, so every open cell stays connected.
+
+    Args:
+        width: Number of cells per row.
+        height: Number of rows.
+        reserved: (x, y) cells that must remain closed.
+        rng: Random source, a fresh one is used if omitted.
+
+    Yields:
+        Each row as bytes of wall values, top to bottom.
+    """
+    rng = rng or random.Random()
+    blocked_rows: Dict[int, Set[int]] = {}
+    for x, y in reserved:
+        if 0 <= x < width and 0 <= y < height:
+            blocked_rows.setdefault(y, set()).add(x)
+    viable_rows = _viable_rows(blocked_rows, width, height)
+    no_blocks: Set[int] = set()
+    all_viable = b"\x01" * width
+
+    # Set label carried down into each cell of the next row, or -1
+    carry: List[int] = [-1] * width
+    opened_north = bytearray(width)
+
+    for y in range(height):
+        blocked = blocked_rows.get(y, no_blocks)
+        viable = viable_rows.get(y, all_viable)
+        last_row = y == height - 1
+        below_viable = viable_rows.get(y + 1, all_viable)
+        below_blocked = blocked_rows.get(y + 1, no_blocks)
+
+        # Compact labels: carried sets first, then one new set per cell
+        labels = [-1] * width
+        renumber: Dict[int, int] = {}
+        for x in range(width):
+            if carry[x] != -1:
+                labels[x] = renumber.setdefault(carry[x], len(renumber))
+        next_label = len(renumber)
+        for x in range(width):
+            if labels[x] == -1 and x not in blocked:
+                labels[x] = next_label
+                next_label += 1
+        parent = list(range(next_label))
+
+        def find(label: int) -> int:
+            while parent[label] != label:
+                parent[label] = parent[parent[label]]
+                label = parent[label]
+            return label
+
+        row = bytearray([ALL_WALLS]) * width
+        for x in range(width):
+            if opened_north[x]:
+                row[x] &= ~WALL_N
+
+        def join(x: int) -> None:
+            """Merges cell x with cell x + 1 and opens the wall."""
+            parent[find(labels[x])] = find(labels[x + 1])
+            row[x] &= ~WALL_E
+            row[x + 1] &= ~WALL_W
+
+        # Horizontal pass: random joins, forced on the last row and
+        # inside runs that cannot continue downwards
+        for x in range(width - 1):
+            if labels[x] == -1 or labels[x + 1] == -1:
+                continue
+            if find(labels[x]) == find(labels[x + 1]):
+                continue
+            if last_row or not viable[x] or rng.random() < 0.5:
+                join(x)
+
+        carry = [-1] * width
+        opened_north = bytearray(width)
+        if last_row:
+            yield bytes(row)
+            break
+
+        # Every set needs a way down: join sets that have none
+        has_down = bytearray(next_label)
+        for x in range(width):
+            if labels[x] != -1 and below_viable[x]:
+                has_down[find(labels[x])] = 1
+        for x in range(width - 1):
+            if labels[x] == -1 or labels[x + 1] == -1:
+                continue
+            left, right = find(labels[x]), find(labels[x + 1])
+            if left != right and not (has_down[left] and has_down[right]):
+                join(x)
+                has_down[find(left)] = has_down[left] | has_down[right]
+
+        # Vertical pass: at least one random drop per set into a viable
+        # cell, plus more drops at random
+        candidates: Dict[int, List[int]] = {}
+        for x in range(width):
+            if labels[x] != -1 and below_viable[x]:
+                candidates.setdefault(find(labels[x]), []).append(x)
+        drops: List[int] = []
+        for xs in candidates.values():
+            forced = rng.choice(xs)
+            drops.extend(
+                x for x in xs if x == forced or rng.random() < 0.5
+            )
+
+        # Pockets in the next row that can only be entered from above
+        pockets = _runs(below_blocked, width) if below_blocked else ()
+        for start, end in pockets:
+            if any(below_viable[start:end]):
+                continue
+            entries = [x for x in range(start, end) if labels[x] != -1]
+            if entries:
+                drops.append(rng.choice(entries))
+
+        for x in drops:
+            row[x] &= ~WALL_S
+            opened_north[x] = 1
+            carry[x] = find(labels[x])
+
+        yield bytes(row)
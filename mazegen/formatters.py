@@ -2,7 +2,91 @@
 Module for formatting and exporting the maze.
 """
 
-from typing import List, Tuple
+from typing import Any, BinaryIO, Iterable, Iterator, Tuple, Union
+from .grid import GridLike, MazeGrid
+from .profiling import span
+
+# Translation table from wall values (0-15) to uppercase hex digits
+HEX_TABLE = bytes.maketrans(bytes(range(16)), b"0123456789ABCDEF")
+
+# Size of the output buffer and of the chunks handed to file.write
+WRITE_BUFFER_SIZE = 1 << 20
+
+# File name suffix of the packed binary format (see mazegen.packed)
+PACKED_SUFFIX = ".mzp"
+
+# File name suffixes of the image formats (see mazegen.image)
+PNG_SUFFIX = ".png"
+PPM_SUFFIX = ".ppm"
+
+# A row of wall values: bytes, bytearray, memoryview or list of ints
+RowLike = Union[bytes, bytearray, memoryview, Iterable[int]]
+
+
+def _grid_chunks(grid: MazeGrid) -> Iterator[bytes]:
+    """Yields the hex grid section in blocks of whole rows."""
+    width = grid.width
+    rows_per_chunk = max(1, WRITE_BUFFER_SIZE // (width + 1))
+    block_size = rows_per_chunk * width
+    cells = grid.cells
+    for start in range(0, width * grid.height, block_size):
+        block = bytes(cells[start:start + block_size]).translate(HEX_TABLE)
+        lines = [block[i:i + width] for i in range(0, len(block), width)]
+        lines.append(b"")  # Ends the block with a newline
+        yield b"\n".join(lines)
+
+
+def _row_chunks(rows: Iterable[RowLike]) -> Iterator[bytes]:
+    """Yields the hex grid section from a row iterator, buffered."""
+    buffer = bytearray()
+    for row in rows:
+        buffer += bytes(row).translate(HEX_TABLE)
+        buffer += b"\n"
+        if len(buffer) >= WRITE_BUFFER_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def write_maze(
+    file: BinaryIO,
+    rows: Union[MazeGrid, Iterable[RowLike]],
+    entry: Tuple[int, int],
+    exit_pos: Tuple[int, int],
+    path: Union[str, Iterable[str]]
+) -> None:
+    """
+    Streams a maze in the hexadecimal text format to a binary file.
+
+    Rows are translated to hex a whole row (or block of rows) at a time
+    and written as soon as they are available, so a row generator never
+    needs the full maze in memory.
+
+    Args:
+        file: A file object opened in binary write mode.
+        rows: A MazeGrid, or any iterable of rows of wall values.
+        entry: (x, y) coordinates of the entry.
+        exit_pos: (x, y) coordinates of the exit.
+        path: The solution as a string, or an iterable of string chunks.
+    """
+    if isinstance(rows, MazeGrid) and rows.width:
+        chunks = _grid_chunks(rows)
+    else:
+        chunks = _row_chunks(rows)
+    for chunk in chunks:
+        file.write(chunk)
+
+    # After an empty line, insert entry, exit, and path
+    file.write(
+        f"\n{entry[0]},{entry[1]}\n{exit_pos[0]},{exit_pos[1]}\n".encode()
+    )
+    if isinstance(path, str):
+        file.write(path.encode('ascii'))
+    else:
+        for part in path:
+            file.write(part.encode('ascii'))
+    file.write(b"\n")
 
 
 class MazeExporter:
@@ -10,13 +94,13 @@ class MazeExporter:
 
     def __init__(
         self,
-        grid: List[List[int]],
+        grid: GridLike,
         entry: Tuple[int, int],
         exit_pos: Tuple[int, int],
         path: str
     ) -> None:
         """Initializes the exporter with maze data."""
-        self.grid = grid
+        self.grid = MazeGrid.coerce(grid)
         self.entry = entry
         self.exit_pos = exit_pos
         self.path = path
@@ -28,19 +112,129 @@ class MazeExporter:
         Args:
             filename: The target output file path.
         """
-        try:
-            with open(filename, 'w', encoding='utf-8') as file:
-                # Write grid row by row using hexadecimal digits
-                for row in self.grid:
-                    # f"{cell:X}" format the integer to an uppercase Hex string
-                    row_hex = "".join(f"{cell:X}" for cell in row)
-                    file.write(f"{row_hex}\n")
-
-                # After an empty line, insert entry, exit, and path
-                file.write("\n")
-                file.write(f"{self.entry[0]},{self.entry[1]}\n")
-                file.write(f"{self.exit_pos[0]},{self.exit_pos[1]}\n")
-                file.write(f"{self.path}\n")
-
-        except IOError as e:
-            print(f"Error: Could not write to file '{filename}'. Details: {e}")
+        self.export_rows(
+            filename, self.grid, self.entry, self.exit_pos, self.path
+        )
+
+    def export_packed(
+        self,
+        filename: str,
+        compress: bool = False,
+        seed: Any = None,
+        algorithm: str = ""
+    ) -> None:
+        """
+        Writes the maze data to a file in the packed binary format.
+
+        Args:
+            filename: The target output file path.
+            compress: Store the rows as indexed zlib chunks.
+            seed: SEED the maze was generated with, recorded in the header.
+            algorithm: Generating algorithm, recorded in the header.
+        """
+        from .packed import write_packed
+
+        grid = self.grid
+        with span('export', grid.width * grid.height):
+            try:
+                with open(
+                    filename, 'wb', buffering=WRITE_BUFFER_SIZE
+                ) as file:
+                    write_packed(
+                        file, grid, self.entry, self.exit_pos, self.path,
+                        seed, algorithm, compress
+                    )
+
+            except IOError as e:
+                print(
+                    f"Error: Could not write to file '{filename}'. "
+                    f"Details: {e}"
+                )
+
+    def export_image(
+        self,
+        filename: str,
+        cell_size: int = 4,
+        wall_size: int = 1,
+        show_path: bool = False
+    ) -> None:
+        """
+        Writes the maze as a PNG or PPM image, chosen by the file suffix.
+
+        The image is streamed one scanline at a time, so memory stays
+        proportional to the image width.
+
+        Args:
+            filename: The target output file path, ending in .png or .ppm.
+            cell_size: Pixels across a cell.
+            wall_size: Pixels across a wall.
+            show_path: Draw the solution path over the maze.
+
+        Raises:
+            ValueError: If the suffix is not an image format, or a pixel
+                size is not positive.
+        """
+        from .image import write_png, write_ppm
+
+        lowered = filename.lower()
+        if not lowered.endswith((PNG_SUFFIX, PPM_SUFFIX)):
+            raise ValueError(
+                f"Unknown image format for '{filename}'. "
+                f"Expected a {PNG_SUFFIX} or {PPM_SUFFIX} file name."
+            )
+        if cell_size < 1 or wall_size < 1:
+            raise ValueError("Cell and wall sizes must be positive.")
+
+        grid = self.grid
+        path = self.path if show_path else ""
+        with span('export', grid.width * grid.height):
+            try:
+                with open(
+                    filename, 'wb', buffering=WRITE_BUFFER_SIZE
+                ) as file:
+                    writer = write_png if lowered.endswith(PNG_SUFFIX) \
+                        else write_ppm
+                    writer(
+                        file, grid, self.entry, self.exit_pos, path,
+                        cell_size, wall_size
+                    )
+
+            except IOError as e:
+                print(
+                    f"Error: Could not write to file '{filename}'. "
+                    f"Details: {e}"
+                )
+
+    @staticmethod
+    def export_rows(
+        filename: str,
+        rows: Union[MazeGrid, Iterable[RowLike]],
+        entry: Tuple[int, int],
+        exit_pos: Tuple[int, int],
+        path: Union[str, Iterable[str]] = ""
+    ) -> None:
+        """
+        Writes a maze to a file while its rows are still being produced.
+
+        Args:
+            filename: The target output file path.
+            rows: A MazeGrid, or any iterable of rows of wall values,
+                e.g. rows yielded one at a time by a generator.
+            entry: (x, y) coordinates of the entry.
+            exit_pos: (x, y) coordinates of the exit.
+            path: The solution as a string or an iterable of chunks.
+        """
+        cells = rows.width * rows.height \
+            if isinstance(rows, MazeGrid) else 0
+        with span('export', cells):
+            try:
+                with open(
+                    filename, 'wb', buffering=WRITE_BUFFER_SIZE
+                ) as file:
+                    write_maze(file, rows, entry, exit_pos, path)
+
+            except IOError as e:
+                print(
+                    f"Error: Could not write to file '{filename}'. "
+                    f"Details: {e}"
+                )
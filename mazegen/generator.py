@@ -3,9 +3,46 @@ Core module for generating mazes using the Recursive Backtracker algorithm.
 """
 
 import random
-from typing import Dict, Any, List, Tuple, Set
+import time
+from array import array
+from collections import deque
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from .grid import MazeGrid
+from .eller import eller_rows
+from .algorithms import get_algorithm
 from .solver import MazeSolver
 from .formatters import MazeExporter
+from .profiling import span
+
+# A carve step: wall removed from cell (x, y); the neighbour behind that
+# wall loses the opposite wall at the same time
+CarveEvent = Tuple[int, int, int]
+
+
+def pattern_cells(width: int, height: int) -> List[Tuple[int, int]]:
+    """
+    Returns the cells forming the '42' pattern in the center of a
+    width x height maze, or an empty list if it is too small to hold it.
+    """
+    # The pattern requires at least 7x5, plus a border to remain solvable
+    if width < 10 or height < 7:
+        return []
+
+    # Base 0-indexed pattern for '42' (7 cells wide, 5 cells high)
+    base_pattern = [
+        # The '4' shape
+        (0, 0), (0, 1), (0, 2), (1, 2), (2, 0), (2, 1),
+        (2, 2), (2, 3), (2, 4),
+        # The '2' shape
+        (4, 0), (5, 0), (6, 0), (6, 1), (6, 2), (5, 2),
+        (4, 2), (4, 3), (4, 4), (5, 4), (6, 4)
+    ]
+
+    # Calculate offsets to perfectly center the pattern
+    offset_x = (width - 7) // 2
+    offset_y = (height - 5) // 2
+
+    return [(offset_x + dx, offset_y + dy) for dx, dy in base_pattern]
 
 
 class MazeGenerator:
@@ -20,6 +57,12 @@ class MazeGenerator:
     WALL_W = 8  # 1000 (Bit 3)
     ALL_WALLS = WALL_N | WALL_E | WALL_S | WALL_W  # 15
 
+    # For every 4-bit mask of directions (bit 0 N, 1 E, 2 S, 3 W), the
+    # direction indices it contains, in N, E, S, W order
+    _DIRECTION_SETS = tuple(
+        tuple(d for d in range(4) if mask >> d & 1) for mask in range(16)
+    )
+
     def __init__(self, config: Dict[str, Any]) -> None:
         """
         Initializes the MazeGenerator with the given configuration.
@@ -34,117 +77,325 @@ class MazeGenerator:
         default_exit = (self.width - 1, self.height - 1)
         self.exit: Tuple[int, int] = config.get('EXIT', default_exit)
         self.is_perfect: bool = config.get('PERFECT', True)
+        # Imperfect mode: walls opened per cell, each one adds a loop
+        self.loop_density: float = float(config.get('LOOP_DENSITY', 0.05))
+        if self.loop_density < 0:
+            raise ValueError("LOOP_DENSITY must not be negative.")
+        self.algorithm: str = str(
+            config.get('ALGORITHM', 'backtracker')
+        ).lower()
+        self._carve = get_algorithm(self.algorithm)
+        # Tiled mode: TILES x TILES tiles carved by JOBS processes
+        self.tiles: int = int(config.get('TILES', 4))
+        self.jobs: int = int(config.get('JOBS', 0))
+        # Throughput of the last generate() call
+        self.stats: Dict[str, Any] = {}
+
+        # Optional: Allow seeding for reproducibility. Each generator
+        # owns its random source so that parallel runs stay independent.
+        self.seed: Any = config.get('SEED')
+        self.rng = random.Random(self.seed) if 'SEED' in config \
+            else random.Random()
+
+        # The grid (all walls closed) and the visited map are allocated
+        # on first use, so that streaming rows with iter_rows() never
+        # holds the full maze
+        self._grid: Optional[MazeGrid] = None
+        self._visited: Optional[bytearray] = None
+
+    @property
+    def grid(self) -> MazeGrid:
+        """The maze grid, initialized with all walls closed (value 15)."""
+        if self._grid is None:
+            self._grid = MazeGrid(self.width, self.height, self.ALL_WALLS)
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: MazeGrid) -> None:
+        """Replaces the maze grid."""
+        self._grid = grid
+
+    @property
+    def visited(self) -> bytearray:
+        """
+        One byte per cell, in grid order: 1 for the cells reserved by the
+        '42' pattern or already reached while carving, 0 otherwise.
+        """
+        if self._visited is None:
+            self._visited = bytearray(self.width * self.height)
+        return self._visited
 
-        # Optional: Allow seeding for reproducibility
-        if 'SEED' in config:
-            random.seed(config['SEED'])
-
-        # Initialize grid with all walls closed (value 15)
-        self.grid: List[List[int]] = [
-            [self.ALL_WALLS for _ in range(self.width)]
-            for _ in range(self.height)
-        ]
-        self.visited: Set[Tuple[int, int]] = set()
+    def _pattern_cells(self) -> List[Tuple[int, int]]:
+        """
+        Returns the cells forming the '42' pattern in the center of the
+        maze, or an empty list if the grid is too small to hold it.
+        """
+        return pattern_cells(self.width, self.height)
 
     def _embed_42(self) -> None:
         """
         Reserves cells to form a '42' pattern in the center of the maze.
         Marked cells remain closed. Prints an error if the grid is too small.
         """
-        # The pattern requires at least 7x5, plus a border to remain solvable
-        if self.width < 10 or self.height < 7:
-            print("Error: Maze too small to embed '42' pattern.")
+        with span('embed_42'):
+            cells = self._pattern_cells()
+            if not cells:
+                print("Error: Maze too small to embed '42' pattern.")
+                return
+
+            visited = self.visited
+            for x, y in cells:
+                # Ensure the coordinates stay within bounds just in case
+                if 0 <= x < self.width and 0 <= y < self.height:
+                    visited[y * self.width + x] = 1
+
+    def iter_rows(self) -> Iterator[bytes]:
+        """
+        Yields the finished maze one row of wall values at a time.
+
+        With ALGORITHM=eller the rows are produced while generating, in
+        memory proportional to the width, and ``self.grid`` is left
+        untouched; feed them to ``MazeExporter.export_rows`` to stream
+        a maze of any height. Other algorithms generate the full grid
+        first. Imperfect mode needs the full grid and is not applied to
+        streamed Eller rows.
+        """
+        if self.algorithm == 'eller':
+            cells = self._pattern_cells()
+            if not cells:
+                print("Error: Maze too small to embed '42' pattern.")
+            yield from eller_rows(self.width, self.height, cells, self.rng)
             return
 
-        # Base 0-indexed pattern for '42' (7 cells wide, 5 cells high)
-        base_pattern = [
-            # The '4' shape
-            (0, 0), (0, 1), (0, 2), (1, 2), (2, 0), (2, 1),
-            (2, 2), (2, 3), (2, 4),
-            # The '2' shape
-            (4, 0), (5, 0), (6, 0), (6, 1), (6, 2), (5, 2),
-            (4, 2), (4, 3), (4, 4), (5, 4), (6, 4)
-        ]
-
-        # Calculate offsets to perfectly center the pattern
-        offset_x = (self.width - 7) // 2
-        offset_y = (self.height - 5) // 2
-
-        for dx, dy in base_pattern:
-            x = offset_x + dx
-            y = offset_y + dy
-            # Ensure the coordinates stay within bounds just in case
-            if 0 <= x < self.width and 0 <= y < self.height:
-                self.visited.add((x, y))
+        self.generate()
+        for y in range(self.height):
+            yield self.grid.row_bytes(y)
 
     def generate(self) -> None:
         """
-        Generates the maze layout using an iterative Recursive Backtracker.
+        Generates the maze layout using the configured algorithm and
+        records its throughput in ``self.stats``.
         """
-        self._embed_42()
+        cells = self.width * self.height
+        started = time.perf_counter()
+        with span('carve', cells):
+            self._carve(self)
+        elapsed = time.perf_counter() - started
+
+        self.stats = {
+            'algorithm': self.algorithm,
+            'cells': cells,
+            'seconds': elapsed,
+            'cells_per_second': cells / elapsed if elapsed > 0 else 0.0,
+        }
 
-        start_x, start_y = self.entry
+        # If the maze doesn't need to be perfect, tear down a few extra walls
+        if not self.is_perfect:
+            with span('make_imperfect', cells):
+                self._make_imperfect()
 
-        if (start_x, start_y) in self.visited:
-            start_x, start_y = (0, 0)
-            while (start_x, start_y) in self.visited:
-                start_x += 1
+    def iter_carve(self) -> Iterator[CarveEvent]:
+        """
+        Generates the maze step by step, yielding every wall removal.
 
-        stack: List[Tuple[int, int]] = [(start_x, start_y)]
-        self.visited.add((start_x, start_y))
+        With the Recursive Backtracker the events come lazily from the
+        depth-first search, in carving order. Other algorithms carve the
+        whole grid first and then report its open walls row by row. In
+        imperfect mode the walls opened for loops follow. The grid is
+        updated before each event is yielded.
 
-        # Map directions: (dx, dy, wall_to_remove, opposite_wall_to_remove)
-        directions = [
-            (0, -1, self.WALL_N, self.WALL_S),
-            (1, 0, self.WALL_E, self.WALL_W),
-            (0, 1, self.WALL_S, self.WALL_N),
-            (-1, 0, self.WALL_W, self.WALL_E)
-        ]
+        Yields:
+            (x, y, wall) for each wall removed from cell (x, y).
+        """
+        if self.algorithm == 'backtracker':
+            yield from self._backtracker_steps()
+        else:
+            self._carve(self)
+            yield from self._open_walls()
 
-        while stack:
-            cx, cy = stack[-1]
-            unvisited_neighbors = []
+        if not self.is_perfect:
+            before = bytes(self.grid.cells)
+            self._make_imperfect()
+            yield from self._open_walls(before)
+
+    def _open_walls(
+        self, before: Optional[bytes] = None
+    ) -> Iterator[CarveEvent]:
+        """
+        Yields the east and south walls that are open now but were
+        closed in ``before`` (by default, a grid with every wall closed).
+        """
+        width = self.width
+        closed = bytes([self.ALL_WALLS]) * len(self.grid.cells)
+        for idx, (old, cell) in enumerate(zip(before or closed,
+                                              self.grid.cells)):
+            if old == cell:
+                continue
+            x, y = idx % width, idx // width
+            for wall in (self.WALL_E, self.WALL_S):
+                if old & wall and not cell & wall:
+                    yield x, y, wall
+
+    def _generate_eller(self) -> None:
+        """Fills the grid row by row using Eller's algorithm."""
+        for y, row in enumerate(self.iter_rows()):
+            self.grid.row(y)[:] = row
+
+    def _generate_backtracker(self) -> None:
+        """
+        Generates the maze layout using an iterative Recursive Backtracker.
+        """
+        # Run the step iterator to completion without keeping the events
+        deque(self._backtracker_steps(), maxlen=0)
+
+    def _backtracker_steps(self) -> Iterator[CarveEvent]:
+        """
+        Carves with a depth-first search, yielding each wall removed.
+
+        The search state costs a few bytes per cell: the byte-per-cell
+        ``visited`` map and an ``array('i')`` stack of flat cell
+        indices. Unvisited neighbours are gathered as a 4-bit mask whose
+        candidate directions are looked up in ``_DIRECTION_SETS``, so
+        picking one allocates nothing and draws from the random source
+        exactly like ``choice`` over a list of the same neighbours.
+        """
+        self._embed_42()
+
+        width = self.width
+        size = width * self.height
+        cells = self.grid.cells
+        visited = self.visited
 
-            for dx, dy, wall, opp_wall in directions:
-                nx, ny = cx + dx, cy + dy
+        start = self.entry[1] * width + self.entry[0]
+        if visited[start]:
+            start = visited.find(0)
 
-                # Check grid bounds and if the neighbor is unvisited
-                if 0 <= nx < self.width and 0 <= ny < self.height:
-                    if (nx, ny) not in self.visited:
-                        unvisited_neighbors.append((nx, ny, wall, opp_wall))
+        stack = array('i', [start])
+        visited[start] = 1
 
-            if unvisited_neighbors:
+        # Per direction (N, E, S, W): wall removed, opposite wall, offset
+        walls = (self.WALL_N, self.WALL_E, self.WALL_S, self.WALL_W)
+        opposite = (self.WALL_S, self.WALL_W, self.WALL_N, self.WALL_E)
+        offsets = (-width, 1, width, -1)
+        direction_sets = self._DIRECTION_SETS
+        choice = self.rng.choice
+        last_column = width - 1
+
+        while stack:
+            idx = stack[-1]
+            x = idx % width
+
+            # Bit d is set when the neighbour in direction d is unvisited
+            mask = 0
+            if idx >= width and not visited[idx - width]:
+                mask = 1
+            if x < last_column and not visited[idx + 1]:
+                mask |= 2
+            if idx + width < size and not visited[idx + width]:
+                mask |= 4
+            if x and not visited[idx - 1]:
+                mask |= 8
+
+            if mask:
                 # Randomly choose an available neighbor
-                nx, ny, wall, opp_wall = random.choice(unvisited_neighbors)
+                direction = choice(direction_sets[mask])
+                n_idx = idx + offsets[direction]
 
                 # Tear down the walls between current cell and chosen neighbor
-                self.grid[cy][cx] &= ~wall
-                self.grid[ny][nx] &= ~opp_wall
+                cells[idx] &= ~walls[direction]
+                cells[n_idx] &= ~opposite[direction]
 
-                self.visited.add((nx, ny))
-                stack.append((nx, ny))
+                visited[n_idx] = 1
+                stack.append(n_idx)
+                yield x, idx // width, walls[direction]
             else:
                 # Dead end reached, backtrack
                 stack.pop()
 
-        # If the maze doesn't need to be perfect, tear down a few extra walls
-        if not self.is_perfect:
-            self._make_imperfect()
-
-    def _make_imperfect(self) -> None:
-        """Removes random walls to create loops for an imperfect maze."""
-        loops_to_create = (self.width * self.height) // 20
-        walls = [self.WALL_N, self.WALL_E, self.WALL_S, self.WALL_W]
-
-        for _ in range(loops_to_create):
-            x = random.randint(1, self.width - 2)
-            y = random.randint(1, self.height - 2)
-            if (x, y) not in self.visited:
+    def _make_imperfect(self) -> int:
+        """
+        Opens walls between carved cells to create loops.
+
+        Every closed interior wall between two carved cells is collected
+        once, encoded like Kruskal's edges (``index * 2`` for the east
+        wall, ``index * 2 + 1`` for the south wall). They are then drawn
+        in random order by a partial Fisher-Yates shuffle until
+        ``int(cells * LOOP_DENSITY)`` walls are open, clearing the wall
+        on both sides. A wall whose opening would leave a 3x3 block
+        without inner walls is closed again and skipped; no candidate is
+        drawn twice, so the work is linear in the number of cells.
+
+        Returns:
+            The number of walls opened, lower than requested only when
+            the maze runs out of candidates.
+        """
+        width = self.width
+        size = width * self.height
+        cells = self.grid.cells
+        closed = self.ALL_WALLS
+
+        candidates = array('i')
+        for idx in range(size):
+            cell = cells[idx]
+            if cell == closed:
+                continue
+            if cell & self.WALL_E and idx % width < width - 1 \
+                    and cells[idx + 1] != closed:
+                candidates.append(idx << 1)
+            if cell & self.WALL_S and idx + width < size \
+                    and cells[idx + width] != closed:
+                candidates.append(idx << 1 | 1)
+
+        target = int(size * self.loop_density)
+        opened = 0
+        count = len(candidates)
+        for i in range(count):
+            if opened >= target:
+                break
+            j = self.rng.randrange(i, count)
+            candidates[i], candidates[j] = candidates[j], candidates[i]
+            edge = candidates[i]
+            idx = edge >> 1
+            if edge & 1:
+                other, wall, opp_wall = idx + width, self.WALL_S, self.WALL_N
+            else:
+                other, wall, opp_wall = idx + 1, self.WALL_E, self.WALL_W
+            cells[idx] &= ~wall
+            cells[other] &= ~opp_wall
+            if self._has_open_area(idx, other):
+                # Put the wall back: it would widen a corridor too much
+                cells[idx] |= wall
+                cells[other] |= opp_wall
                 continue
+            opened += 1
+        return opened
 
-            # Randomly remove an internal wall
-            direction = random.choice(walls)
-            self.grid[y][x] &= ~direction
+    def _has_open_area(self, first: int, second: int) -> bool:
+        """
+        Checks whether a 3x3 block of cells containing both neighbouring
+        cells (flat indices, ``first`` above or left of ``second``) has
+        no inner wall left.
+        """
+        width = self.width
+        cells = self.grid.cells
+        x0, y0 = first % width, first // width
+        x1, y1 = second % width, second // width
+        wall_e, wall_s = self.WALL_E, self.WALL_S
+        for by in range(max(0, y1 - 2), min(y0, self.height - 3) + 1):
+            for bx in range(max(0, x1 - 2), min(x0, width - 3) + 1):
+                # Stop at the first inner wall of the block
+                top = by * width + bx
+                if cells[top] & (wall_e | wall_s) \
+                        or cells[top + 1] & (wall_e | wall_s) \
+                        or cells[top + 2] & wall_s \
+                        or cells[top + width] & (wall_e | wall_s) \
+                        or cells[top + width + 1] & (wall_e | wall_s) \
+                        or cells[top + width + 2] & wall_s \
+                        or cells[top + 2 * width] & wall_e \
+                        or cells[top + 2 * width + 1] & wall_e:
+                    continue
+                return True
+        return False
 
     def export_to_file(self, filename: str) -> None:
         """
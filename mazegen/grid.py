@@ -0,0 +1,209 @@
+"""
+Module providing the compact grid type shared by every maze component.
+"""
+
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+class MazeGrid:
+    """
+    A maze grid stored as one flat buffer of wall bitmasks.
+
+    Each cell takes a single byte, rows are laid out one after another
+    and cell (x, y) lives at index ``y * width + x``. Indexing the grid
+    with a row number returns a writable view of that row, so the
+    familiar ``grid[y][x]`` access keeps working.
+    """
+
+    # Wall bitmasks, identical to the ones used by MazeGenerator
+    WALL_N = 1
+    WALL_E = 2
+    WALL_S = 4
+    WALL_W = 8
+    ALL_WALLS = WALL_N | WALL_E | WALL_S | WALL_W
+
+    # Directions: (dx, dy, wall, opposite_wall, direction_char)
+    DIRECTIONS: Tuple[Tuple[int, int, int, int, str], ...] = (
+        (0, -1, WALL_N, WALL_S, 'N'),
+        (1, 0, WALL_E, WALL_W, 'E'),
+        (0, 1, WALL_S, WALL_N, 'S'),
+        (-1, 0, WALL_W, WALL_E, 'W')
+    )
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        fill: int = ALL_WALLS,
+        cells: Optional[Union[bytearray, memoryview]] = None
+    ) -> None:
+        """
+        Initializes the grid, either filled with a value or on a buffer.
+
+        Args:
+            width: Number of cells per row.
+            height: Number of rows.
+            fill: Initial wall value of every cell when no buffer is given.
+            cells: Existing buffer of ``width * height`` bytes to wrap.
+        """
+        if width < 0 or height < 0:
+            raise ValueError("Grid dimensions must not be negative.")
+        if cells is None:
+            cells = bytearray([fill]) * (width * height)
+        elif len(cells) != width * height:
+            raise ValueError(
+                f"Buffer holds {len(cells)} cells, expected "
+                f"{width * height} for a {width}x{height} grid."
+            )
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self._view = memoryview(cells)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[int]]) -> 'MazeGrid':
+        """Builds a grid from a list of rows of wall values."""
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        cells = bytearray()
+        for row in rows:
+            if len(row) != width:
+                raise ValueError("All grid rows must have the same width.")
+            cells.extend(row)
+        return cls(width, height, cells=cells)
+
+    @classmethod
+    def coerce(cls, grid: 'GridLike') -> 'MazeGrid':
+        """Returns ``grid`` as a MazeGrid, converting nested lists."""
+        if isinstance(grid, MazeGrid):
+            return grid
+        return cls.from_rows(grid)
+
+    def index(self, x: int, y: int) -> int:
+        """Returns the flat buffer index of cell (x, y)."""
+        return y * self.width + x
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Checks whether (x, y) lies inside the grid."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x: int, y: int) -> int:
+        """Returns the wall value of cell (x, y)."""
+        return self.cells[y * self.width + x]
+
+    def set(self, x: int, y: int, value: int) -> None:
+        """Sets the wall value of cell (x, y)."""
+        self.cells[y * self.width + x] = value
+
+    def has_wall(self, x: int, y: int, wall: int) -> bool:
+        """Checks whether cell (x, y) has the given wall closed."""
+        return bool(self.cells[y * self.width + x] & wall)
+
+    def remove_wall(self, x: int, y: int, wall: int) -> None:
+        """Opens a wall on both sides, between (x, y) and its neighbour."""
+        self._set_wall(x, y, wall, False)
+
+    def add_wall(self, x: int, y: int, wall: int) -> None:
+        """Closes a wall on both sides, between (x, y) and its neighbour."""
+        self._set_wall(x, y, wall, True)
+
+    def _set_wall(self, x: int, y: int, wall: int, closed: bool) -> None:
+        """Updates one wall and its mirror in the neighbouring cell."""
+        for dx, dy, bit, opp_bit, _ in self.DIRECTIONS:
+            if bit != wall:
+                continue
+            cells = self.cells
+            idx = y * self.width + x
+            cells[idx] = cells[idx] | bit if closed else cells[idx] & ~bit
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                n_idx = ny * self.width + nx
+                cells[n_idx] = (
+                    cells[n_idx] | opp_bit if closed
+                    else cells[n_idx] & ~opp_bit
+                )
+            return
+        raise ValueError(f"Unknown wall value: {wall}")
+
+    def open_neighbors(self, x: int, y: int) -> Iterator[Tuple[int, int, str]]:
+        """Yields (nx, ny, direction_char) for every open side of a cell."""
+        cell = self.cells[y * self.width + x]
+        for dx, dy, wall, _, char in self.DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if not cell & wall and 0 <= nx < self.width \
+                    and 0 <= ny < self.height:
+                yield nx, ny, char
+
+    def row(self, y: int) -> memoryview:
+        """Returns a writable view of row ``y``."""
+        start = y * self.width
+        return self._view[start:start + self.width]
+
+    def row_bytes(self, y: int) -> bytes:
+        """Returns a copy of row ``y`` as bytes."""
+        start = y * self.width
+        return bytes(self._view[start:start + self.width])
+
+    def rows(self) -> Iterator[memoryview]:
+        """Iterates over views of every row, top to bottom."""
+        for y in range(self.height):
+            yield self.row(y)
+
+    def to_rows(self) -> List[List[int]]:
+        """Returns the grid as a list of lists of ints."""
+        return [list(row) for row in self.rows()]
+
+    def copy(self) -> 'MazeGrid':
+        """Returns an independent copy of the grid."""
+        return MazeGrid(self.width, self.height, cells=bytearray(self.cells))
+
+    def release(self) -> None:
+        """
+        Releases the grid's view of its buffer, so that a shared or
+        mapped buffer can be closed. The grid is unusable afterwards.
+        """
+        self._view.release()
+
+    def to_numpy(self) -> Any:
+        """
+        Returns a zero-copy ``(height, width)`` uint8 NumPy view.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        import numpy as np
+        array = np.frombuffer(self.cells, dtype=np.uint8)
+        return array.reshape(self.height, self.width)
+
+    def __getitem__(self, y: int) -> memoryview:
+        """Returns row ``y`` so that ``grid[y][x]`` addresses a cell."""
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("Grid row index out of range.")
+        return self.row(y)
+
+    def __len__(self) -> int:
+        """Returns the number of rows."""
+        return self.height
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """Iterates over the rows."""
+        return self.rows()
+
+    def __eq__(self, other: object) -> bool:
+        """Compares dimensions and cell values."""
+        if not isinstance(other, MazeGrid):
+            return NotImplemented
+        return (
+            self.width == other.width and self.height == other.height
+            and self.cells == other.cells
+        )
+
+    def __repr__(self) -> str:
+        """Returns a short description of the grid."""
+        return f"MazeGrid(width={self.width}, height={self.height})"
+
+
+# Anything the maze components accept as a grid
+GridLike = Union[MazeGrid, Sequence[Sequence[int]]]
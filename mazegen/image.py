@@ -0,0 +1,239 @@
+"""
+Module for rendering mazes to PPM and PNG images.
+
+Images are produced one scanline at a time straight from the grid, so
+memory stays proportional to the image width however tall the maze is.
+The maze is laid out like the terminal canvas: every cell and every
+wall segment between two cells is a block of pixels, ``cell_size``
+pixels across for cells and ``wall_size`` pixels for walls and corner
+posts. PNG files are written with ``zlib`` and ``struct`` only.
+"""
+
+import struct
+import zlib
+from array import array
+from typing import BinaryIO, Dict, Iterator, Tuple
+from .grid import MazeGrid
+
+# Pixel kinds of the canvas and their RGB colours
+OPEN, WALL, PATH, ENTRY, EXIT = range(5)
+COLORS = (
+    (255, 255, 255),  # Open
+    (0, 0, 0),        # Wall
+    (66, 133, 244),   # Path
+    (52, 168, 83),    # Entry
+    (234, 67, 53),    # Exit
+)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Compressed bytes collected before an IDAT chunk is written
+IDAT_SIZE = 1 << 20
+
+# zlib compression level of the PNG image data
+COMPRESS_LEVEL = 6
+
+# Channel tables: pixel kind -> red, green and blue values
+_CHANNELS = [
+    bytes(COLORS[kind][channel] if kind < len(COLORS) else 0
+          for kind in range(256))
+    for channel in range(3)
+]
+
+
+def _wall_table(wall: int) -> bytes:
+    """Maps every wall value to WALL if ``wall`` is closed, else OPEN."""
+    return bytes(WALL if value & wall else OPEN for value in range(256))
+
+
+_KIND_N = _wall_table(MazeGrid.WALL_N)
+_KIND_S = _wall_table(MazeGrid.WALL_S)
+_KIND_E = _wall_table(MazeGrid.WALL_E)
+_KIND_W = _wall_table(MazeGrid.WALL_W)
+
+
+def image_size(
+    width: int, height: int, cell_size: int, wall_size: int
+) -> Tuple[int, int]:
+    """Returns the (width, height) in pixels of a maze image."""
+    return (
+        width * cell_size + (width + 1) * wall_size,
+        height * cell_size + (height + 1) * wall_size
+    )
+
+
+def _path_marks(
+    entry: Tuple[int, int], path: str
+) -> Dict[int, 'array[int]']:
+    """
+    Returns the canvas columns covered by the path in each canvas row:
+    the cells it visits and the open wall segments between them.
+    """
+    marks: Dict[int, 'array[int]'] = {}
+    steps = {'N': (0, -1), 'E': (1, 0), 'S': (0, 1), 'W': (-1, 0)}
+    px, py = entry[0] * 2 + 1, entry[1] * 2 + 1
+    for step in path:
+        dx, dy = steps[step]
+        for _ in range(2):
+            px, py = px + dx, py + dy
+            marks.setdefault(py, array('i')).append(px)
+    return marks
+
+
+def scanlines(
+    grid: MazeGrid,
+    entry: Tuple[int, int],
+    exit_pos: Tuple[int, int],
+    path: str = "",
+    cell_size: int = 4,
+    wall_size: int = 1
+) -> Iterator[bytes]:
+    """
+    Yields the RGB pixel rows of a maze image, top to bottom.
+
+    Each canvas row is expanded to pixels once and then yielded
+    ``cell_size`` or ``wall_size`` times; both the expansion and the
+    colouring run as slice assignments and byte translations.
+
+    Args:
+        grid: The maze grid.
+        entry: (x, y) coordinates of the entry.
+        exit_pos: (x, y) coordinates of the exit.
+        path: The solution to draw, or an empty string for none.
+        cell_size: Pixels across a cell.
+        wall_size: Pixels across a wall.
+
+    Raises:
+        ValueError: If a pixel size is not positive.
+    """
+    if cell_size < 1 or wall_size < 1:
+        raise ValueError("Cell and wall sizes must be positive.")
+    width, height = grid.width, grid.height
+    image_width, _ = image_size(width, height, cell_size, wall_size)
+    period = cell_size + wall_size
+    marks = _path_marks(entry, path)
+    endpoints = {
+        (entry[0] * 2 + 1, entry[1] * 2 + 1): ENTRY,
+        (exit_pos[0] * 2 + 1, exit_pos[1] * 2 + 1): EXIT,
+    }
+    posts = bytes([WALL]) * (width + 1)
+    pixels = bytearray(image_width)
+    rgb = bytearray(3 * image_width)
+
+    for py in range(2 * height + 1):
+        y = py // 2
+        if py % 2 == 0:
+            # Corner posts and the horizontal walls between them
+            if y < height:
+                segments = bytes(grid.row(y)).translate(_KIND_N)
+            else:
+                segments = bytes(grid.row(y - 1)).translate(_KIND_S)
+            line = bytearray(2 * width + 1)
+            line[0::2] = posts
+            line[1::2] = segments
+        else:
+            row = bytes(grid.row(y))
+            line = bytearray(2 * width + 1)
+            line[0::2] = row.translate(_KIND_W) + \
+                row[-1:].translate(_KIND_E)
+        for px in marks.get(py, ()):
+            line[px] = PATH
+        for (px, ey), kind in endpoints.items():
+            if ey == py:
+                line[px] = kind
+
+        # Expand walls to wall_size pixels and cells to cell_size pixels
+        walls, cells = bytes(line[0::2]), bytes(line[1::2])
+        for offset in range(wall_size):
+            pixels[offset::period] = walls
+        for offset in range(cell_size):
+            pixels[wall_size + offset::period] = cells
+        for channel, table in enumerate(_CHANNELS):
+            rgb[channel::3] = pixels.translate(table)
+        scanline = bytes(rgb)
+        for _ in range(cell_size if py % 2 else wall_size):
+            yield scanline
+
+
+def write_ppm(
+    file: BinaryIO,
+    grid: MazeGrid,
+    entry: Tuple[int, int],
+    exit_pos: Tuple[int, int],
+    path: str = "",
+    cell_size: int = 4,
+    wall_size: int = 1
+) -> None:
+    """
+    Streams a maze as a binary PPM (P6) image.
+
+    Args:
+        file: A file object opened in binary write mode.
+        grid: The maze grid.
+        entry: (x, y) coordinates of the entry.
+        exit_pos: (x, y) coordinates of the exit.
+        path: The solution to draw, or an empty string for none.
+        cell_size: Pixels across a cell.
+        wall_size: Pixels across a wall.
+    """
+    lines = scanlines(grid, entry, exit_pos, path, cell_size, wall_size)
+    size = image_size(grid.width, grid.height, cell_size, wall_size)
+    file.write(f"P6\n{size[0]} {size[1]}\n255\n".encode('ascii'))
+    for line in lines:
+        file.write(line)
+
+
+def _write_chunk(file: BinaryIO, kind: bytes, data: bytes) -> None:
+    """Writes one PNG chunk: length, type, data and CRC."""
+    file.write(struct.pack('>I', len(data)))
+    file.write(kind)
+    file.write(data)
+    file.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(kind))))
+
+
+def write_png(
+    file: BinaryIO,
+    grid: MazeGrid,
+    entry: Tuple[int, int],
+    exit_pos: Tuple[int, int],
+    path: str = "",
+    cell_size: int = 4,
+    wall_size: int = 1,
+    level: int = COMPRESS_LEVEL
+) -> None:
+    """
+    Streams a maze as an 8-bit RGB PNG image.
+
+    Scanlines are compressed as they are produced and the compressed
+    stream is cut into IDAT chunks of about ``IDAT_SIZE`` bytes, so
+    neither the bitmap nor the compressed image is held in memory.
+
+    Args:
+        file: A file object opened in binary write mode.
+        grid: The maze grid.
+        entry: (x, y) coordinates of the entry.
+        exit_pos: (x, y) coordinates of the exit.
+        path: The solution to draw, or an empty string for none.
+        cell_size: Pixels across a cell.
+        wall_size: Pixels across a wall.
+        level: zlib compression level, 0 to 9.
+    """
+    lines = scanlines(grid, entry, exit_pos, path, cell_size, wall_size)
+    size = image_size(grid.width, grid.height, cell_size, wall_size)
+    file.write(PNG_SIGNATURE)
+    # Width, height, bit depth 8, colour type 2 (RGB), default
+    # compression and filter, no interlacing
+    _write_chunk(file, b"IHDR", struct.pack('>IIBBBBB', *size, 8, 2, 0, 0, 0))
+
+    compressor = zlib.compressobj(level)
+    pending = bytearray()
+    for line in lines:
+        # Filter type 0: the scanline is stored as is
+        pending += compressor.compress(b"\x00")
+        pending += compressor.compress(line)
+        if len(pending) >= IDAT_SIZE:
+            _write_chunk(file, b"IDAT", bytes(pending))
+            pending.clear()
+    pending += compressor.flush()
+    _write_chunk(file, b"IDAT", bytes(pending))
+    _write_chunk(file, b"IEND", b"")
@@ -0,0 +1,231 @@
+"""
+Module for reading mazes written in the hexadecimal text format.
+"""
+
+import mmap
+from array import array
+from types import TracebackType
+from typing import Optional, Tuple, Type, Union
+from .grid import MazeGrid
+
+# Marker for bytes that are not hexadecimal digits
+_INVALID = 0xFF
+
+
+def _build_decode_table() -> bytes:
+    """Builds a table mapping hex digit characters to wall values."""
+    table = bytearray([_INVALID]) * 256
+    for value, char in enumerate(b"0123456789ABCDEF"):
+        table[char] = value
+    for value, char in enumerate(b"abcdef", start=10):
+        table[char] = value
+    return bytes(table)
+
+
+DECODE_TABLE = _build_decode_table()
+
+
+class MazeLoader:
+    """
+    Reads a maze file back into a grid, entry, exit and path.
+
+    In eager mode (the default) the whole file is read and every row is
+    decoded and validated in bulk. In memory-mapped mode only a row
+    offset index is built when opening; rows are decoded on demand by
+    ``row()`` and ``cell()``, so inspecting a few rows of a huge maze
+    does not decode the rest of it.
+    """
+
+    # Wall bitmasks
+    WALL_N = 1
+    WALL_E = 2
+    WALL_S = 4
+    WALL_W = 8
+
+    def __init__(self, filename: str, use_mmap: bool = False) -> None:
+        """
+        Opens and parses a maze file.
+
+        Args:
+            filename: Path of the maze file to read.
+            use_mmap: Map the file into memory and decode rows lazily.
+
+        Raises:
+            OSError: If the file cannot be opened.
+            ValueError: If the file is not a valid maze.
+        """
+        self.filename = filename
+        self.use_mmap = use_mmap
+        self._grid: Optional[MazeGrid] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._data: Union[bytes, mmap.mmap]
+
+        with open(filename, 'rb') as file:
+            if use_mmap:
+                self._mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                self._data = self._mmap
+            else:
+                self._data = file.read()
+
+        try:
+            self._parse()
+            if not use_mmap:
+                self._grid = self._decode_all()
+        except ValueError:
+            self.close()
+            raise
+
+    @classmethod
+    def load(cls, filename: str) -> 'MazeLoader':
+        """Reads and fully validates a maze file in eager mode."""
+        loader = cls(filename)
+        loader.validate()
+        return loader
+
+    def _parse(self) -> None:
+        """Builds the row offset index and reads entry, exit and path."""
+        data = self._data
+        separator = data.find(b"\n\n")
+        if separator == -1:
+            raise ValueError(
+                "Missing empty line between the grid and the footer."
+            )
+
+        # Row offset index: start of every grid line
+        offsets = array('q')
+        position = 0
+        width = -1
+        while position <= separator:
+            end = data.find(b"\n", position, separator + 1)
+            if width == -1:
+                width = end - position
+            elif end - position != width:
+                raise ValueError(
+                    f"Row {len(offsets)} has {end - position} cells, "
+                    f"expected {width}."
+                )
+            offsets.append(position)
+            position = end + 1
+        if width <= 0:
+            raise ValueError("The maze grid is empty.")
+
+        self.width = width
+        self.height = len(offsets)
+        self._offsets = offsets
+
+        footer = bytes(data[separator + 2:]).split(b"\n")
+        if len(footer) < 3:
+            raise ValueError("Missing entry, exit or path line.")
+        self.entry = self._parse_coord(footer[0], "entry")
+        self.exit = self._parse_coord(footer[1], "exit")
+
+        path = footer[2].rstrip(b"\r")
+        if path.translate(None, b"NESW"):
+            raise ValueError("Path contains characters other than NESW.")
+        self.path = path.decode('ascii')
+
+    def _parse_coord(self, line: bytes, name: str) -> Tuple[int, int]:
+        """Parses an 'x,y' footer line and checks it is inside the grid."""
+        try:
+            x_str, y_str = line.decode('ascii').split(',')
+            x, y = int(x_str), int(y_str)
+        except (UnicodeDecodeError, ValueError):
+            raise ValueError(f"Invalid {name} line: {line!r}") from None
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"The {name} ({x}, {y}) is outside the maze.")
+        return x, y
+
+    def _decode(self, raw: bytes, first_row: int) -> bytes:
+        """Translates hex digits to wall values, rejecting other bytes."""
+        decoded = raw.translate(DECODE_TABLE)
+        bad = decoded.find(_INVALID)
+        if bad != -1:
+            row = first_row + bad // self.width
+            column = bad % self.width
+            raise ValueError(
+                f"Invalid hex digit at row {row}, column {column}."
+            )
+        return decoded
+
+    def _decode_all(self) -> MazeGrid:
+        """Decodes every row at once into a MazeGrid."""
+        end = self._offsets[-1] + self.width
+        raw = bytes(self._data[:end]).replace(b"\n", b"")
+        return MazeGrid(
+            self.width, self.height, cells=bytearray(self._decode(raw, 0))
+        )
+
+    @property
+    def grid(self) -> MazeGrid:
+        """The full grid, decoded on first access in mmap mode."""
+        if self._grid is None:
+            self._grid = self._decode_all()
+        return self._grid
+
+    def row(self, y: int) -> bytes:
+        """
+        Returns the wall values of row ``y``.
+
+        In mmap mode only this row is read from the file and decoded.
+        """
+        if not 0 <= y < self.height:
+            raise IndexError("Maze row index out of range.")
+        if self._grid is not None:
+            return self._grid.row_bytes(y)
+        start = self._offsets[y]
+        return self._decode(bytes(self._data[start:start + self.width]), y)
+
+    def cell(self, x: int, y: int) -> int:
+        """Returns the wall value of cell (x, y)."""
+        if not 0 <= x < self.width:
+            raise IndexError("Maze column index out of range.")
+        return self.row(y)[x]
+
+    def validate(self) -> None:
+        """
+        Checks every hex digit and that the path leads from entry to exit
+        without crossing a wall.
+
+        Raises:
+            ValueError: If the grid or the path is invalid.
+        """
+        grid = self.grid
+        moves = {
+            'N': (0, -1, self.WALL_N),
+            'E': (1, 0, self.WALL_E),
+            'S': (0, 1, self.WALL_S),
+            'W': (-1, 0, self.WALL_W)
+        }
+        x, y = self.entry
+        for step, char in enumerate(self.path):
+            dx, dy, wall = moves[char]
+            if grid.get(x, y) & wall:
+                raise ValueError(
+                    f"Path step {step} crosses a wall at ({x}, {y})."
+                )
+            x, y = x + dx, y + dy
+            if not (0 <= x < self.width and 0 <= y < self.height):
+                raise ValueError(f"Path step {step} leaves the maze.")
+        if self.path and (x, y) != self.exit:
+            raise ValueError(f"Path ends at ({x}, {y}), not at the exit.")
+
+    def close(self) -> None:
+        """Releases the memory map, if any."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'MazeLoader':
+        """Returns the loader for use in a with statement."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        """Closes the loader at the end of a with statement."""
+        self.close()
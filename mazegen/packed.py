@@ -0,0 +1,455 @@
+"""
+Module for the packed binary maze format.
+
+A packed file stores two cells per byte and the path as 2-bit moves,
+about half the size of the hexadecimal text format before compression.
+Rows can optionally be grouped into zlib-compressed chunks whose offsets
+are indexed, so any row is read by decompressing a single chunk.
+
+Layout (little-endian):
+    header      see ``HEADER``: magic, version, flags, dimensions,
+                entry, exit, path length, rows per chunk and the
+                sizes of the two fields below
+    seed        signed integer or UTF-8 text, absent when unseeded
+    algorithm   ASCII name of the generating algorithm, may be empty
+    path        one byte per 4 moves, the first move in the low bits
+    grid        uncompressed: ``height`` rows of ``ceil(width / 2)``
+                bytes, the even column of each pair in the low nibble;
+                compressed: ``chunks + 1`` uint64 offsets relative to
+                the first chunk, followed by the zlib chunks
+"""
+
+import mmap
+import struct
+import zlib
+from types import TracebackType
+from typing import (
+    Any, BinaryIO, Iterator, List, Optional, Tuple, Type, Union
+)
+from .grid import GridLike, MazeGrid
+from .formatters import write_maze, WRITE_BUFFER_SIZE
+from .loader import MazeLoader
+from .profiling import span
+
+MAGIC = b"MZPK"
+VERSION = 1
+
+# magic, version, flags, width, height, entry x/y, exit x/y, path moves,
+# rows per chunk, seed kind, seed size, algorithm size
+HEADER = struct.Struct('<4sBBIIIIIIQIBHB')
+
+# Header flags
+FLAG_COMPRESSED = 1
+
+# Seed kinds
+SEED_NONE = 0
+SEED_INT = 1
+SEED_TEXT = 2
+
+# Uncompressed bytes of grid data per compressed chunk, by default
+CHUNK_SIZE = 1 << 16
+
+# zlib compression level of the row chunks
+COMPRESS_LEVEL = 6
+
+_OFFSET = struct.Struct('<Q')
+
+# Nibble tables: move a wall value to the high nibble and back
+_TO_HIGH = bytes((value & 0x0F) << 4 for value in range(256))
+_LOW = bytes(value & 0x0F for value in range(256))
+_HIGH = bytes(value >> 4 for value in range(256))
+
+# Path tables: NESW to 2-bit codes, codes shifted into place in a byte,
+# and each 2-bit field of a byte back to its move character
+_MOVE_CODES = bytes.maketrans(b"NESW", b"\x00\x01\x02\x03")
+_SHIFTS = (0, 2, 4, 6)
+_SHIFT_TABLES = [
+    bytes((value << shift) & 0xFF for value in range(256))
+    for shift in _SHIFTS
+]
+_MOVE_TABLES = [
+    bytes(b"NESW"[(value >> shift) & 3] for value in range(256))
+    for shift in _SHIFTS
+]
+
+
+def _or_bytes(parts: List[bytes]) -> bytes:
+    """Combines equally long byte strings with a bitwise OR."""
+    size = len(parts[0])
+    combined = 0
+    for part in parts:
+        combined |= int.from_bytes(part, 'little')
+    return combined.to_bytes(size, 'little')
+
+
+def pack_cells(cells: bytes, width: int) -> bytes:
+    """
+    Packs whole rows of wall values two cells per byte.
+
+    An odd-width row ends with a padding nibble, so every row starts on
+    a byte boundary and stays addressable on its own.
+    """
+    if not cells:
+        return b""
+    if width % 2:
+        rows = [cells[i:i + width] for i in range(0, len(cells), width)]
+        rows.append(b"")
+        cells = b"\x00".join(rows)
+    even = cells[0::2].translate(_LOW)
+    odd = cells[1::2].translate(_TO_HIGH)
+    return _or_bytes([even, odd])
+
+
+def unpack_cells(packed: bytes, width: int) -> bytearray:
+    """Inverts ``pack_cells``: returns one byte per cell."""
+    cells = bytearray(2 * len(packed))
+    cells[0::2] = packed.translate(_LOW)
+    cells[1::2] = packed.translate(_HIGH)
+    if width % 2:
+        del cells[width::width + 1]
+    return cells
+
+
+def pack_path(path: str) -> bytes:
+    """
+    Packs a NESW path four moves per byte.
+
+    Raises:
+        ValueError: If the path contains other characters.
+    """
+    moves = path.encode('ascii', 'replace')
+    if moves.translate(None, b"NESW"):
+        raise ValueError("Path contains characters other than NESW.")
+    codes = moves.translate(_MOVE_CODES)
+    codes += b"\x00" * (-len(codes) % 4)
+    if not codes:
+        return b""
+    return _or_bytes([
+        codes[i::4].translate(_SHIFT_TABLES[i]) for i in range(4)
+    ])
+
+
+def unpack_path(packed: bytes, moves: int) -> str:
+    """Inverts ``pack_path`` for a path of ``moves`` moves."""
+    chars = bytearray(4 * len(packed))
+    for i in range(4):
+        chars[i::4] = packed.translate(_MOVE_TABLES[i])
+    return chars[:moves].decode('ascii')
+
+
+def _encode_seed(seed: Any) -> Tuple[int, bytes]:
+    """Returns the seed kind and bytes stored for a SEED value."""
+    if seed is None:
+        return SEED_NONE, b""
+    if isinstance(seed, int) and not isinstance(seed, bool):
+        size = (seed.bit_length() + 8) // 8
+        return SEED_INT, seed.to_bytes(size, 'little', signed=True)
+    return SEED_TEXT, str(seed).encode('utf-8')
+
+
+def _decode_seed(kind: int, raw: bytes) -> Any:
+    """Inverts ``_encode_seed``."""
+    if kind == SEED_NONE:
+        return None
+    if kind == SEED_INT:
+        return int.from_bytes(raw, 'little', signed=True)
+    if kind == SEED_TEXT:
+        return raw.decode('utf-8')
+    raise ValueError(f"Unknown seed kind {kind}.")
+
+
+def write_packed(
+    file: BinaryIO,
+    grid: GridLike,
+    entry: Tuple[int, int],
+    exit_pos: Tuple[int, int],
+    path: str,
+    seed: Any = None,
+    algorithm: str = "",
+    compress: bool = False,
+    rows_per_chunk: Optional[int] = None
+) -> None:
+    """
+    Writes a maze in the packed binary format to a binary file.
+
+    Args:
+        file: A file object opened in binary write mode; it must be
+            seekable when compressing, as the chunk index is filled in
+            once the chunks are written.
+        grid: The maze grid.
+        entry: (x, y) coordinates of the entry.
+        exit_pos: (x, y) coordinates of the exit.
+        path: The solution as a NESW string.
+        seed: SEED the maze was generated with, if any.
+        algorithm: Name of the generating algorithm.
+        compress: Store the rows as zlib-compressed chunks.
+        rows_per_chunk: Rows per compressed chunk; by default a chunk
+            holds about ``CHUNK_SIZE`` bytes of packed rows.
+
+    Raises:
+        ValueError: If the path, seed or chunk size cannot be stored.
+    """
+    grid = MazeGrid.coerce(grid)
+    width, height = grid.width, grid.height
+    row_size = (width + 1) // 2
+    if rows_per_chunk is None:
+        rows_per_chunk = max(1, CHUNK_SIZE // max(1, row_size))
+    elif rows_per_chunk < 1:
+        raise ValueError("rows_per_chunk must be at least 1.")
+    if not compress:
+        rows_per_chunk = 0
+
+    path_bytes = pack_path(path)
+    seed_kind, seed_bytes = _encode_seed(seed)
+    algorithm_bytes = algorithm.encode('ascii')
+    if len(seed_bytes) > 0xFFFF or len(algorithm_bytes) > 0xFF:
+        raise ValueError("Seed or algorithm name is too long to store.")
+    file.write(HEADER.pack(
+        MAGIC, VERSION, FLAG_COMPRESSED if compress else 0,
+        width, height, entry[0], entry[1], exit_pos[0], exit_pos[1],
+        len(path), rows_per_chunk,
+        seed_kind, len(seed_bytes), len(algorithm_bytes)
+    ))
+    file.write(seed_bytes)
+    file.write(algorithm_bytes)
+    file.write(path_bytes)
+
+    cells = grid.cells
+    if not compress:
+        block_rows = max(1, WRITE_BUFFER_SIZE // max(1, width))
+        for y in range(0, height, block_rows):
+            block = cells[y * width:(y + block_rows) * width]
+            file.write(pack_cells(bytes(block), width))
+        return
+
+    # Reserve the index, write the chunks, then fill the index in
+    chunk_count = -(-height // rows_per_chunk)
+    index_at = file.tell()
+    file.write(bytes(_OFFSET.size * (chunk_count + 1)))
+    offsets = [0]
+    for y in range(0, height, rows_per_chunk):
+        block = cells[y * width:(y + rows_per_chunk) * width]
+        chunk = zlib.compress(pack_cells(bytes(block), width), COMPRESS_LEVEL)
+        file.write(chunk)
+        offsets.append(offsets[-1] + len(chunk))
+    end = file.tell()
+    file.seek(index_at)
+    file.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+    file.seek(end)
+
+
+class PackedMazeReader:
+    """
+    Reads a packed maze file.
+
+    The file is memory-mapped and only the header and path are decoded
+    when opening. ``row()`` decodes a single row; in a compressed file it
+    decompresses the one chunk holding the row and keeps it for the next
+    call, so reading rows in order decompresses every chunk once.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        Opens a packed maze file and reads its header.
+
+        Raises:
+            OSError: If the file cannot be opened.
+            ValueError: If the file is not a valid packed maze.
+        """
+        self.filename = filename
+        self._grid: Optional[MazeGrid] = None
+        self._chunk: Tuple[int, bytes] = (-1, b"")
+        self._mmap: Optional[mmap.mmap] = None
+        self._data: Union[bytes, mmap.mmap] = b""
+        with open(filename, 'rb') as file:
+            try:
+                self._mmap = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                self._data = self._mmap
+            except ValueError:
+                pass  # An empty file cannot be mapped
+        try:
+            self._parse()
+        except ValueError:
+            self.close()
+            raise
+
+    def _require(self, end: int) -> None:
+        """Checks that the file holds at least ``end`` bytes."""
+        if end > len(self._data):
+            raise ValueError("The packed maze file is truncated.")
+
+    def _read(self, start: int, size: int) -> bytes:
+        """Returns ``size`` bytes at ``start``, failing if truncated."""
+        self._require(start + size)
+        return bytes(self._data[start:start + size])
+
+    def _parse(self) -> None:
+        """Reads the header, seed, algorithm, path and chunk index."""
+        (
+            magic, version, flags, width, height,
+            entry_x, entry_y, exit_x, exit_y, moves, rows_per_chunk,
+            seed_kind, seed_size, algorithm_size
+        ) = HEADER.unpack(self._read(0, HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("Not a packed maze file.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported packed maze version {version}.")
+        self.width = width
+        self.height = height
+        self.entry = (entry_x, entry_y)
+        self.exit = (exit_x, exit_y)
+        self.compressed = bool(flags & FLAG_COMPRESSED)
+        self.rows_per_chunk = rows_per_chunk
+        if self.compressed and rows_per_chunk < 1:
+            raise ValueError("Compressed file without a chunk size.")
+
+        position = HEADER.size
+        self.seed = _decode_seed(seed_kind, self._read(position, seed_size))
+        position += seed_size
+        self.algorithm = self._read(position, algorithm_size).decode('ascii')
+        position += algorithm_size
+        path_size = -(-moves // 4)
+        self.path = unpack_path(self._read(position, path_size), moves)
+        position += path_size
+
+        self._row_size = (width + 1) // 2
+        if not self.compressed:
+            self._grid_at = position
+            self._require(position + self._row_size * height)
+            return
+        chunk_count = -(-height // rows_per_chunk)
+        index = self._read(position, _OFFSET.size * (chunk_count + 1))
+        self._offsets = [
+            offset for offset, in _OFFSET.iter_unpack(index)
+        ]
+        self._grid_at = position + len(index)
+        self._require(self._grid_at + self._offsets[-1])
+
+    def _chunk_cells(self, chunk: int) -> bytes:
+        """Returns the unpacked cells of a compressed chunk."""
+        if self._chunk[0] != chunk:
+            start = self._grid_at + self._offsets[chunk]
+            end = self._grid_at + self._offsets[chunk + 1]
+            try:
+                packed = zlib.decompress(self._data[start:end])
+            except zlib.error as e:
+                raise ValueError(f"Corrupt chunk {chunk}: {e}") from None
+            rows = min(
+                self.rows_per_chunk, self.height - chunk * self.rows_per_chunk
+            )
+            if len(packed) != rows * self._row_size:
+                raise ValueError(f"Chunk {chunk} has the wrong size.")
+            self._chunk = (chunk, bytes(unpack_cells(packed, self.width)))
+        return self._chunk[1]
+
+    def row(self, y: int) -> bytes:
+        """Returns the wall values of row ``y``, decoding only that row."""
+        if not 0 <= y < self.height:
+            raise IndexError("Maze row index out of range.")
+        if self._grid is not None:
+            return self._grid.row_bytes(y)
+        width = self.width
+        if self.compressed:
+            chunk, first = divmod(y, self.rows_per_chunk)
+            cells = self._chunk_cells(chunk)
+            return cells[first * width:(first + 1) * width]
+        start = self._grid_at + y * self._row_size
+        packed = bytes(self._data[start:start + self._row_size])
+        return bytes(unpack_cells(packed, width)[:width])
+
+    def rows(self) -> Iterator[bytes]:
+        """Yields every row in order."""
+        for y in range(self.height):
+            yield self.row(y)
+
+    def cell(self, x: int, y: int) -> int:
+        """Returns the wall value of cell (x, y)."""
+        if not 0 <= x < self.width:
+            raise IndexError("Maze column index out of range.")
+        return self.row(y)[x]
+
+    @property
+    def grid(self) -> MazeGrid:
+        """The full grid, decoded on first access."""
+        if self._grid is None:
+            width, height = self.width, self.height
+            if self.compressed:
+                cells = bytearray()
+                for chunk in range(len(self._offsets) - 1):
+                    cells += self._chunk_cells(chunk)
+            else:
+                cells = unpack_cells(
+                    self._read(self._grid_at, self._row_size * height),
+                    width
+                )
+            self._grid = MazeGrid(width, height, cells=cells)
+        return self._grid
+
+    def close(self) -> None:
+        """Releases the memory map, if any."""
+        self._data = b""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'PackedMazeReader':
+        """Returns the reader for use in a with statement."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        """Closes the reader at the end of a with statement."""
+        self.close()
+
+
+def is_packed(filename: str) -> bool:
+    """Tells whether a file starts with the packed maze magic."""
+    with open(filename, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def text_to_packed(
+    source: str,
+    target: str,
+    compress: bool = True,
+    rows_per_chunk: Optional[int] = None
+) -> None:
+    """
+    Converts a maze file from the hexadecimal text format.
+
+    Raises:
+        OSError: If a file cannot be read or written.
+        ValueError: If the source is not a valid maze file.
+    """
+    loader = MazeLoader(source)
+    with span('export', loader.width * loader.height):
+        with open(target, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+            write_packed(
+                file, loader.grid, loader.entry, loader.exit, loader.path,
+                compress=compress, rows_per_chunk=rows_per_chunk
+            )
+
+
+def packed_to_text(source: str, target: str) -> None:
+    """
+    Converts a packed maze file to the hexadecimal text format.
+
+    Rows are decoded and written one chunk at a time.
+
+    Raises:
+        OSError: If a file cannot be read or written.
+        ValueError: If the source is not a valid packed maze.
+    """
+    with PackedMazeReader(source) as reader:
+        with span('export', reader.width * reader.height):
+            with open(target, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+                write_maze(
+                    file, reader.rows(), reader.entry, reader.exit,
+                    reader.path
+                )
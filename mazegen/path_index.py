@@ -0,0 +1,219 @@
+"""
+Module for answering many path queries on a single perfect maze.
+"""
+
+from array import array
+from typing import Iterable, List, Optional, Tuple
+from .grid import GridLike, MazeGrid
+
+
+class MazePathIndex:
+    """
+    Precomputed distance and path index for a perfect maze.
+
+    A perfect maze is a spanning tree over its open cells. The index
+    roots that tree once, stores each cell's depth and parent, and adds
+    one skew-binary jump pointer per cell (Myers' jump pointers). The
+    lowest common ancestor of two cells is then found in O(log n) steps
+    with O(n) memory, which gives distances in O(log n) and paths in
+    O(path length) without running a new search per query.
+    """
+
+    # Wall bitmasks
+    WALL_N = 1
+    WALL_E = 2
+    WALL_S = 4
+    WALL_W = 8
+
+    # Directions: (wall_flag, direction_char, opposite_char)
+    DIRECTIONS = (
+        (WALL_N, 'N', 'S'),
+        (WALL_E, 'E', 'W'),
+        (WALL_S, 'S', 'N'),
+        (WALL_W, 'W', 'E')
+    )
+
+    def __init__(
+        self,
+        grid: GridLike,
+        width: int,
+        height: int,
+        root: Tuple[int, int] = (0, 0)
+    ) -> None:
+        """
+        Builds the index by rooting the maze tree at ``root``.
+
+        Args:
+            grid: The maze grid (MazeGrid or list of rows).
+            width: Maze width in cells.
+            height: Maze height in cells.
+            root: (x, y) of the cell used as the tree root.
+
+        Raises:
+            ValueError: If the root is outside the maze or the cells
+                reachable from it contain a loop.
+        """
+        if not (0 <= root[0] < width and 0 <= root[1] < height):
+            raise ValueError(f"Root {root} is outside the maze.")
+        self.grid = MazeGrid.coerce(grid)
+        self.width = width
+        self.height = height
+        self.root = root
+
+        size = width * height
+        # -1 marks cells that are not connected to the root
+        self.depth = array('i', [-1]) * size
+        self.parent = array('i', [-1]) * size
+        self.jump = array('i', [-1]) * size
+        # 1 + index of the direction leading from a cell to its parent
+        self.parent_dir = bytearray(size)
+        self._build(root[1] * width + root[0])
+
+    def _build(self, root: int) -> None:
+        """Runs one BFS from the root, filling depths and jump pointers."""
+        width = self.width
+        size = width * self.height
+        cells = self.grid.cells
+        depth, parent, jump = self.depth, self.parent, self.jump
+        parent_dir = self.parent_dir
+
+        depth[root] = 0
+        parent[root] = root
+        jump[root] = root
+        queue = array('i', [root])
+        head = 0
+
+        while head < len(queue):
+            idx = queue[head]
+            head += 1
+            cell = cells[idx]
+            x = idx % width
+            # (neighbour index, direction back to idx) for open sides
+            candidates: List[Tuple[int, int]] = []
+            if not cell & self.WALL_N and idx >= width:
+                candidates.append((idx - width, 3))
+            if not cell & self.WALL_E and x < width - 1:
+                candidates.append((idx + 1, 4))
+            if not cell & self.WALL_S and idx + width < size:
+                candidates.append((idx + width, 1))
+            if not cell & self.WALL_W and x > 0:
+                candidates.append((idx - 1, 2))
+
+            for n_idx, back in candidates:
+                if depth[n_idx] != -1:
+                    if n_idx != parent[idx]:
+                        raise ValueError(
+                            "Grid is not a perfect maze: it contains a loop."
+                        )
+                    continue
+                depth[n_idx] = depth[idx] + 1
+                parent[n_idx] = idx
+                parent_dir[n_idx] = back
+                # Myers' skew-binary jump pointer
+                p_jump = jump[idx]
+                if depth[idx] - depth[p_jump] == \
+                        depth[p_jump] - depth[jump[p_jump]]:
+                    jump[n_idx] = jump[p_jump]
+                else:
+                    jump[n_idx] = idx
+                queue.append(n_idx)
+
+    def _index(self, pos: Tuple[int, int]) -> int:
+        """Converts (x, y) into a flat index, checking the bounds."""
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"Cell {pos} is outside the maze.")
+        return y * self.width + x
+
+    def _ancestor_at_depth(self, idx: int, target: int) -> int:
+        """Climbs from ``idx`` to its ancestor at depth ``target``."""
+        depth, parent, jump = self.depth, self.parent, self.jump
+        while depth[idx] > target:
+            if depth[jump[idx]] >= target:
+                idx = jump[idx]
+            else:
+                idx = parent[idx]
+        return idx
+
+    def _lca(self, a: int, b: int) -> int:
+        """Returns the lowest common ancestor of two connected cells."""
+        depth, parent, jump = self.depth, self.parent, self.jump
+        if depth[a] > depth[b]:
+            a = self._ancestor_at_depth(a, depth[b])
+        elif depth[b] > depth[a]:
+            b = self._ancestor_at_depth(b, depth[a])
+        while a != b:
+            if jump[a] != jump[b]:
+                a, b = jump[a], jump[b]
+            else:
+                a, b = parent[a], parent[b]
+        return a
+
+    def is_reachable(self, pos: Tuple[int, int]) -> bool:
+        """Checks whether a cell is connected to the root."""
+        return self.depth[self._index(pos)] != -1
+
+    def lca(
+        self, start: Tuple[int, int], goal: Tuple[int, int]
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Returns the lowest common ancestor of two cells.
+
+        Returns:
+            The (x, y) of the ancestor, or None if either cell is not
+            connected to the root.
+        """
+        a, b = self._index(start), self._index(goal)
+        if self.depth[a] == -1 or self.depth[b] == -1:
+            return None
+        ancestor = self._lca(a, b)
+        return ancestor % self.width, ancestor // self.width
+
+    def distance(self, start: Tuple[int, int], goal: Tuple[int, int]) -> int:
+        """
+        Returns the number of steps between two cells.
+
+        Returns:
+            The path length, or -1 if the cells are not connected.
+        """
+        a, b = self._index(start), self._index(goal)
+        depth = self.depth
+        if depth[a] == -1 or depth[b] == -1:
+            return -1
+        return depth[a] + depth[b] - 2 * depth[self._lca(a, b)]
+
+    def distances(
+        self, pairs: Iterable[Tuple[Tuple[int, int], Tuple[int, int]]]
+    ) -> List[int]:
+        """Returns the distance for every (start, goal) pair."""
+        return [self.distance(start, goal) for start, goal in pairs]
+
+    def path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> str:
+        """
+        Returns the direction string leading from start to goal.
+
+        Returns:
+            A string such as 'NNEESW', or an empty string if the cells
+            are identical or not connected.
+        """
+        a, b = self._index(start), self._index(goal)
+        if self.depth[a] == -1 or self.depth[b] == -1:
+            return ""
+        ancestor = self._lca(a, b)
+        parent, parent_dir = self.parent, self.parent_dir
+
+        # Upward half: moves from start towards the ancestor
+        upward: List[str] = []
+        idx = a
+        while idx != ancestor:
+            upward.append(self.DIRECTIONS[parent_dir[idx] - 1][1])
+            idx = parent[idx]
+
+        # Downward half: reverse of the moves from goal to the ancestor
+        downward: List[str] = []
+        idx = b
+        while idx != ancestor:
+            downward.append(self.DIRECTIONS[parent_dir[idx] - 1][2])
+            idx = parent[idx]
+        downward.reverse()
+        return "".join(upward) + "".join(downward)
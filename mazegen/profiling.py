@@ -0,0 +1,201 @@
+"""
+Module for lightweight per-phase instrumentation of maze runs.
+
+Code marks its phases with ``span()``. While no Profiler is running,
+``span()`` returns a shared no-op context manager, so instrumented code
+only pays for one global lookup and one function call per phase.
+"""
+
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import (
+    TYPE_CHECKING, Any, ContextManager, Dict, Iterator, List, Optional
+)
+
+if TYPE_CHECKING:
+    import cProfile
+
+# The running profiler, if any
+_active: Optional['Profiler'] = None
+
+# Returned by span() when profiling is disabled
+_NULL_SPAN: ContextManager[None] = nullcontext()
+
+
+def get_profiler() -> Optional['Profiler']:
+    """Returns the running profiler, or None when profiling is disabled."""
+    return _active
+
+
+def span(name: str, cells: int = 0) -> ContextManager[None]:
+    """
+    Marks a phase of a run.
+
+    Args:
+        name: Phase name, e.g. 'carve' or 'solve'.
+        cells: Number of maze cells the phase processes.
+
+    Returns:
+        A context manager recording the phase in the running profiler,
+        or a no-op one when profiling is disabled.
+    """
+    if _active is None:
+        return _NULL_SPAN
+    return _active.span(name, cells)
+
+
+class Profiler:
+    """
+    Collects phase spans: wall time, cells processed and the net number
+    of memory blocks allocated (``sys.getallocatedblocks``).
+
+    Usage:
+        with Profiler() as profiler:
+            generator.generate()
+        profiler.write_json("profile.json")
+
+    With ``use_cprofile=True`` a cProfile profiler runs alongside the
+    spans and ``write_pstats`` dumps its statistics.
+    """
+
+    def __init__(self, use_cprofile: bool = False) -> None:
+        """
+        Initializes an idle profiler.
+
+        Args:
+            use_cprofile: Also record function level statistics.
+        """
+        self.spans: List[Dict[str, Any]] = []
+        self._depth = 0
+        self._origin = 0.0
+        self._stopped_at: Optional[float] = None
+        self._cprofile: Optional['cProfile.Profile'] = None
+        if use_cprofile:
+            # Imported here: every module imports span(), which must not
+            # pull cProfile into each process start
+            from cProfile import Profile
+            self._cprofile = Profile()
+
+    def start(self) -> None:
+        """
+        Installs this profiler as the running one.
+
+        Raises:
+            RuntimeError: If another profiler is already running.
+        """
+        global _active
+        if _active is not None:
+            raise RuntimeError("Another profiler is already running.")
+        _active = self
+        self._origin = time.perf_counter()
+        self._stopped_at = None
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def stop(self) -> None:
+        """Uninstalls this profiler; spans recorded so far are kept."""
+        global _active
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self._stopped_at = time.perf_counter()
+        if _active is self:
+            _active = None
+
+    def __enter__(self) -> 'Profiler':
+        """Starts profiling for the duration of a with statement."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stops profiling at the end of a with statement."""
+        self.stop()
+
+    @contextmanager
+    def span(self, name: str, cells: int = 0) -> Iterator[None]:
+        """Records one phase; spans may be nested."""
+        record: Dict[str, Any] = {
+            'name': name,
+            'depth': self._depth,
+            'start': 0.0,
+            'seconds': 0.0,
+            'cells': cells,
+            'allocated_blocks': 0,
+        }
+        # Recorded in start order, so a parent comes before its children
+        self.spans.append(record)
+        self._depth += 1
+        blocks = sys.getallocatedblocks()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            ended = time.perf_counter()
+            record['allocated_blocks'] = sys.getallocatedblocks() - blocks
+            record['start'] = round(started - self._origin, 6)
+            record['seconds'] = round(ended - started, 6)
+            self._depth -= 1
+
+    def phases(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregates the spans by name.
+
+        Returns:
+            For each phase: count, total seconds, cells, allocated
+            blocks and cells per second.
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        for record in self.spans:
+            total = totals.setdefault(record['name'], {
+                'count': 0, 'seconds': 0.0, 'cells': 0,
+                'allocated_blocks': 0,
+            })
+            total['count'] += 1
+            total['seconds'] += record['seconds']
+            total['cells'] += record['cells']
+            total['allocated_blocks'] += record['allocated_blocks']
+        for total in totals.values():
+            seconds = total['seconds']
+            total['seconds'] = round(seconds, 6)
+            total['cells_per_second'] = \
+                round(total['cells'] / seconds, 1) if seconds > 0 else 0.0
+        return totals
+
+    def report(self) -> Dict[str, Any]:
+        """Returns the spans and per-phase totals as a JSON-ready dict."""
+        end = self._stopped_at if self._stopped_at is not None \
+            else time.perf_counter()
+        return {
+            'total_seconds': round(end - self._origin, 6),
+            'phases': self.phases(),
+            'spans': self.spans,
+        }
+
+    def summary(self) -> str:
+        """Formats the per-phase totals as a small text table."""
+        lines = [f"{'phase':16} {'count':>6} {'seconds':>10} {'cells':>10}"]
+        for name, total in self.phases().items():
+            lines.append(
+                f"{name:16} {total['count']:6d} "
+                f"{total['seconds']:10.4f} {total['cells']:10d}"
+            )
+        return "\n".join(lines)
+
+    def write_json(self, filename: str) -> None:
+        """Writes ``report()`` to a JSON file."""
+        import json
+
+        with open(filename, 'w', encoding='utf-8') as file:
+            json.dump(self.report(), file, indent=2)
+            file.write("\n")
+
+    def write_pstats(self, filename: str) -> None:
+        """
+        Dumps the cProfile statistics, readable with ``pstats.Stats``.
+
+        Raises:
+            RuntimeError: If the profiler was created without cProfile.
+        """
+        if self._cprofile is None:
+            raise RuntimeError("cProfile was not enabled for this profiler.")
+        self._cprofile.dump_stats(filename)
@@ -0,0 +1,517 @@
+"""
+Local maze service speaking a JSON lines protocol.
+
+Run it with ``python -m mazegen.serve --port 8765`` (localhost TCP) or
+``python -m mazegen.serve --unix /tmp/mazegen.sock``. Every request is
+one JSON object on its own line and gets exactly one JSON line back,
+carrying the same ``id``::
+
+    {"id": 1, "op": "generate", "config": {"WIDTH": 20, "SEED": 4}}
+    {"id": 1, "ok": true, "result": {"width": 20, ..., "rows": [...]}}
+
+Operations:
+    generate: ``config`` -> the maze as hex rows, entry, exit and path.
+    solve: ``maze`` (rows, entry, exit) and optional ``strategy`` ->
+        the shortest path.
+    export: ``config`` and ``output`` -> writes the maze file;
+        ``output`` is a relative name inside the ``--output-dir``.
+    stats: request counters and p50/p99 latencies per operation.
+
+Generation and solving run in a process pool, so the event loop only
+parses requests and writes responses. Identical deterministic requests
+in flight at the same time share one job, and finished seeded mazes
+are kept in a MazeCache.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+)
+from .grid import MazeGrid
+from .generator import MazeGenerator
+from .solver import MazeSolver
+from .formatters import HEX_TABLE, WRITE_BUFFER_SIZE, write_maze
+from .loader import DECODE_TABLE
+from .cache import MazeCache, cache_key
+
+OPERATIONS = ('generate', 'solve', 'export', 'stats')
+
+# Latency samples kept per operation for the percentiles
+LATENCY_WINDOW = 4096
+
+# Longest request line accepted, in bytes
+MAX_LINE = 64 * 1024 * 1024
+
+
+def _config_from_json(data: Any) -> Dict[str, Any]:
+    """
+    Turns a JSON config object into a generator configuration.
+
+    Raises:
+        ValueError: If the config is not an object.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("'config' must be a JSON object.")
+    config: Dict[str, Any] = {}
+    for key, value in data.items():
+        key = str(key).upper()
+        if key in ('ENTRY', 'EXIT'):
+            value = (int(value[0]), int(value[1]))
+        config[key] = value
+    return config
+
+
+def _hex_rows(grid: MazeGrid) -> List[str]:
+    """Encodes every row of a grid as a hex digit string."""
+    encoded = bytes(grid.cells).translate(HEX_TABLE).decode('ascii')
+    width = grid.width
+    return [encoded[i:i + width] for i in range(0, len(encoded), width)]
+
+
+def _grid_from_rows(rows: Any) -> MazeGrid:
+    """
+    Decodes hex digit rows into a grid.
+
+    Raises:
+        ValueError: If the rows are empty, ragged or not hexadecimal.
+    """
+    if not isinstance(rows, list) or not rows:
+        raise ValueError("'rows' must be a non-empty list of hex strings.")
+    width = len(rows[0])
+    if width == 0 or any(len(row) != width for row in rows):
+        raise ValueError("Every row must have the same non-zero length.")
+    raw = "".join(rows).encode('ascii', 'replace').translate(DECODE_TABLE)
+    if raw.find(0xFF) != -1:
+        raise ValueError("Rows contain characters that are not hex digits.")
+    return MazeGrid(width, len(rows), cells=bytearray(raw))
+
+
+def _generate_job(config: Dict[str, Any]) -> Tuple[bytes, str]:
+    """Worker: generates and solves a maze, returns (cells, path)."""
+    generator = MazeGenerator(config)
+    generator.generate()
+    solver = MazeSolver(
+        generator.grid, generator.width, generator.height,
+        generator.entry, generator.exit
+    )
+    return bytes(generator.grid.cells), solver.find_shortest_path()
+
+
+def _solve_job(
+    width: int,
+    height: int,
+    cells: bytes,
+    entry: Tuple[int, int],
+    exit_pos: Tuple[int, int],
+    strategy: str
+) -> str:
+    """Worker: solves a maze given as raw cells."""
+    grid = MazeGrid(width, height, cells=bytearray(cells))
+    solver = MazeSolver(grid, width, height, entry, exit_pos, strategy)
+    return solver.find_shortest_path()
+
+
+def _write_job(
+    filename: str,
+    width: int,
+    height: int,
+    cells: bytes,
+    entry: Tuple[int, int],
+    exit_pos: Tuple[int, int],
+    path: str
+) -> None:
+    """Worker: writes a maze file, raising OSError on failure."""
+    grid = MazeGrid(width, height, cells=bytearray(cells))
+    with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as file:
+        write_maze(file, grid, entry, exit_pos, path)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of sorted samples."""
+    if not samples:
+        return 0.0
+    rank = max(0, min(len(samples) - 1, round(fraction * len(samples)) - 1))
+    return samples[rank]
+
+
+class MazeServer:
+    """
+    Serves maze requests from a process pool.
+
+    Backpressure works at two levels: each connection stops reading new
+    lines while ``per_connection`` of its requests are unanswered, which
+    in turn fills the client's socket buffers, and at most
+    ``max_pending`` jobs are handed to the pool at once; further jobs
+    wait on the event loop without blocking it.
+    """
+
+    def __init__(
+        self,
+        jobs: Optional[int] = None,
+        max_pending: int = 64,
+        per_connection: int = 16,
+        cache_size: int = 128,
+        output_dir: str = "."
+    ) -> None:
+        """
+        Initializes the server and its worker pool.
+
+        Args:
+            jobs: Worker processes (defaults to the CPU count).
+            max_pending: Jobs submitted to the pool at the same time.
+            per_connection: Unanswered requests allowed per connection.
+            cache_size: Seeded mazes kept in memory.
+            output_dir: Directory 'export' requests write into.
+
+        Raises:
+            ValueError: If a limit is lower than 1.
+        """
+        if max_pending < 1 or per_connection < 1:
+            raise ValueError("Request limits must be at least 1.")
+        self.jobs = jobs or os.cpu_count() or 1
+        self.per_connection = per_connection
+        self.output_dir = os.path.realpath(output_dir)
+        self.cache = MazeCache(max_entries=cache_size)
+        self._pool = ProcessPoolExecutor(max_workers=self.jobs)
+        self._slots = asyncio.Semaphore(max_pending)
+        self._in_flight: Dict[Tuple[str, str], 'asyncio.Future[Any]'] = {}
+        self._latencies: Dict[str, Deque[float]] = {
+            op: deque(maxlen=LATENCY_WINDOW) for op in OPERATIONS
+        }
+        self.counters: Dict[str, int] = {
+            'requests': 0, 'errors': 0, 'coalesced': 0, 'cache_hits': 0,
+            'connections': 0,
+        }
+        self._handlers: Dict[
+            str, Callable[[Dict[str, Any]], Awaitable[Any]]
+        ] = {
+            'generate': self._generate,
+            'solve': self._solve,
+            'export': self._export,
+            'stats': self._stats,
+        }
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Runs a function in the pool once a pending slot is free."""
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, func, *args)
+
+    async def _coalesced(
+        self,
+        key: Optional[Tuple[str, str]],
+        make: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Awaits ``make()``, sharing it with identical in-flight requests.
+
+        Args:
+            key: Identifies the work; None disables sharing.
+            make: Starts the work.
+        """
+        if key is None:
+            return await make()
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.counters['coalesced'] += 1
+            return await asyncio.shield(future)
+        future = asyncio.ensure_future(make())
+        self._in_flight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def _maze(
+        self, config: Dict[str, Any]
+    ) -> Tuple[MazeGenerator, str]:
+        """Returns a generated and solved maze, cached when seeded."""
+        generator = MazeGenerator(config)
+        cached = self.cache.get(config)
+        if cached is not None:
+            self.counters['cache_hits'] += 1
+            generator.grid, path = cached
+            return generator, path
+
+        key = cache_key(config)
+        request_key = None if key is None else ('maze', repr(key))
+        cells, path = await self._coalesced(
+            request_key, lambda: self._run(_generate_job, config)
+        )
+        generator.grid = MazeGrid(
+            generator.width, generator.height, cells=bytearray(cells)
+        )
+        self.cache.put(config, generator.grid, path)
+        return generator, path
+
+    async def _generate(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handles 'generate'."""
+        generator, path = await self._maze(
+            _config_from_json(request.get('config', {}))
+        )
+        return {
+            'width': generator.width,
+            'height': generator.height,
+            'entry': list(generator.entry),
+            'exit': list(generator.exit),
+            'rows': _hex_rows(generator.grid),
+            'path': path,
+        }
+
+    async def _solve(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handles 'solve'."""
+        maze = request.get('maze')
+        if not isinstance(maze, dict):
+            raise ValueError("'maze' must be a JSON object.")
+        grid = _grid_from_rows(maze.get('rows'))
+        entry = tuple(maze.get('entry', (0, 0)))
+        default_exit = (grid.width - 1, grid.height - 1)
+        exit_pos = tuple(maze.get('exit', default_exit))
+        strategy = str(request.get('strategy', 'bfs'))
+        if strategy not in MazeSolver.STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'.")
+        args = (
+            grid.width, grid.height, bytes(grid.cells),
+            (int(entry[0]), int(entry[1])),
+            (int(exit_pos[0]), int(exit_pos[1])), strategy
+        )
+        key = ('solve', repr(args))
+        path = await self._coalesced(
+            key, lambda: self._run(_solve_job, *args)
+        )
+        return {'path': path}
+
+    def _output_path(self, output: Any) -> str:
+        """
+        Resolves a client's output name inside ``output_dir``.
+
+        Raises:
+            ValueError: If the name is not a relative path, or resolves
+                (through ``..`` or symbolic links) outside the directory.
+        """
+        if not isinstance(output, str) or not output:
+            raise ValueError("'output' must be a file name.")
+        if os.path.isabs(output):
+            raise ValueError("'output' must be a relative path.")
+        target = os.path.realpath(os.path.join(self.output_dir, output))
+        if target == self.output_dir or os.path.commonpath(
+                (self.output_dir, target)) != self.output_dir:
+            raise ValueError(
+                f"'output' must stay inside the output directory: {output}"
+            )
+        return target
+
+    async def _export(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handles 'export'."""
+        output = request.get('output')
+        target = self._output_path(output)
+        generator, path = await self._maze(
+            _config_from_json(request.get('config', {}))
+        )
+        await self._run(
+            _write_job, target, generator.width, generator.height,
+            bytes(generator.grid.cells), generator.entry, generator.exit,
+            path
+        )
+        return {'file': output, 'path_length': len(path)}
+
+    async def _stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handles 'stats'."""
+        return self.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the counters and, per operation, the number of recent
+        requests with their p50 and p99 latencies in milliseconds.
+        """
+        latency: Dict[str, Dict[str, float]] = {}
+        for op, samples in self._latencies.items():
+            ordered = sorted(samples)
+            latency[op] = {
+                'count': len(ordered),
+                'p50_ms': round(_percentile(ordered, 0.50) * 1000, 3),
+                'p99_ms': round(_percentile(ordered, 0.99) * 1000, 3),
+            }
+        return dict(
+            self.counters,
+            in_flight=len(self._in_flight),
+            jobs=self.jobs,
+            latency=latency,
+        )
+
+    async def dispatch(self, line: bytes) -> Dict[str, Any]:
+        """
+        Answers one request line.
+
+        Returns:
+            The response object; failures are reported in it, never
+            raised.
+        """
+        started = time.perf_counter()
+        self.counters['requests'] += 1
+        request_id: Any = None
+        op = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("A request must be a JSON object.")
+            request_id = request.get('id')
+            op = request.get('op')
+            handler = self._handlers.get(str(op))
+            if handler is None:
+                raise ValueError(
+                    f"Unknown op '{op}'. "
+                    f"Expected one of: {', '.join(OPERATIONS)}."
+                )
+            response = {
+                'id': request_id, 'ok': True,
+                'result': await handler(request),
+            }
+        except Exception as e:
+            # A bad request must never take the service down
+            self.counters['errors'] += 1
+            response = {'id': request_id, 'ok': False, 'error': str(e)}
+        if op in self._latencies:
+            self._latencies[str(op)].append(time.perf_counter() - started)
+        return response
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serves one client until it disconnects."""
+        self.counters['connections'] += 1
+        slots = asyncio.Semaphore(self.per_connection)
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line: bytes) -> None:
+            try:
+                response = await self.dispatch(line)
+                data = json.dumps(response).encode() + b"\n"
+                async with write_lock:
+                    writer.write(data)
+                    await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                slots.release()
+
+        try:
+            while True:
+                # Stop reading while too many requests are unanswered
+                await slots.acquire()
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):
+                    slots.release()
+                    break
+                if not line:
+                    slots.release()
+                    break
+                if not line.strip():
+                    slots.release()
+                    continue
+                task = asyncio.ensure_future(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start_tcp(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> asyncio.Server:
+        """Listens on a TCP port; port 0 picks a free one."""
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_LINE
+        )
+
+    async def start_unix(self, path: str) -> asyncio.Server:
+        """Listens on a Unix domain socket."""
+        return await asyncio.start_unix_server(
+            self.handle_connection, path, limit=MAX_LINE
+        )
+
+    def close(self) -> None:
+        """Shuts the worker pool down."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parses the service command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m mazegen.serve",
+        description="Serve maze generation over a JSON lines socket."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--unix", metavar="PATH",
+        help="listen on a Unix socket instead of TCP"
+    )
+    parser.add_argument(
+        "--jobs", type=int, metavar="K",
+        help="worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--max-pending", type=int, default=64, metavar="N",
+        help="jobs handed to the pool at once (default: 64)"
+    )
+    parser.add_argument(
+        "--per-connection", type=int, default=16, metavar="N",
+        help="unanswered requests per connection (default: 16)"
+    )
+    parser.add_argument(
+        "--output-dir", default=".", metavar="DIR",
+        help="directory 'export' requests write into (default: current "
+             "directory)"
+    )
+    return parser.parse_args(argv)
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Runs the service until it is cancelled."""
+    server = MazeServer(
+        args.jobs, args.max_pending, args.per_connection,
+        output_dir=args.output_dir
+    )
+    try:
+        if args.unix:
+            listener = await server.start_unix(args.unix)
+            print(f"Serving mazes on unix:{args.unix}")
+        else:
+            listener = await server.start_tcp(args.host, args.port)
+            print(f"Serving mazes on {args.host}:{args.port}")
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point of ``python -m mazegen.serve``."""
+    args = parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("Maze service stopped.")
+    except OSError as e:
+        print(f"Error: Could not start the maze service. Details: {e}")
+
+
+if __name__ == "__main__":
+    main()
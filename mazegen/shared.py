@@ -0,0 +1,197 @@
+"""
+Module for handing one maze to several processes through shared memory.
+
+The owner copies the grid once into a ``multiprocessing.shared_memory``
+block and sends workers a small picklable handle instead of the grid.
+Workers attach to the block read-only: the solver, the exporter and
+the validator all run straight on the shared buffer, without a copy.
+
+    with SharedMaze.from_generator(generator) as shared:
+        results = executor.map(solve, [shared.handle] * jobs)
+
+    def solve(handle: SharedMazeHandle) -> str:
+        with handle.attach() as maze:
+            return maze.solver().find_shortest_path()
+"""
+
+from multiprocessing import shared_memory
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Type
+from .grid import GridLike, MazeGrid
+from .formatters import MazeExporter
+from .solver import MazeSolver
+from .tiled import _buffer
+
+if TYPE_CHECKING:
+    from .generator import MazeGenerator
+    from .validate import ValidationReport
+
+
+class SharedMazeHandle:
+    """
+    Picklable reference to a maze published in shared memory: the name
+    of the block, the dimensions, the entry and the exit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        width: int,
+        height: int,
+        entry: Tuple[int, int],
+        exit_pos: Tuple[int, int]
+    ) -> None:
+        """Initializes the handle; see ``SharedMaze`` to create one."""
+        self.name = name
+        self.width = width
+        self.height = height
+        self.entry = entry
+        self.exit_pos = exit_pos
+
+    def attach(self) -> 'SharedMazeView':
+        """
+        Opens the shared block read-only.
+
+        Returns:
+            A view to use as a context manager, closing the block on
+            exit.
+
+        Raises:
+            FileNotFoundError: If the block no longer exists.
+        """
+        return SharedMazeView(self)
+
+    def __repr__(self) -> str:
+        """Returns a short description of the handle."""
+        return (
+            f"SharedMazeHandle({self.name!r}, {self.width}x{self.height}, "
+            f"entry={self.entry}, exit={self.exit_pos})"
+        )
+
+
+class SharedMazeView:
+    """
+    A worker's read-only attachment to a shared maze.
+
+    ``grid`` wraps the shared buffer itself, so writing to it raises
+    TypeError. Views taken from the grid (``grid.row(y)``) must not
+    outlive the attachment.
+    """
+
+    def __init__(self, handle: SharedMazeHandle) -> None:
+        """Attaches to the block named by ``handle``."""
+        self.handle = handle
+        self.width = handle.width
+        self.height = handle.height
+        self.entry = handle.entry
+        self.exit_pos = handle.exit_pos
+        self._block = shared_memory.SharedMemory(name=handle.name)
+        size = handle.width * handle.height
+        self._cells = _buffer(self._block)[:size].toreadonly()
+        self.grid = MazeGrid(handle.width, handle.height, cells=self._cells)
+
+    def solver(self, strategy: str = 'bfs') -> MazeSolver:
+        """Returns a solver working on the shared grid."""
+        return MazeSolver(
+            self.grid, self.width, self.height, self.entry, self.exit_pos,
+            strategy
+        )
+
+    def exporter(self, path: str = "") -> MazeExporter:
+        """Returns an exporter writing the shared grid."""
+        return MazeExporter(self.grid, self.entry, self.exit_pos, path)
+
+    def validate(
+        self, path: Optional[str] = None, backend: str = 'auto'
+    ) -> 'ValidationReport':
+        """Validates the shared grid; see ``validate_maze``."""
+        from .validate import validate_maze
+
+        return validate_maze(
+            self.grid, self.entry, self.exit_pos, path, backend=backend
+        )
+
+    def close(self) -> None:
+        """Releases the grid's views and detaches from the block."""
+        self.grid.release()
+        self._cells.release()
+        self._block.close()
+
+    def __enter__(self) -> 'SharedMazeView':
+        """Returns the view itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        """Detaches from the block."""
+        self.close()
+
+
+class SharedMaze:
+    """
+    Owner of a maze published in shared memory.
+
+    The grid is copied into a new block once; ``handle`` is what gets
+    sent to the workers. Closing the owner (or leaving its ``with``
+    block) frees the memory, so workers must be done by then.
+    """
+
+    def __init__(
+        self,
+        grid: GridLike,
+        entry: Tuple[int, int],
+        exit_pos: Tuple[int, int]
+    ) -> None:
+        """
+        Publishes a copy of the grid in a new shared memory block.
+
+        Args:
+            grid: The maze grid (MazeGrid or list of rows).
+            entry: (x, y) coordinates of the entry.
+            exit_pos: (x, y) coordinates of the exit.
+        """
+        maze = MazeGrid.coerce(grid)
+        size = maze.width * maze.height
+        # A block cannot be empty
+        self._block = shared_memory.SharedMemory(
+            create=True, size=max(1, size)
+        )
+        _buffer(self._block)[:size] = maze.cells
+        self.handle = SharedMazeHandle(
+            self._block.name, maze.width, maze.height, entry, exit_pos
+        )
+
+    @classmethod
+    def from_generator(cls, generator: 'MazeGenerator') -> 'SharedMaze':
+        """Publishes the maze of a generator."""
+        return cls(generator.grid, generator.entry, generator.exit)
+
+    def close(self) -> None:
+        """Frees the shared block; later attachments fail."""
+        if self._block.buf is None:
+            return
+        self._block.close()
+        self._block.unlink()
+
+    def __enter__(self) -> 'SharedMaze':
+        """Returns the owner itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        """Frees the shared block."""
+        self.close()
+
+    def __reduce__(self) -> Any:
+        """Refuses pickling: workers should receive ``handle``."""
+        raise TypeError(
+            "SharedMaze owns its block; send SharedMaze.handle to workers."
+        )
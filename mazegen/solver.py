@@ -2,8 +2,11 @@
 Module for solving mazes and finding the shortest path.
 """
 
-from typing import List, Tuple
-from collections import deque
+import heapq
+from array import array
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+from .grid import GridLike, MazeGrid
+from .profiling import span
 
 
 class MazeSolver:
@@ -15,59 +18,716 @@ class MazeSolver:
     WALL_S = 4
     WALL_W = 8
 
+    # Supported search strategies
+    STRATEGIES = ('bfs', 'bidirectional', 'astar', 'frontier')
+
+    # Frontier size below which the 'frontier' strategy expands cells
+    # one by one rather than with array operations
+    SMALL_FRONTIER = 64
+
+    # Directions: (wall_flag, direction_char, opposite_char)
+    DIRECTIONS = (
+        (WALL_N, 'N', 'S'),
+        (WALL_E, 'E', 'W'),
+        (WALL_S, 'S', 'N'),
+        (WALL_W, 'W', 'E')
+    )
+
     def __init__(
         self,
-        grid: List[List[int]],
+        grid: GridLike,
         width: int,
         height: int,
         entry: Tuple[int, int],
-        exit_pos: Tuple[int, int]
+        exit_pos: Tuple[int, int],
+        strategy: str = 'bfs'
     ) -> None:
-        """Initializes the solver with grid and coordinate data."""
-        self.grid = grid
+        """
+        Initializes the solver with grid and coordinate data.
+
+        Args:
+            grid: The maze grid (MazeGrid or list of rows).
+            width: Maze width in cells.
+            height: Maze height in cells.
+            entry: (x, y) coordinates of the entry.
+            exit_pos: (x, y) coordinates of the exit.
+            strategy: One of 'bfs', 'bidirectional', 'astar' or
+                'frontier' (NumPy whole-frontier BFS, plain BFS when
+                NumPy is not installed).
+        """
+        self._check_strategy(strategy)
+        self.grid = MazeGrid.coerce(grid)
         self.width = width
         self.height = height
         self.entry = entry
         self.exit_pos = exit_pos
+        self.strategy = strategy
 
-    def find_shortest_path(self) -> str:
+    def _check_strategy(self, strategy: str) -> None:
+        """Raises a ValueError for unknown strategy names."""
+        if strategy not in self.STRATEGIES:
+            raise ValueError(
+                f"Unknown solver strategy '{strategy}'. "
+                f"Expected one of: {', '.join(self.STRATEGIES)}."
+            )
+
+    def find_shortest_path(self, strategy: Optional[str] = None) -> str:
         """
-        Finds the shortest path from entry to exit using BFS.
+        Finds the shortest path from entry to exit.
+
+        Args:
+            strategy: Overrides the strategy given at construction.
 
         Returns:
-            A string of directions (e.g., 'NNEESW').
+            A string of directions (e.g., 'NNEESW'), or an empty string
+            if no path exists.
+        """
+        strategy = strategy or self.strategy
+        self._check_strategy(strategy)
+
+        if not (self._in_bounds(self.entry)
+                and self._in_bounds(self.exit_pos)):
+            return ""
+        start = self.entry[1] * self.width + self.entry[0]
+        goal = self.exit_pos[1] * self.width + self.exit_pos[0]
+        if start == goal:
+            return ""
+
+        with span('solve', self.width * self.height):
+            if strategy == 'bidirectional':
+                return self._bidirectional(start, goal)
+            if strategy == 'astar':
+                return self._astar(start, goal)
+            if strategy == 'frontier':
+                return self._frontier(start, goal)
+            return self._bfs(start, goal)
+
+    def _in_bounds(self, pos: Tuple[int, int]) -> bool:
+        """Checks whether a coordinate lies inside the maze."""
+        return 0 <= pos[0] < self.width and 0 <= pos[1] < self.height
+
+    def _neighbors(self, idx: int) -> Iterator[Tuple[int, int]]:
         """
-        # Queue stores tuples of (current_x, current_y, path_string)
-        queue: deque[Tuple[int, int, str]] = deque([
-            (self.entry[0], self.entry[1], "")
-        ])
-        visited = {self.entry}
+        Yields (neighbor_index, direction_index) for every open side.
 
-        # Directions: (dx, dy, wall_flag, direction_char)
-        directions = [
-            (0, -1, self.WALL_N, 'N'),
-            (1, 0, self.WALL_E, 'E'),
-            (0, 1, self.WALL_S, 'S'),
-            (-1, 0, self.WALL_W, 'W')
-        ]
+        Directions are visited in N, E, S, W order.
+        """
+        width = self.width
+        cell = self.grid.cells[idx]
+        x = idx % width
+        if not cell & self.WALL_N and idx >= width:
+            yield idx - width, 0
+        if not cell & self.WALL_E and x < width - 1:
+            yield idx + 1, 1
+        if not cell & self.WALL_S and idx + width < width * self.height:
+            yield idx + width, 2
+        if not cell & self.WALL_W and x > 0:
+            yield idx - 1, 3
 
-        while queue:
-            cx, cy, path = queue.popleft()
+    def _incoming(self, idx: int) -> Iterator[Tuple[int, int]]:
+        """
+        Yields (neighbor_index, direction_index) for every neighbour that
+        can step into ``idx``, the direction pointing from ``idx`` to it.
+        """
+        width = self.width
+        cells = self.grid.cells
+        x = idx % width
+        if idx >= width and not cells[idx - width] & self.WALL_S:
+            yield idx - width, 0
+        if x < width - 1 and not cells[idx + 1] & self.WALL_W:
+            yield idx + 1, 1
+        if idx + width < width * self.height \
+                and not cells[idx + width] & self.WALL_N:
+            yield idx + width, 2
+        if x > 0 and not cells[idx - 1] & self.WALL_E:
+            yield idx - 1, 3
 
-            if (cx, cy) == self.exit_pos:
-                return path
+    def _walk_back(self, came_from: bytearray, start: int, goal: int) -> str:
+        """
+        Rebuilds the path by following parent directions from the goal.
 
-            current_cell = self.grid[cy][cx]
+        ``came_from`` holds, for every reached cell, 1 + the index of the
+        direction used to enter it.
+        """
+        width = self.width
+        offsets = (-width, 1, width, -1)
+        chars: List[str] = []
+        idx = goal
+        while idx != start:
+            direction = came_from[idx] - 1
+            chars.append(self.DIRECTIONS[direction][1])
+            idx -= offsets[direction]
+        chars.reverse()
+        return "".join(chars)
 
-            for dx, dy, wall, char in directions:
-                nx, ny = cx + dx, cy + dy
+    def _bfs(self, start: int, goal: int) -> str:
+        """Breadth-first search storing one parent direction per cell."""
+        came_from = bytearray(self.width * self.height)
+        came_from[start] = 1  # Any non-zero value marks it as reached
+        queue = array('i', [start])
+        head = 0
+        neighbors = self._neighbors
 
-                # Check grid bounds
-                if 0 <= nx < self.width and 0 <= ny < self.height:
-                    # Check if the wall in this direction is open (bit is 0)
-                    if (current_cell & wall) == 0:
-                        if (nx, ny) not in visited:
-                            visited.add((nx, ny))
-                            queue.append((nx, ny, path + char))
+        while head < len(queue):
+            idx = queue[head]
+            head += 1
+            for n_idx, direction in neighbors(idx):
+                if not came_from[n_idx]:
+                    came_from[n_idx] = direction + 1
+                    if n_idx == goal:
+                        return self._walk_back(came_from, start, goal)
+                    queue.append(n_idx)
 
         return ""  # Return an empty string if no path is found
+
+    def _frontier(self, start: int, goal: int) -> str:
+        """
+        Breadth-first search expanding the whole frontier at once with
+        NumPy, then reading the path back down the distance field.
+
+        The frontier is kept as an array of flat cell indices; each
+        level tests the four wall bits of every frontier cell in one
+        vectorized step, so the Python work per level is constant and
+        the total array work stays proportional to the reached cells.
+        Falls back to ``_bfs`` when NumPy is not installed.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return self._bfs(start, goal)
+
+        width = self.width
+        size = width * self.height
+        cells = np.frombuffer(self.grid.cells, dtype=np.uint8)
+        # Open sides of every cell, minus the ones leaving the maze
+        open_grid = (~cells & 15).reshape(self.height, width)
+        open_grid[0] &= 15 ^ self.WALL_N
+        open_grid[-1] &= 15 ^ self.WALL_S
+        open_grid[:, -1] &= 15 ^ self.WALL_E
+        open_grid[:, 0] &= 15 ^ self.WALL_W
+        open_sides = open_grid.ravel()
+        steps = (
+            (self.WALL_N, -width), (self.WALL_E, 1),
+            (self.WALL_S, width), (self.WALL_W, -1)
+        )
+
+        wide = size >= 2 ** 31
+        dtype = np.int64 if wide else np.int32
+        dist = np.full(size, -1, dtype=dtype)
+        dist[start] = 0
+        side_bytes = open_sides.tobytes()
+        frontier: Any = [start]
+        level = 0
+        while len(frontier) and dist[goal] < 0:
+            level += 1
+            if len(frontier) <= self.SMALL_FRONTIER:
+                # Too few cells to pay for the array calls of a level:
+                # long corridors are walked cell by cell instead
+                if not isinstance(frontier, list):
+                    frontier = frontier.tolist()
+                reached = []
+                for idx in frontier:
+                    bits = side_bytes[idx]
+                    for wall, offset in steps:
+                        if bits & wall and dist[idx + offset] < 0:
+                            dist[idx + offset] = level
+                            reached.append(idx + offset)
+                frontier = reached
+                continue
+
+            frontier = np.asarray(frontier, dtype=dtype)
+            sides = open_sides[frontier]
+            moves = np.concatenate([
+                frontier[(sides & wall) != 0] + offset
+                for wall, offset in steps
+            ])
+            moves = moves[dist[moves] < 0]
+            # A cell reached from two frontier cells is kept once
+            dist[moves] = level
+            frontier = np.unique(moves)
+
+        if dist[goal] < 0:
+            return ""
+        field = array('q' if wide else 'i')
+        field.frombytes(dist.tobytes())
+        return self._ascend(field, goal)
+
+    def distances(
+        self,
+        source: Optional[Tuple[int, int]] = None,
+        degrees: Optional[bytearray] = None
+    ) -> 'array[int]':
+        """
+        Runs a full breadth-first search and returns its distance field.
+
+        Args:
+            source: (x, y) of the cell the search starts from, the entry
+                by default.
+            degrees: Optional buffer of ``width * height`` bytes that
+                receives the number of open passages of every reached
+                cell, counted in the same pass.
+
+        Returns:
+            The distance of every cell from ``source``, in row-major
+            order, or -1 for cells that cannot be reached.
+
+        Raises:
+            ValueError: If the source is outside the maze.
+        """
+        source = source or self.entry
+        if not self._in_bounds(source):
+            raise ValueError(f"Source {source} is outside the maze.")
+        width = self.width
+        size = width * self.height
+        start = source[1] * width + source[0]
+        dist = array('i', [-1]) * size
+        dist[start] = 0
+        queue = array('i', [start])
+        append = queue.append
+        cells = self.grid.cells
+        head = 0
+
+        # The neighbour tests of _neighbors, inlined: this loop visits
+        # every reachable cell, so it dominates the analysis time
+        while head < len(queue):
+            idx = queue[head]
+            head += 1
+            cell = cells[idx]
+            n_dist = dist[idx] + 1
+            count = 0
+            if not cell & self.WALL_N and idx >= width:
+                count += 1
+                if dist[idx - width] == -1:
+                    dist[idx - width] = n_dist
+                    append(idx - width)
+            if not cell & self.WALL_E and idx % width < width - 1:
+                count += 1
+                if dist[idx + 1] == -1:
+                    dist[idx + 1] = n_dist
+                    append(idx + 1)
+            if not cell & self.WALL_S and idx + width < size:
+                count += 1
+                if dist[idx + width] == -1:
+                    dist[idx + width] = n_dist
+                    append(idx + width)
+            if not cell & self.WALL_W and idx % width:
+                count += 1
+                if dist[idx - 1] == -1:
+                    dist[idx - 1] = n_dist
+                    append(idx - 1)
+            if degrees is not None:
+                degrees[idx] = count
+
+        return dist
+
+    def path_to(
+        self, distances: 'array[int]', target: Tuple[int, int]
+    ) -> str:
+        """
+        Rebuilds a shortest path from a distance field.
+
+        Args:
+            distances: A field returned by ``distances()``.
+            target: (x, y) of the cell the path leads to.
+
+        Returns:
+            The directions from the field's source to ``target``, or an
+            empty string if the target cannot be reached.
+        """
+        if not self._in_bounds(target):
+            return ""
+        idx = target[1] * self.width + target[0]
+        if distances[idx] <= 0:
+            return ""
+        return self._ascend(distances, idx)
+
+    def _astar(self, start: int, goal: int) -> str:
+        """A* search using the Manhattan distance as heuristic."""
+        width = self.width
+        goal_x, goal_y = goal % width, goal // width
+        came_from = bytearray(width * self.height)
+        came_from[start] = 1
+        cost = array('i', [-1]) * (width * self.height)
+        cost[start] = 0
+        closed = bytearray(width * self.height)
+        neighbors = self._neighbors
+
+        def heuristic(idx: int) -> int:
+            return abs(idx % width - goal_x) + abs(idx // width - goal_y)
+
+        # Heap entries: (estimated_total, -cost, index). Preferring the
+        # deeper node on ties keeps the search heading straight on.
+        heap: List[Tuple[int, int, int]] = [(heuristic(start), 0, start)]
+        while heap:
+            _, neg_cost, idx = heapq.heappop(heap)
+            if closed[idx]:
+                continue
+            if idx == goal:
+                return self._walk_back(came_from, start, goal)
+            closed[idx] = 1
+            n_cost = 1 - neg_cost
+            for n_idx, direction in neighbors(idx):
+                if closed[n_idx]:
+                    continue
+                if cost[n_idx] == -1 or n_cost < cost[n_idx]:
+                    cost[n_idx] = n_cost
+                    came_from[n_idx] = direction + 1
+                    heapq.heappush(
+                        heap, (n_cost + heuristic(n_idx), -n_cost, n_idx)
+                    )
+
+        return ""
+
+    def _bidirectional(self, start: int, goal: int) -> str:
+        """
+        Level-synchronous BFS from both ends, always growing the smaller
+        frontier, stopping once no shorter meeting point can exist.
+        """
+        size = self.width * self.height
+        dist_s = array('i', [-1]) * size
+        dist_g = array('i', [-1]) * size
+        dist_s[start] = 0
+        dist_g[goal] = 0
+        frontier_s = array('i', [start])
+        frontier_g = array('i', [goal])
+        depth_s = depth_g = 0
+        best = -1
+        meet = -1
+
+        while frontier_s and frontier_g:
+            if best != -1 and best <= depth_s + depth_g + 1:
+                break
+            from_start = len(frontier_s) <= len(frontier_g)
+            if from_start:
+                frontier, mine, other = frontier_s, dist_s, dist_g
+                neighbors = self._neighbors
+            else:
+                # The goal side walks edges backwards
+                frontier, mine, other = frontier_g, dist_g, dist_s
+                neighbors = self._incoming
+
+            next_frontier = array('i')
+            for idx in frontier:
+                n_dist = mine[idx] + 1
+                for n_idx, _ in neighbors(idx):
+                    if mine[n_idx] != -1:
+                        continue
+                    mine[n_idx] = n_dist
+                    next_frontier.append(n_idx)
+                    if other[n_idx] != -1:
+                        total = n_dist + other[n_idx]
+                        if best == -1 or total < best:
+                            best, meet = total, n_idx
+
+            if from_start:
+                frontier_s = next_frontier
+                depth_s += 1
+            else:
+                frontier_g = next_frontier
+                depth_g += 1
+
+        if meet == -1:
+            return ""
+        # Walk from the meeting cell back to the start, then to the goal
+        head = self._ascend(dist_s, meet)
+        return head + self._descend(dist_g, meet, self._neighbors)
+
+    def _ascend(self, dist: 'array[int]', idx: int) -> str:
+        """Returns the path from the source of ``dist`` down to ``idx``."""
+        to_source = self._descend(dist, idx, self._incoming)
+        opposite = {char: opp for _, char, opp in self.DIRECTIONS}
+        return "".join(opposite[char] for char in reversed(to_source))
+
+    def _descend(
+        self,
+        dist: 'array[int]',
+        idx: int,
+        neighbors: Callable[[int], Iterator[Tuple[int, int]]]
+    ) -> str:
+        """Follows strictly decreasing distances from ``idx`` to zero."""
+        chars: List[str] = []
+        while dist[idx] > 0:
+            for n_idx, direction in neighbors(idx):
+                if dist[n_idx] == dist[idx] - 1:
+                    chars.append(self.DIRECTIONS[direction][1])
+                    idx = n_idx
+                    break
+            else:
+                break  # Inconsistent walls, give up on this branch
+        return "".join(chars)
+
+
+class IncrementalSolver(MazeSolver):
+    """
+    Keeps a shortest path up to date while the maze is being edited.
+
+    The solver holds a breadth-first distance field and a parent
+    direction for every cell, rooted at one of the endpoints. Opening a
+    wall only revisits the cells it brings closer to the root; closing
+    a wall only revisits the cells whose parent chain used it. Moving
+    the endpoint that is not the root costs a walk along the new path.
+    When the root endpoint itself moves, the field is rebuilt once from
+    the endpoint that stayed, so dragging one endpoint around costs a
+    single full search.
+
+    Walls are edited on both sides through the grid, which is shared
+    with the caller.
+    """
+
+    def __init__(
+        self,
+        grid: GridLike,
+        width: int,
+        height: int,
+        entry: Tuple[int, int],
+        exit_pos: Tuple[int, int]
+    ) -> None:
+        """
+        Initializes the solver and runs the first full search.
+
+        Args:
+            grid: The maze grid (MazeGrid or list of rows).
+            width: Maze width in cells.
+            height: Maze height in cells.
+            entry: (x, y) coordinates of the entry.
+            exit_pos: (x, y) coordinates of the exit.
+
+        Raises:
+            ValueError: If the entry or the exit is outside the maze.
+        """
+        super().__init__(grid, width, height, entry, exit_pos)
+        self._index(entry)
+        self._index(exit_pos)
+        size = width * height
+        # Steps from the root, -1 for cells it cannot reach
+        self.dist = array('i', [-1]) * size
+        # 1 + index of the direction leading from a cell to its parent
+        self.parent_dir = bytearray(size)
+        self._offsets = (-width, 1, width, -1)
+        self.root = self._index(entry)
+        self._rebuild(self.root)
+
+    def _index(self, pos: Tuple[int, int]) -> int:
+        """Converts (x, y) into a flat index, checking the bounds."""
+        if not self._in_bounds(pos):
+            raise ValueError(f"Cell {pos} is outside the maze.")
+        return pos[1] * self.width + pos[0]
+
+    def _rebuild(self, root: int) -> None:
+        """Runs a full search from ``root``, replacing the whole field."""
+        dist, parent_dir = self.dist, self.parent_dir
+        with span('solve', self.width * self.height):
+            dist[:] = array('i', [-1]) * len(dist)
+            parent_dir[:] = bytes(len(parent_dir))
+            self.root = root
+            dist[root] = 0
+            queue = array('i', [root])
+            head = 0
+            neighbors = self._neighbors
+            while head < len(queue):
+                idx = queue[head]
+                head += 1
+                n_dist = dist[idx] + 1
+                for n_idx, direction in neighbors(idx):
+                    if dist[n_idx] == -1:
+                        dist[n_idx] = n_dist
+                        # The neighbour steps back the opposite way
+                        parent_dir[n_idx] = (direction + 2) % 4 + 1
+                        queue.append(n_idx)
+
+    def _parent(self, idx: int) -> int:
+        """Returns the parent of a reached cell other than the root."""
+        return idx + self._offsets[self.parent_dir[idx] - 1]
+
+    def _edge(self, x: int, y: int, wall: int) -> Tuple[int, int]:
+        """
+        Returns the flat indices of a cell and of its neighbour across
+        ``wall``, the neighbour being -1 for a wall on the border.
+        """
+        idx = self._index((x, y))
+        for dx, dy, bit, _, _ in MazeGrid.DIRECTIONS:
+            if bit == wall:
+                if not self._in_bounds((x + dx, y + dy)):
+                    return idx, -1
+                return idx, idx + dy * self.width + dx
+        raise ValueError(f"Unknown wall value: {wall}")
+
+    def open_wall(self, x: int, y: int, wall: int) -> int:
+        """
+        Opens a wall and repairs the distances it shortens.
+
+        Args:
+            x: Column of the cell.
+            y: Row of the cell.
+            wall: The wall bitmask (N=1, E=2, S=4, W=8).
+
+        Returns:
+            The number of cells whose distance or parent changed.
+
+        Raises:
+            ValueError: If the cell is outside the maze or the wall
+                value is unknown.
+        """
+        idx, n_idx = self._edge(x, y, wall)
+        self.grid.remove_wall(x, y, wall)
+        if n_idx == -1:
+            return 0
+        dist = self.dist
+        # Direction leading from the neighbour back through the wall
+        toward = next(
+            (direction + 2) % 4
+            for direction, (bit, _, _) in enumerate(self.DIRECTIONS)
+            if bit == wall
+        )
+        # Let idx be the side closer to the root
+        if dist[idx] == -1 or (dist[n_idx] != -1 and dist[n_idx] < dist[idx]):
+            idx, n_idx = n_idx, idx
+            toward = (toward + 2) % 4
+        if dist[idx] == -1 or (
+                dist[n_idx] != -1 and dist[n_idx] <= dist[idx] + 1):
+            return 0
+
+        # Spread the shorter distances outwards, in breadth-first order
+        parent_dir = self.parent_dir
+        dist[n_idx] = dist[idx] + 1
+        parent_dir[n_idx] = toward + 1
+        queue = array('i', [n_idx])
+        head = 0
+        neighbors = self._neighbors
+        while head < len(queue):
+            cur = queue[head]
+            head += 1
+            n_dist = dist[cur] + 1
+            for nxt, direction in neighbors(cur):
+                if dist[nxt] == -1 or n_dist < dist[nxt]:
+                    dist[nxt] = n_dist
+                    parent_dir[nxt] = (direction + 2) % 4 + 1
+                    queue.append(nxt)
+        return len(queue)
+
+    def close_wall(self, x: int, y: int, wall: int) -> int:
+        """
+        Closes a wall and repairs the distances that went through it.
+
+        Args:
+            x: Column of the cell.
+            y: Row of the cell.
+            wall: The wall bitmask (N=1, E=2, S=4, W=8).
+
+        Returns:
+            The number of cells whose distance or parent was repaired.
+
+        Raises:
+            ValueError: If the cell is outside the maze or the wall
+                value is unknown.
+        """
+        idx, n_idx = self._edge(x, y, wall)
+        self.grid.add_wall(x, y, wall)
+        if n_idx == -1:
+            return 0
+        dist, parent_dir = self.dist, self.parent_dir
+        # Only a parent link crossing the wall is affected
+        if parent_dir[n_idx] and self._parent(n_idx) == idx:
+            child = n_idx
+        elif parent_dir[idx] and self._parent(idx) == n_idx:
+            child = idx
+        else:
+            return 0
+
+        # Another neighbour just as close to the root can take over
+        for nxt, direction in self._neighbors(child):
+            if dist[nxt] == dist[child] - 1:
+                parent_dir[child] = direction + 1
+                return 1
+
+        # Cut the subtree hanging from the closed wall off the field
+        subtree = [child]
+        cut = {child}
+        neighbors = self._neighbors
+        for cur in subtree:
+            for nxt, _ in neighbors(cur):
+                if nxt not in cut and parent_dir[nxt] and \
+                        self._parent(nxt) == cur:
+                    cut.add(nxt)
+                    subtree.append(nxt)
+        for cur in subtree:
+            dist[cur] = -1
+            parent_dir[cur] = 0
+
+        # Reattach it through its best remaining links, nearest first
+        heap: List[Tuple[int, int]] = []
+        for cur in subtree:
+            for nxt, direction in neighbors(cur):
+                if nxt in cut or dist[nxt] == -1:
+                    continue
+                if dist[cur] == -1 or dist[nxt] + 1 < dist[cur]:
+                    dist[cur] = dist[nxt] + 1
+                    parent_dir[cur] = direction + 1
+            if dist[cur] != -1:
+                heap.append((dist[cur], cur))
+        heapq.heapify(heap)
+        while heap:
+            cur_dist, cur = heapq.heappop(heap)
+            if cur_dist != dist[cur]:
+                continue
+            for nxt, direction in neighbors(cur):
+                if nxt in cut and (
+                        dist[nxt] == -1 or cur_dist + 1 < dist[nxt]):
+                    dist[nxt] = cur_dist + 1
+                    parent_dir[nxt] = (direction + 2) % 4 + 1
+                    heapq.heappush(heap, (cur_dist + 1, nxt))
+        return len(subtree)
+
+    def set_endpoints(
+        self, entry: Tuple[int, int], exit_pos: Tuple[int, int]
+    ) -> None:
+        """
+        Moves the entry and the exit.
+
+        The field is kept while one of the new endpoints is its root.
+        Otherwise it is rebuilt from the endpoint that did not move, or
+        from the new entry when both moved.
+
+        Raises:
+            ValueError: If the entry or the exit is outside the maze.
+        """
+        start, goal = self._index(entry), self._index(exit_pos)
+        if self.root not in (start, goal):
+            previous = (self._index(self.entry), self._index(self.exit_pos))
+            self._rebuild(goal if goal in previous else start)
+        self.entry = entry
+        self.exit_pos = exit_pos
+
+    def distance(self) -> int:
+        """Returns the length of the shortest path, -1 if there is none."""
+        start, goal = self._index(self.entry), self._index(self.exit_pos)
+        return self.dist[goal if self.root == start else start]
+
+    def find_shortest_path(self, strategy: Optional[str] = None) -> str:
+        """
+        Returns the shortest path from entry to exit.
+
+        Without a strategy the path is read from the maintained field in
+        O(path length); naming a strategy runs a new search instead.
+
+        Returns:
+            A string of directions (e.g., 'NNEESW'), or an empty string
+            if no path exists.
+        """
+        if strategy is not None:
+            return super().find_shortest_path(strategy)
+        start, goal = self._index(self.entry), self._index(self.exit_pos)
+        far = goal if self.root == start else start
+        if self.dist[far] <= 0:
+            return ""
+        # Parent links lead from the far endpoint back to the root
+        chars: List[str] = []
+        idx = far
+        while idx != self.root:
+            direction = self.parent_dir[idx] - 1
+            chars.append(self.DIRECTIONS[direction][1])
+            idx += self._offsets[direction]
+        if far == start:
+            return "".join(chars)
+        opposite = {char: opp for _, char, opp in self.DIRECTIONS}
+        return "".join(opposite[char] for char in reversed(chars))
@@ -3,10 +3,96 @@ Unit tests for the mazegen package.
 """
 
 import unittest
+import asyncio
+import io
 import os
-from typing import Dict, Any
+import json
+import pickle
+import struct
+import subprocess
+import sys
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Any, Dict, List, Tuple
 
-from mazegen import MazeGenerator, MazeSolver, MazeExporter
+import mazegen
+from mazegen import (
+    MazeGenerator, MazeSolver, MazeExporter, MazeGrid, MazePathIndex,
+    MazeLoader, MazeCache, PackedMazeReader, TerminalVisualizer
+)
+from mazegen.analyzer import MazeAnalysis, MazeAnalyzer
+from mazegen.batch import derive_seed, run_batch
+from mazegen.packed import packed_to_text, text_to_packed
+from mazegen.profiling import Profiler, get_profiler, span
+from mazegen.serve import MazeServer
+from mazegen.shared import SharedMaze, SharedMazeHandle
+from mazegen.solver import IncrementalSolver
+from mazegen.validate import ValidationReport, validate_maze
+
+try:
+    import numpy  # noqa: F401
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def _solve_shared(handle: SharedMazeHandle) -> str:
+    """Worker of the shared memory test: solves the attached maze."""
+    with handle.attach() as maze:
+        return maze.solver().find_shortest_path()
+
+
+class TestPackage(unittest.TestCase):
+    """Tests for the package's lazy exports."""
+
+    def test_import_loads_no_submodule(self) -> None:
+        """Test that classes are imported on first access only."""
+        code = (
+            "import sys, mazegen\n"
+            "assert not [m for m in sys.modules if m.startswith('mazegen.')]\n"
+            "from mazegen import MazeExporter\n"
+            "assert 'mazegen.formatters' in sys.modules\n"
+            "assert 'mazegen.visualizer' not in sys.modules\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__)
+        )))
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+        with self.assertRaises(AttributeError):
+            getattr(mazegen, 'NoSuchClass')
+
+
+class TestMazeGrid(unittest.TestCase):
+    """Tests for the MazeGrid class."""
+
+    def test_flat_layout(self) -> None:
+        """Test that cells are stored row by row in one buffer."""
+        grid = MazeGrid(3, 2)
+        self.assertEqual(len(grid.cells), 6)
+        grid.set(2, 1, 7)
+        self.assertEqual(grid.cells[5], 7)
+        self.assertEqual(grid[1][2], 7)
+        self.assertEqual(len(grid), 2)
+        self.assertEqual(len(grid[0]), 3)
+
+    def test_remove_wall_updates_both_sides(self) -> None:
+        """Test that opening a wall also opens the neighbour's side."""
+        grid = MazeGrid(2, 2)
+        grid.remove_wall(0, 0, MazeGrid.WALL_E)
+        self.assertEqual(grid.get(0, 0), 13)
+        self.assertEqual(grid.get(1, 0), 7)
+        self.assertEqual(list(grid.open_neighbors(0, 0)), [(1, 0, 'E')])
+        grid.add_wall(1, 0, MazeGrid.WALL_W)
+        self.assertEqual(grid.get(0, 0), 15)
+
+    def test_from_rows_round_trip(self) -> None:
+        """Test conversion from and back to nested lists."""
+        rows = [[9, 3], [12, 6]]
+        grid = MazeGrid.from_rows(rows)
+        self.assertEqual(grid.to_rows(), rows)
+        self.assertIs(MazeGrid.coerce(grid), grid)
 
 
 class TestMazeGenerator(unittest.TestCase):
@@ -34,10 +120,117 @@ class TestMazeGenerator(unittest.TestCase):
         self.assertEqual(self.generator.grid[0][0], 15)
 
     def test_generate_perfect(self) -> None:
-        """Test that the generation runs and populates the visited set."""
+        """Test that the generation runs and fills the visited map."""
         self.generator.generate()
-        # Ensure the grid was traversed
-        self.assertTrue(len(self.generator.visited) > 0)
+        # Ensure the whole grid was traversed
+        self.assertEqual(self.generator.visited.count(0), 0)
+
+    def _assert_perfect(self, algorithm: str, **extra: Any) -> None:
+        """Assert that an algorithm connects every free cell once."""
+        config = dict(self.config, WIDTH=14, HEIGHT=11, ALGORITHM=algorithm)
+        config.update(extra)
+        generator = MazeGenerator(config)
+        generator.generate()
+        reserved = set(generator._pattern_cells())
+        for x, y in reserved:
+            self.assertEqual(generator.grid.get(x, y), 15)
+        # Building the index fails on loops; depths show connectivity
+        index = MazePathIndex(generator.grid, 14, 11)
+        reached = sum(1 for depth in index.depth if depth != -1)
+        self.assertEqual(reached, 14 * 11 - len(reserved))
+        self.assertEqual(generator.stats['algorithm'], algorithm)
+        self.assertEqual(generator.stats['cells'], 14 * 11)
+
+    def test_eller_is_perfect(self) -> None:
+        """Test that Eller's algorithm builds a perfect maze."""
+        self._assert_perfect('eller')
+
+    def test_kruskal_is_perfect(self) -> None:
+        """Test that Kruskal's algorithm builds a perfect maze."""
+        self._assert_perfect('kruskal')
+
+    def test_wilson_is_perfect(self) -> None:
+        """Test that Wilson's algorithm builds a perfect maze."""
+        self._assert_perfect('wilson')
+
+    def test_tiled_is_perfect(self) -> None:
+        """Test that stitched tiles carved by workers form one maze."""
+        self._assert_perfect('tiled', TILES=3, JOBS=2)
+
+    def test_tiled_ignores_worker_count(self) -> None:
+        """Test that the tiled maze only depends on SEED and TILES."""
+        grids = []
+        for jobs in (1, 2):
+            config = dict(self.config, ALGORITHM='tiled', TILES=2, JOBS=jobs)
+            generator = MazeGenerator(config)
+            generator.generate()
+            grids.append(generator.grid)
+        self.assertEqual(grids[0], grids[1])
+
+    def test_eller_rows_stream(self) -> None:
+        """Test that streamed Eller rows match the generated grid."""
+        config = dict(self.config, WIDTH=12, HEIGHT=9, ALGORITHM='eller')
+        streamed = list(MazeGenerator(config).iter_rows())
+        generator = MazeGenerator(config)
+        generator.generate()
+        self.assertEqual(b"".join(streamed), bytes(generator.grid.cells))
+
+    def test_unknown_algorithm(self) -> None:
+        """Test that an unknown ALGORITHM value is rejected."""
+        with self.assertRaises(ValueError):
+            MazeGenerator(dict(self.config, ALGORITHM='prim'))
+
+    def test_imperfect_opens_exact_loops(self) -> None:
+        """Test LOOP_DENSITY, wall symmetry and the 3x3 rule."""
+        config = dict(
+            self.config, WIDTH=30, HEIGHT=20, PERFECT=False,
+            LOOP_DENSITY=0.2
+        )
+        perfect = MazeGenerator(dict(config, PERFECT=True))
+        perfect.generate()
+        generator = MazeGenerator(config)
+        generator.generate()
+        cells, base = generator.grid.cells, perfect.grid.cells
+        opened = sum(bin(a ^ b).count("1") for a, b in zip(cells, base))
+        self.assertEqual(opened, 2 * 120)
+        for idx in range(30 * 20):
+            if idx % 30 < 29:
+                self.assertEqual(
+                    bool(cells[idx] & 2), bool(cells[idx + 1] & 8)
+                )
+            if idx < 30 * 19:
+                self.assertEqual(
+                    bool(cells[idx] & 4), bool(cells[idx + 30] & 1)
+                )
+        # Every 3x3 block keeps at least one inner wall
+        for by in range(18):
+            for bx in range(28):
+                block = [
+                    cells[(by + y) * 30 + bx + x]
+                    for y in range(3) for x in range(3)
+                ]
+                east = [block[i] & 2 for i in range(9) if i % 3 < 2]
+                south = [block[i] & 4 for i in range(6)]
+                self.assertTrue(any(east) or any(south))
+
+    def test_negative_loop_density(self) -> None:
+        """Test that a negative LOOP_DENSITY is rejected."""
+        with self.assertRaises(ValueError):
+            MazeGenerator(dict(self.config, LOOP_DENSITY=-1))
+
+    def test_iter_carve_replays_grid(self) -> None:
+        """Test that carve events rebuild the generated maze."""
+        for algorithm in ('backtracker', 'kruskal'):
+            for perfect in (True, False):
+                config = dict(
+                    self.config, ALGORITHM=algorithm, PERFECT=perfect
+                )
+                expected = MazeGenerator(config)
+                expected.generate()
+                grid = MazeGrid(self.config['WIDTH'], self.config['HEIGHT'])
+                for x, y, wall in MazeGenerator(config).iter_carve():
+                    grid.remove_wall(x, y, wall)
+                self.assertEqual(grid.cells, expected.grid.cells)
 
 
 class TestMazeSolver(unittest.TestCase):
@@ -72,6 +265,211 @@ class TestMazeSolver(unittest.TestCase):
         solver = MazeSolver(grid, 2, 2, (0, 0), (1, 1))
         self.assertEqual(solver.find_shortest_path(), "")
 
+    def test_strategies_agree(self) -> None:
+        """Test that every strategy finds a path of the same length."""
+        config: Dict[str, Any] = {
+            'WIDTH': 25, 'HEIGHT': 20, 'ENTRY': (0, 0),
+            'EXIT': (24, 19), 'PERFECT': True, 'SEED': 7
+        }
+        generator = MazeGenerator(config)
+        generator.generate()
+        solver = MazeSolver(
+            generator.grid, 25, 20, generator.entry, generator.exit
+        )
+        expected = solver.find_shortest_path()
+        self.assertTrue(expected)
+        for strategy in ('bidirectional', 'astar', 'frontier'):
+            path = solver.find_shortest_path(strategy)
+            self.assertEqual(len(path), len(expected))
+
+    def test_frontier_on_imperfect_maze(self) -> None:
+        """Test the whole-frontier BFS where frontiers grow wide."""
+        generator = MazeGenerator({
+            'WIDTH': 90, 'HEIGHT': 70, 'PERFECT': False, 'SEED': 5
+        })
+        generator.generate()
+        grid = generator.grid
+        for goal in ((89, 69), (45, 2), (0, 69)):
+            solver = MazeSolver(grid, 90, 70, (0, 0), goal, 'frontier')
+            path = solver.find_shortest_path()
+            self.assertEqual(len(path), len(solver.find_shortest_path('bfs')))
+            moves = {char: (dx, dy, wall)
+                     for dx, dy, wall, _, char in MazeGrid.DIRECTIONS}
+            x, y = 0, 0
+            for step in path:
+                dx, dy, wall = moves[step]
+                self.assertFalse(grid.has_wall(x, y, wall))
+                x, y = x + dx, y + dy
+            self.assertEqual((x, y), goal)
+
+    def test_unknown_strategy(self) -> None:
+        """Test that an unknown strategy name is rejected."""
+        with self.assertRaises(ValueError):
+            MazeSolver([[15]], 1, 1, (0, 0), (0, 0), strategy='dfs')
+
+
+class TestMazeAnalyzer(unittest.TestCase):
+    """Tests for the MazeAnalyzer class."""
+
+    def _analyze(self, perfect: bool) -> Tuple[MazeGenerator, MazeAnalysis]:
+        """Generates a seeded maze and analyzes it."""
+        generator = MazeGenerator({
+            'WIDTH': 20, 'HEIGHT': 15, 'PERFECT': perfect, 'SEED': 4
+        })
+        generator.generate()
+        analysis = MazeAnalyzer(
+            generator.grid, 20, 15, generator.entry, generator.exit
+        ).analyze()
+        return generator, analysis
+
+    def test_perfect_maze_metrics(self) -> None:
+        """Test the metrics of a perfect maze against the solver."""
+        generator, analysis = self._analyze(True)
+        path = MazeSolver(
+            generator.grid, 20, 15, generator.entry, generator.exit
+        ).find_shortest_path()
+        exit_idx = generator.exit[1] * 20 + generator.exit[0]
+        self.assertEqual(analysis.path, path)
+        self.assertEqual(analysis.distances[exit_idx], len(path))
+        self.assertEqual(sum(analysis.on_path), len(path) + 1)
+        self.assertTrue(analysis.is_perfect)
+        self.assertTrue(analysis.diameter_exact)
+        # 42 pattern cells are walled in and unreachable
+        self.assertEqual(analysis.distances.count(-1), 300 - 280)
+        self.assertEqual(sum(analysis.degree_histogram), 280)
+        # A tree with n nodes has n - 1 edges
+        self.assertEqual(sum(analysis.degrees), 2 * (280 - 1))
+        # No cell is farther from a diameter end than the diameter
+        assert analysis.diameter is not None
+        self.assertGreaterEqual(analysis.diameter, analysis.max_distance)
+
+    def test_imperfect_maze(self) -> None:
+        """Test that loops are detected and the diameter is a bound."""
+        _, analysis = self._analyze(False)
+        self.assertFalse(analysis.is_perfect)
+        self.assertFalse(analysis.diameter_exact)
+        self.assertEqual(
+            analysis.to_dict()['path_length'], len(analysis.path)
+        )
+
+
+class TestIncrementalSolver(unittest.TestCase):
+    """Tests for the IncrementalSolver class."""
+
+    def setUp(self) -> None:
+        """Generate an imperfect maze and solve it once."""
+        self.generator = MazeGenerator({
+            'WIDTH': 20, 'HEIGHT': 15, 'ENTRY': (0, 0),
+            'EXIT': (19, 14), 'PERFECT': False, 'SEED': 11
+        })
+        self.generator.generate()
+        self.solver = IncrementalSolver(
+            self.generator.grid, 20, 15, (0, 0), (19, 14)
+        )
+
+    def _assert_solved(self) -> None:
+        """Checks the kept path and field against a fresh search."""
+        solver = self.solver
+        fresh = MazeSolver(
+            self.generator.grid, 20, 15, solver.entry, solver.exit_pos
+        )
+        expected = fresh.find_shortest_path()
+        path = solver.find_shortest_path()
+        self.assertEqual(len(path), len(expected))
+        root = (solver.root % 20, solver.root // 20)
+        self.assertEqual(solver.dist, fresh.distances(root))
+        x, y = solver.entry
+        moves = {'N': (0, -1, 1), 'E': (1, 0, 2), 'S': (0, 1, 4),
+                 'W': (-1, 0, 8)}
+        for step in path:
+            dx, dy, wall = moves[step]
+            self.assertFalse(self.generator.grid.has_wall(x, y, wall))
+            x, y = x + dx, y + dy
+        if path:
+            self.assertEqual((x, y), solver.exit_pos)
+
+    def test_edits_match_fresh_search(self) -> None:
+        """Test that repaired paths stay shortest through many edits."""
+        self._assert_solved()
+        edits = [
+            (3, 4, 2), (10, 7, 4), (0, 0, 2), (19, 13, 4), (5, 5, 1),
+            (12, 2, 8), (7, 14, 2), (16, 9, 1), (0, 0, 4), (18, 14, 2)
+        ]
+        for x, y, wall in edits:
+            self.solver.close_wall(x, y, wall)
+            self._assert_solved()
+        for x, y, wall in edits[::2]:
+            self.solver.open_wall(x, y, wall)
+            self._assert_solved()
+        self.solver.set_endpoints((4, 6), (19, 14))
+        self._assert_solved()
+        self.solver.set_endpoints((4, 6), (13, 0))
+        self._assert_solved()
+        self.solver.set_endpoints((2, 2), (9, 9))
+        self._assert_solved()
+
+    def test_repair_stays_local(self) -> None:
+        """Test that reopening a wall next to the root is cheap."""
+        solver = self.solver
+        # Reattaching a dead end only touches that dead end
+        x, y = next(
+            (x, y) for y in range(15) for x in range(1, 20)
+            if bin(self.generator.grid.get(x, y)).count('1') == 3
+            and not self.generator.grid.has_wall(x, y, 8)
+        )
+        self.assertLessEqual(solver.close_wall(x, y, 8), 1)
+        self.assertLessEqual(solver.open_wall(x, y, 8), 1)
+        self.assertEqual(solver.open_wall(0, 0, 1), 0)  # Border wall
+        self._assert_solved()
+        with self.assertRaises(ValueError):
+            solver.set_endpoints((20, 0), (0, 0))
+
+    def test_single_column_repair(self) -> None:
+        """Test that an opened wall in a one-column maze keeps N/S steps."""
+        grid = MazeGrid(1, 8)
+        for y in range(1, 8):
+            grid.remove_wall(0, y, MazeGrid.WALL_N)
+        grid.add_wall(0, 3, MazeGrid.WALL_N)
+        solver = IncrementalSolver(grid, 1, 8, (0, 7), (0, 0))
+        self.assertEqual(solver.find_shortest_path(), "")
+        solver.set_endpoints((0, 0), (0, 7))
+        self.assertEqual(solver.open_wall(0, 3, MazeGrid.WALL_N), 3)
+        self.assertEqual(solver.find_shortest_path(), "S" * 7)
+        solver.set_endpoints((0, 7), (0, 0))
+        self.assertEqual(solver.find_shortest_path(), "N" * 7)
+
+
+class TestMazePathIndex(unittest.TestCase):
+    """Tests for the MazePathIndex class."""
+
+    def setUp(self) -> None:
+        """Generate a perfect maze and index it."""
+        config: Dict[str, Any] = {
+            'WIDTH': 15, 'HEIGHT': 12, 'ENTRY': (0, 0),
+            'EXIT': (14, 11), 'PERFECT': True, 'SEED': 3
+        }
+        self.generator = MazeGenerator(config)
+        self.generator.generate()
+        self.index = MazePathIndex(self.generator.grid, 15, 12)
+
+    def test_matches_solver(self) -> None:
+        """Test that indexed distances and paths match a fresh BFS."""
+        pairs = [((0, 0), (14, 11)), ((3, 9), (12, 1)), ((14, 0), (0, 11))]
+        for start, goal in pairs:
+            solver = MazeSolver(self.generator.grid, 15, 12, start, goal)
+            expected = solver.find_shortest_path()
+            self.assertEqual(self.index.distance(start, goal), len(expected))
+            self.assertEqual(self.index.path(start, goal), expected)
+
+    def test_rejects_loops(self) -> None:
+        """Test that a grid containing a loop cannot be indexed."""
+        grid = [
+            [9, 3],
+            [12, 6]
+        ]
+        with self.assertRaises(ValueError):
+            MazePathIndex(grid, 2, 2)
+
 
 class TestMazeExporter(unittest.TestCase):
     """Tests for the MazeExporter class."""
@@ -104,6 +502,620 @@ class TestMazeExporter(unittest.TestCase):
         if os.path.exists(test_file):
             os.remove(test_file)
 
+    def test_streamed_rows_match_export(self) -> None:
+        """Test that exporting from a row iterator is byte-identical."""
+        grid = MazeGrid.from_rows([[9, 5, 3], [12, 5, 6]])
+        with tempfile.TemporaryDirectory() as tmp:
+            full = os.path.join(tmp, "full.txt")
+            streamed = os.path.join(tmp, "streamed.txt")
+            MazeExporter(grid, (0, 0), (2, 1), "EESW").export(full)
+            rows = (bytes(row) for row in grid.rows())
+            MazeExporter.export_rows(
+                streamed, rows, (0, 0), (2, 1), iter(["EE", "SW"])
+            )
+            with open(full, "rb") as a, open(streamed, "rb") as b:
+                self.assertEqual(a.read(), b.read())
+
+
+class TestMazeLoader(unittest.TestCase):
+    """Tests for the MazeLoader class."""
+
+    def setUp(self) -> None:
+        """Export a small maze to a temporary file."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "maze.txt")
+        self.grid = MazeGrid.from_rows([[9, 5, 3], [12, 5, 6]])
+        MazeExporter(self.grid, (0, 0), (2, 1), "EES").export(self.filename)
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+
+    def test_round_trip(self) -> None:
+        """Test that an exported maze loads back unchanged."""
+        loader = MazeLoader.load(self.filename)
+        self.assertEqual(loader.grid, self.grid)
+        self.assertEqual(loader.entry, (0, 0))
+        self.assertEqual(loader.exit, (2, 1))
+
+    def test_mmap_rows(self) -> None:
+        """Test lazy row decoding in memory-mapped mode."""
+        with MazeLoader(self.filename, use_mmap=True) as loader:
+            self.assertEqual((loader.width, loader.height), (3, 2))
+            self.assertEqual(loader.row(1), bytes([12, 5, 6]))
+            self.assertEqual(loader.cell(2, 0), 3)
+
+    def test_rejects_bad_path(self) -> None:
+        """Test that a path crossing a wall fails validation."""
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.write("953\nC56\n\n0,0\n2,1\nESS\n")
+        with self.assertRaises(ValueError):
+            MazeLoader.load(self.filename)
+
+    def test_rejects_bad_digit(self) -> None:
+        """Test that a non-hex character is reported."""
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.write("95G\nC56\n\n0,0\n2,1\n\n")
+        with self.assertRaises(ValueError):
+            MazeLoader(self.filename)
+
+
+class TestImageExport(unittest.TestCase):
+    """Tests for the PNG and PPM image export."""
+
+    def setUp(self) -> None:
+        """Set up a solved seeded maze and its exporter."""
+        generator = MazeGenerator({
+            'WIDTH': 9, 'HEIGHT': 6, 'PERFECT': True, 'SEED': 1
+        })
+        generator.generate()
+        path = MazeSolver(
+            generator.grid, 9, 6, generator.entry, generator.exit
+        ).find_shortest_path()
+        self.exporter = MazeExporter(
+            generator.grid, generator.entry, generator.exit, path
+        )
+
+    def _export(self, suffix: str, **options: Any) -> bytes:
+        """Exports the maze to a temporary image and reads it back."""
+        with tempfile.TemporaryDirectory() as work_dir:
+            filename = os.path.join(work_dir, "maze" + suffix)
+            self.exporter.export_image(filename, **options)
+            with open(filename, 'rb') as file:
+                return file.read()
+
+    def test_png_matches_ppm(self) -> None:
+        """Test that both formats hold the same pixels."""
+        ppm = self._export(".ppm", cell_size=3, wall_size=2, show_path=True)
+        header, pixels = ppm.split(b"\n255\n", 1)
+        width, height = (int(value) for value in header.split()[1:])
+        self.assertEqual((width, height), (9 * 3 + 10 * 2, 6 * 3 + 7 * 2))
+        self.assertEqual(len(pixels), width * height * 3)
+        self.assertEqual(pixels[:3], bytes(3))  # Top left wall post
+        blue = bytes((66, 133, 244))
+        self.assertIn(blue, pixels)
+
+        png = self._export(".png", cell_size=3, wall_size=2, show_path=True)
+        self.assertTrue(png.startswith(b"\x89PNG\r\n\x1a\n"))
+        pos, data = 8, b""
+        while pos < len(png):
+            size, kind = struct.unpack('>I4s', png[pos:pos + 8])
+            chunk = png[pos + 8:pos + 8 + size]
+            crc, = struct.unpack('>I', png[pos + 8 + size:pos + 12 + size])
+            self.assertEqual(crc, zlib.crc32(chunk, zlib.crc32(kind)))
+            if kind == b"IHDR":
+                self.assertEqual(
+                    struct.unpack('>II', chunk[:8]), (width, height)
+                )
+            elif kind == b"IDAT":
+                data += chunk
+            pos += 12 + size
+        raw = zlib.decompress(data)
+        stride = 1 + 3 * width
+        rows = [raw[i * stride + 1:(i + 1) * stride] for i in range(height)]
+        self.assertEqual(b"".join(rows), pixels)
+
+    def test_path_is_optional(self) -> None:
+        """Test that the path is only drawn on request."""
+        pixels = self._export(".ppm").split(b"\n255\n", 1)[1]
+        self.assertNotIn(bytes((66, 133, 244)), pixels)
+
+    def test_rejects_bad_options(self) -> None:
+        """Test that unknown suffixes and pixel sizes raise ValueError."""
+        with self.assertRaises(ValueError):
+            self.exporter.export_image("maze.gif")
+        with self.assertRaises(ValueError):
+            self.exporter.export_image("maze.png", cell_size=0)
+
+
+class TestSharedMaze(unittest.TestCase):
+    """Tests for mazes handed to workers through shared memory."""
+
+    def setUp(self) -> None:
+        """Generate and solve a seeded imperfect maze."""
+        self.generator = MazeGenerator({
+            'WIDTH': 30, 'HEIGHT': 20, 'PERFECT': False, 'SEED': 8
+        })
+        self.generator.generate()
+        self.path = MazeSolver(
+            self.generator.grid, 30, 20,
+            self.generator.entry, self.generator.exit
+        ).find_shortest_path()
+
+    def test_attach_read_only(self) -> None:
+        """Test that attached components see the maze without copies."""
+        with SharedMaze.from_generator(self.generator) as shared:
+            handle = pickle.loads(pickle.dumps(shared.handle))
+            with handle.attach() as maze:
+                self.assertEqual(maze.grid, self.generator.grid)
+                self.assertIsInstance(maze.grid.cells, memoryview)
+                self.assertEqual(
+                    maze.solver().find_shortest_path(), self.path
+                )
+                self.assertTrue(maze.validate(self.path).ok)
+                with self.assertRaises(TypeError):
+                    maze.grid.set(0, 0, 0)
+        with self.assertRaises(FileNotFoundError):
+            shared.handle.attach()
+
+    def test_workers_receive_handle(self) -> None:
+        """Test that a worker process solves the published maze."""
+        with SharedMaze.from_generator(self.generator) as shared:
+            with self.assertRaises(TypeError):
+                pickle.dumps(shared)
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                paths = list(executor.map(_solve_shared, [shared.handle]))
+        self.assertEqual(paths, [self.path])
+
+
+class TestPackedFormat(unittest.TestCase):
+    """Tests for the packed binary maze format."""
+
+    def setUp(self) -> None:
+        """Generate an odd-width maze and export it as text."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.text_file = os.path.join(self.tmp.name, "maze.txt")
+        self.packed_file = os.path.join(self.tmp.name, "maze.mzp")
+        self.generator = MazeGenerator({
+            'WIDTH': 23, 'HEIGHT': 14, 'PERFECT': False, 'SEED': 5
+        })
+        self.generator.generate()
+        self.path = MazeSolver(
+            self.generator.grid, 23, 14,
+            self.generator.entry, self.generator.exit
+        ).find_shortest_path()
+        self.exporter = MazeExporter(
+            self.generator.grid, self.generator.entry,
+            self.generator.exit, self.path
+        )
+        self.exporter.export(self.text_file)
+
+    def tearDown(self) -> None:
+        """Remove the temporary directory."""
+        self.tmp.cleanup()
+
+    def test_header_and_rows(self) -> None:
+        """Test that both layouts read back the maze and its header."""
+        for compress in (False, True):
+            self.exporter.export_packed(
+                self.packed_file, compress, seed=5, algorithm='backtracker'
+            )
+            with PackedMazeReader(self.packed_file) as reader:
+                self.assertEqual(reader.path, self.path)
+                self.assertEqual(reader.seed, 5)
+                self.assertEqual(reader.algorithm, 'backtracker')
+                self.assertEqual(reader.entry, self.generator.entry)
+                self.assertEqual(
+                    reader.row(9), self.generator.grid.row_bytes(9)
+                )
+                self.assertEqual(reader.grid, self.generator.grid)
+
+    def test_text_round_trip(self) -> None:
+        """Test that text -> packed -> text gives back the same file."""
+        copy = os.path.join(self.tmp.name, "copy.txt")
+        for compress in (False, True):
+            text_to_packed(
+                self.text_file, self.packed_file, compress, rows_per_chunk=4
+            )
+            packed_to_text(self.packed_file, copy)
+            with open(self.text_file, "rb") as a, open(copy, "rb") as b:
+                self.assertEqual(a.read(), b.read())
+
+    def test_rejects_other_files(self) -> None:
+        """Test that a text maze is not read as a packed one."""
+        with self.assertRaises(ValueError):
+            PackedMazeReader(self.text_file)
+
+
+class TestBatch(unittest.TestCase):
+    """Tests for batch generation."""
+
+    def test_derive_seed_is_stable(self) -> None:
+        """Test that job seeds only depend on base seed and index."""
+        self.assertEqual(derive_seed(42, 3), derive_seed(42, 3))
+        self.assertNotEqual(derive_seed(42, 3), derive_seed(42, 4))
+
+    def test_run_batch_writes_manifest(self) -> None:
+        """Test that a batch writes every maze and a manifest."""
+        config: Dict[str, Any] = {
+            'WIDTH': 12, 'HEIGHT': 9, 'ENTRY': (0, 0),
+            'EXIT': (11, 8), 'PERFECT': True, 'SEED': 1
+        }
+        with tempfile.TemporaryDirectory() as out_dir:
+            manifest = run_batch(config, 3, jobs=1, out_dir=out_dir)
+            with open(os.path.join(out_dir, "manifest.json"),
+                      encoding="utf-8") as f:
+                self.assertEqual(json.load(f), manifest)
+            self.assertEqual(len(manifest['mazes']), 3)
+            for entry in manifest['mazes']:
+                self.assertTrue(
+                    os.path.exists(os.path.join(out_dir, entry['file']))
+                )
+                self.assertGreater(entry['path_length'], 0)
+
+    def test_run_batch_reports_write_failure(self) -> None:
+        """Test that a maze file that cannot be written fails the batch."""
+        config: Dict[str, Any] = {
+            'WIDTH': 8, 'HEIGHT': 6, 'ENTRY': (0, 0),
+            'EXIT': (7, 5), 'PERFECT': True, 'SEED': 1
+        }
+        with tempfile.TemporaryDirectory() as out_dir:
+            # A directory in place of the first maze file
+            os.mkdir(os.path.join(out_dir, "maze_000000.txt"))
+            with self.assertRaises(OSError):
+                run_batch(config, 2, jobs=1, out_dir=out_dir)
+            self.assertFalse(
+                os.path.exists(os.path.join(out_dir, "manifest.json"))
+            )
+
+
+class TestMazeCache(unittest.TestCase):
+    """Tests for the maze cache."""
+
+    def setUp(self) -> None:
+        """Set up a seeded configuration."""
+        self.config: Dict[str, Any] = {
+            'WIDTH': 12, 'HEIGHT': 9, 'ENTRY': (0, 0),
+            'EXIT': (11, 8), 'PERFECT': True, 'SEED': 5
+        }
+
+    def test_hit_returns_same_maze(self) -> None:
+        """Test that a second build is served from memory."""
+        cache = MazeCache()
+        first, path = cache.build(self.config)
+        second, cached_path = cache.build(dict(self.config))
+        self.assertEqual(second.grid, first.grid)
+        self.assertEqual(cached_path, path)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(second.stats, {})
+
+    def test_disk_store_survives_instances(self) -> None:
+        """Test that the on-disk store is shared by new caches."""
+        with tempfile.TemporaryDirectory() as directory:
+            generator, path = MazeCache(directory=directory).build(
+                self.config
+            )
+            cached = MazeCache(directory=directory).get(self.config)
+            self.assertIsNotNone(cached)
+            if cached is not None:
+                self.assertEqual(cached[0], generator.grid)
+                self.assertEqual(cached[1], path)
+
+    def test_lru_eviction_and_unseeded(self) -> None:
+        """Test the LRU bound and that unseeded mazes are not cached."""
+        cache = MazeCache(max_entries=2)
+        for seed in range(3):
+            cache.build(dict(self.config, SEED=seed))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(dict(self.config, SEED=0)))
+        unseeded = dict(self.config)
+        del unseeded['SEED']
+        cache.build(unseeded)
+        self.assertEqual(len(cache), 2)
+
+
+class TestTerminalVisualizer(unittest.TestCase):
+    """Tests for the terminal renderer."""
+
+    def setUp(self) -> None:
+        """Set up a small seeded visualizer."""
+        self.vis = TerminalVisualizer({
+            'WIDTH': 12, 'HEIGHT': 9, 'ENTRY': (0, 0),
+            'EXIT': (11, 8), 'PERFECT': True, 'SEED': 3
+        })
+
+    def test_path_layer_keeps_walls(self) -> None:
+        """Test that toggling the path only overlays path dots."""
+        walls = self.vis._build_canvas()
+        self.vis.show_path = True
+        with_path = self.vis._build_canvas()
+        self.assertEqual(len(walls), 2 * 9 + 1)
+        for row_a, row_b in zip(walls, with_path):
+            for a, b in zip(row_a, row_b):
+                self.assertTrue(a == b or (a == ' ' and b == '·'))
+        self.vis.show_path = False
+        self.assertEqual(self.vis._build_canvas(), walls)
+
+    def test_reuses_given_maze(self) -> None:
+        """Test that a built maze is displayed without regenerating."""
+        vis = TerminalVisualizer(
+            self.vis.config, self.vis.generator, self.vis.shortest_path
+        )
+        self.assertIs(vis.generator, self.vis.generator)
+        self.assertEqual(vis.shortest_path, self.vis.shortest_path)
+
+    def test_render_one_span_per_run(self) -> None:
+        """Test that a run of walls is coloured by a single span."""
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            self.vis.render()
+        frame = buf.getvalue()
+        top = frame.split("\n")[3]
+        color = TerminalVisualizer.COLORS[0]
+        self.assertEqual(top, f"{color}{'█' * 25}{TerminalVisualizer.RESET}")
+
+    def test_heatmap_uses_distance_field(self) -> None:
+        """Test that the heatmap shades the entry and farthest cells."""
+        self.vis.show_heatmap = True
+        rows = self.vis._frame_rows()
+        self.assertEqual(len(rows), 2 * 9 + 1)
+        self.assertIn(TerminalVisualizer.HEAT[0], ''.join(rows))
+        self.assertIn(TerminalVisualizer.HEAT[-1], ''.join(rows))
+        self.assertIs(self.vis._frame_rows(), rows)
+
+    def test_animate_builds_seeded_maze(self) -> None:
+        """Test that the animation ends on the same maze and path."""
+        buf = io.StringIO()
+        vis = TerminalVisualizer(dict(self.vis.config))
+        with redirect_stdout(buf):
+            vis.animate(fps=1000.0, seconds=0.01)
+        cells = vis.generator.grid.cells
+        self.assertEqual(cells, self.vis.generator.grid.cells)
+        self.assertEqual(vis.shortest_path, self.vis.shortest_path)
+        # Each opened wall is blanked exactly once
+        opened = sum(
+            (not cell & 2) + (not cell & 4) for cell in cells
+        )
+        self.assertEqual(buf.getvalue().count("H "), opened)
+
+    def test_window_matches_full_canvas(self) -> None:
+        """Test that a viewport window is a slice of the full canvas."""
+        self.vis.show_path = True
+        full = self.vis._build_canvas()
+        for x0, y0, x1, y1 in ((0, 0, 12, 9), (3, 2, 8, 6), (11, 8, 12, 9)):
+            expected = [
+                ''.join(row[2 * x0:2 * x1 + 1])
+                for row in full[2 * y0:2 * y1 + 1]
+            ]
+            self.assertEqual(
+                self.vis._window_lines(x0, y0, x1, y1), expected
+            )
+
+    def test_overview_quarter_blocks(self) -> None:
+        """Test the overview's size, borders and closed cells."""
+        lines = self.vis._overview_lines(0, 0, 12, 9, 3)
+        self.assertEqual(len(lines), 3 + 1)
+        self.assertEqual(lines[-1], '▀' * 4 + '▘')
+        self.assertTrue(all(line.endswith('▌') for line in lines[:-1]))
+        self.assertEqual(lines[0][0], 'S')
+        generator = MazeGenerator({'WIDTH': 4, 'HEIGHT': 2})
+        vis = TerminalVisualizer({}, generator, "")
+        self.assertEqual(
+            vis._overview_lines(0, 0, 4, 2, 1)[1], '███E▌'
+        )
+
+    def test_viewport_reads_only_the_window(self) -> None:
+        """Test that a large maze is shown without a full canvas."""
+        generator = MazeGenerator({'WIDTH': 3000, 'HEIGHT': 2000})
+        vis = TerminalVisualizer({}, generator, "")
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            vis.render()
+        self.assertIsNone(vis._wall_rows)
+        self.assertIn("of 3000x2000, full detail", buf.getvalue())
+        vis.zoom = 4
+        with redirect_stdout(io.StringIO()):
+            vis.render()
+        self.assertLess(len(vis._overview_lines(*vis._view_window(), 4)), 30)
+
+
+class TestValidate(unittest.TestCase):
+    """Tests for the bulk maze validator."""
+
+    def setUp(self) -> None:
+        """Set up a generated and solved imperfect maze."""
+        self.generator = MazeGenerator({
+            'WIDTH': 20, 'HEIGHT': 15, 'PERFECT': False, 'SEED': 9
+        })
+        self.generator.generate()
+        self.path = MazeSolver(
+            self.generator.grid, 20, 15,
+            self.generator.entry, self.generator.exit
+        ).find_shortest_path()
+
+    def _validate(
+        self, grid: MazeGrid, path: str, backend: str
+    ) -> ValidationReport:
+        """Validates a grid against the generator's entry and exit."""
+        return validate_maze(
+            grid, self.generator.entry, self.generator.exit, path,
+            backend=backend
+        )
+
+    def _broken_mazes(self) -> List[Tuple[str, MazeGrid, str]]:
+        """Returns (failing check, grid, path) for several defects."""
+        grid = self.generator.grid
+        asymmetric = grid.copy()
+        asymmetric.cells[21] ^= MazeGrid.WALL_E
+        border = grid.copy()
+        border.remove_wall(0, 0, MazeGrid.WALL_N)
+        reserved = grid.copy()
+        x, y = self.generator._pattern_cells()[0]
+        reserved.remove_wall(x, y, MazeGrid.WALL_W)
+        isolated = grid.copy()
+        for wall in (1, 2, 4, 8):
+            isolated.add_wall(19, 7, wall)
+        return [
+            ('symmetry', asymmetric, self.path),
+            ('border', border, self.path),
+            ('reserved', reserved, self.path),
+            ('connectivity', isolated, ""),
+            ('path', grid, self.path[:-1]),
+            ('path', grid, "W" + self.path),
+        ]
+
+    def test_generated_maze_is_valid(self) -> None:
+        """Test that a generated maze passes every check."""
+        report = self._validate(self.generator.grid, self.path, 'python')
+        self.assertTrue(report.ok, report.errors)
+        self.assertEqual(len(report.checks), 6)
+        report.raise_if_invalid()
+
+    def test_defects_are_reported(self) -> None:
+        """Test that each kind of defect fails its check."""
+        for check, grid, path in self._broken_mazes():
+            report = self._validate(grid, path, 'python')
+            self.assertFalse(report.checks[check], check)
+            with self.assertRaises(ValueError):
+                report.raise_if_invalid()
+
+    def test_open_area(self) -> None:
+        """Test that a fully open 3x3 block is found."""
+        grid = MazeGrid(3, 3)
+        for y in range(3):
+            for x in range(3):
+                if x < 2:
+                    grid.remove_wall(x, y, MazeGrid.WALL_E)
+                if y < 2:
+                    grid.remove_wall(x, y, MazeGrid.WALL_S)
+        report = validate_maze(grid, (0, 0), (2, 2), backend='python')
+        self.assertEqual(list(report.errors), ['open_areas'])
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_numpy_backend_agrees(self) -> None:
+        """Test that both backends report the same problems."""
+        mazes = [('', self.generator.grid, self.path)]
+        for _, grid, path in mazes + self._broken_mazes():
+            expected = self._validate(grid, path, 'python')
+            report = self._validate(grid, path, 'numpy')
+            self.assertEqual(report.errors, expected.errors)
+
+    def test_unknown_backend(self) -> None:
+        """Test that an unknown backend is rejected."""
+        with self.assertRaises(ValueError):
+            self._validate(self.generator.grid, self.path, 'gpu')
+
+
+class TestMazeServer(unittest.TestCase):
+    """Tests for the JSON lines maze service."""
+
+    async def _exchange(
+        self, server: MazeServer, requests: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Sends every request on one connection, returns the answers."""
+        listener = await server.start_tcp("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection(
+                "127.0.0.1", port
+            )
+            for request in requests:
+                writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            answers = [
+                json.loads(await reader.readline()) for _ in requests
+            ]
+            writer.close()
+            await writer.wait_closed()
+        return sorted(answers, key=lambda answer: str(answer['id']))
+
+    def test_generate_solve_and_stats(self) -> None:
+        """Test the operations, coalescing and error answers."""
+        config = {'WIDTH': 12, 'HEIGHT': 9, 'SEED': 7}
+        server = MazeServer(jobs=1)
+        try:
+            first, second, bad = asyncio.run(self._exchange(server, [
+                {'id': 1, 'op': 'generate', 'config': config},
+                {'id': 2, 'op': 'generate', 'config': config},
+                {'id': 3, 'op': 'fly'},
+            ]))
+            self.assertTrue(first['ok'])
+            self.assertEqual(first['result'], second['result'])
+            self.assertFalse(bad['ok'])
+            self.assertEqual(
+                server.counters['coalesced'] + server.counters['cache_hits'],
+                1
+            )
+
+            maze = first['result']
+            solved, stats = asyncio.run(self._exchange(server, [
+                {'id': 4, 'op': 'solve', 'strategy': 'astar', 'maze': {
+                    'rows': maze['rows'], 'entry': maze['entry'],
+                    'exit': maze['exit'],
+                }},
+                {'id': 5, 'op': 'stats'},
+            ]))
+        finally:
+            server.close()
+        self.assertEqual(
+            len(solved['result']['path']), len(maze['path'])
+        )
+        latency = stats['result']['latency']['generate']
+        self.assertEqual(latency['count'], 2)
+        self.assertLessEqual(latency['p50_ms'], latency['p99_ms'])
+
+    def test_export_stays_in_output_dir(self) -> None:
+        """Test that exports outside the output directory are refused."""
+        config = {'WIDTH': 8, 'HEIGHT': 6, 'SEED': 2}
+        with tempfile.TemporaryDirectory() as work_dir:
+            out_dir = os.path.join(work_dir, "out")
+            os.mkdir(out_dir)
+            server = MazeServer(jobs=1, output_dir=out_dir)
+            outside = os.path.join(work_dir, "outside.txt")
+            try:
+                answers = asyncio.run(self._exchange(server, [
+                    {'id': 1, 'op': 'export', 'config': config,
+                     'output': outside},
+                    {'id': 2, 'op': 'export', 'config': config,
+                     'output': "../outside.txt"},
+                    {'id': 3, 'op': 'export', 'config': config,
+                     'output': "sub/../maze.txt"},
+                ]))
+            finally:
+                server.close()
+            self.assertFalse(answers[0]['ok'])
+            self.assertFalse(answers[1]['ok'])
+            self.assertTrue(answers[2]['ok'])
+            self.assertFalse(os.path.exists(outside))
+            self.assertTrue(os.path.exists(os.path.join(out_dir, "maze.txt")))
+
+
+class TestProfiler(unittest.TestCase):
+    """Tests for the phase instrumentation."""
+
+    def test_records_nested_phases(self) -> None:
+        """Test that generate and solve spans are recorded."""
+        config: Dict[str, Any] = {
+            'WIDTH': 12, 'HEIGHT': 9, 'PERFECT': False, 'SEED': 2
+        }
+        with Profiler() as profiler:
+            generator = MazeGenerator(config)
+            generator.generate()
+            MazeSolver(
+                generator.grid, 12, 9, generator.entry, generator.exit
+            ).find_shortest_path()
+        self.assertIsNone(get_profiler())
+        names = [record['name'] for record in profiler.spans]
+        self.assertEqual(
+            names, ['carve', 'embed_42', 'make_imperfect', 'solve']
+        )
+        self.assertEqual(profiler.spans[1]['depth'], 1)
+        self.assertEqual(profiler.phases()['carve']['cells'], 108)
+
+    def test_disabled_span_is_shared_noop(self) -> None:
+        """Test that spans cost no allocation while disabled."""
+        self.assertIs(span('a'), span('b', 10))
+
 
 if __name__ == "__main__":
     unittest.main()
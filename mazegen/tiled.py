@@ -0,0 +1,230 @@
+"""
+Module for generating giant mazes tile by tile across several processes.
+"""
+
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    from .generator import MazeGenerator
+
+# Wall bitmasks, identical to the ones used by MazeGenerator
+WALL_N = 1
+WALL_E = 2
+WALL_S = 4
+WALL_W = 8
+
+# Tile bounds: (x0, y0, x1, y1), end coordinates excluded
+Tile = Tuple[int, int, int, int]
+
+
+def split_tiles(width: int, height: int, tiles: int) -> List[Tile]:
+    """Splits the grid into at most ``tiles`` x ``tiles`` rectangles."""
+    cols = max(1, min(tiles, width))
+    rows = max(1, min(tiles, height))
+    xs = [width * i // cols for i in range(cols + 1)]
+    ys = [height * j // rows for j in range(rows + 1)]
+    return [
+        (xs[i], ys[j], xs[i + 1], ys[j + 1])
+        for j in range(rows) for i in range(cols)
+    ]
+
+
+def carve_tile(
+    cells: Union[bytearray, memoryview],
+    width: int,
+    tile: Tile,
+    reserved: Sequence[Tuple[int, int]],
+    seed: int
+) -> 'array[int]':
+    """
+    Carves a spanning forest inside one tile with a Recursive Backtracker.
+
+    Only cells inside the tile are written, so several tiles can be
+    carved into the same buffer at once. Every connected part of the
+    tile gets its own tree.
+
+    Args:
+        cells: The whole maze buffer, all walls closed.
+        width: Maze width in cells.
+        tile: (x0, y0, x1, y1) bounds of the tile.
+        reserved: Cells that must stay closed.
+        seed: Seed of this tile's random source.
+
+    Returns:
+        Flat (cell_index, component) pairs for the tile's border cells.
+    """
+    x0, y0, x1, y1 = tile
+    tile_w = x1 - x0
+    rng = random.Random(seed)
+    # Per-tile component label + 1 (0 means not visited yet)
+    component = array('i', [0]) * (tile_w * (y1 - y0))
+    for x, y in reserved:
+        if x0 <= x < x1 and y0 <= y < y1:
+            component[(y - y0) * tile_w + (x - x0)] = -1
+
+    label = 0
+    for local_start in range(len(component)):
+        if component[local_start]:
+            continue
+        label += 1
+        component[local_start] = label
+        stack = [local_start]
+        while stack:
+            local = stack[-1]
+            lx, ly = local % tile_w, local // tile_w
+            options = []
+            if ly > 0 and not component[local - tile_w]:
+                options.append((local - tile_w, -width, WALL_N, WALL_S))
+            if lx < tile_w - 1 and not component[local + 1]:
+                options.append((local + 1, 1, WALL_E, WALL_W))
+            if ly < y1 - y0 - 1 and not component[local + tile_w]:
+                options.append((local + tile_w, width, WALL_S, WALL_N))
+            if lx > 0 and not component[local - 1]:
+                options.append((local - 1, -1, WALL_W, WALL_E))
+            if not options:
+                stack.pop()
+                continue
+            n_local, offset, wall, opp_wall = rng.choice(options)
+            idx = (y0 + ly) * width + x0 + lx
+            cells[idx] &= ~wall
+            cells[idx + offset] &= ~opp_wall
+            component[n_local] = label
+            stack.append(n_local)
+
+    # Only the tile's outer ring can touch a seam
+    tile_h = y1 - y0
+    edge = set(range(tile_w))
+    edge.update(range((tile_h - 1) * tile_w, len(component)))
+    edge.update(ly * tile_w for ly in range(tile_h))
+    edge.update(ly * tile_w + tile_w - 1 for ly in range(tile_h))
+    border = array('i')
+    for local in sorted(edge):
+        if component[local] > 0:
+            ly, lx = divmod(local, tile_w)
+            border.append((y0 + ly) * width + x0 + lx)
+            border.append(component[local])
+    return border
+
+
+def _buffer(block: shared_memory.SharedMemory) -> memoryview:
+    """Returns the buffer of an open shared memory block."""
+    if block.buf is None:
+        raise RuntimeError("Shared memory block is already closed.")
+    return block.buf
+
+
+def _carve_shared_tile(
+    job: Tuple[str, int, Tile, Sequence[Tuple[int, int]], int]
+) -> 'array[int]':
+    """Worker entry point: carves one tile inside a shared memory block."""
+    name, width, tile, reserved, seed = job
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        return carve_tile(_buffer(block), width, tile, reserved, seed)
+    finally:
+        block.close()
+
+
+def carve_tiled(generator: 'MazeGenerator') -> None:
+    """
+    Generates a perfect maze from independently carved tiles.
+
+    The grid is split into TILES x TILES tiles. Each tile is carved in a
+    worker process directly inside a shared memory copy of the grid,
+    then the tiles are joined by a random spanning tree over the walls
+    along the seams, so the result is still a single perfect maze. Tile
+    seeds are drawn from the generator's random source, so the maze only
+    depends on SEED and TILES, not on the number of workers.
+    """
+    width, height = generator.width, generator.height
+    size = width * height
+    generator._embed_42()
+    reserved = generator._pattern_cells()
+    tiles = split_tiles(width, height, generator.tiles)
+    seeds = [generator.rng.getrandbits(63) for _ in tiles]
+    jobs = min(generator.jobs or os.cpu_count() or 1, len(tiles))
+
+    cells = generator.grid.cells
+    results: List['array[int]']
+    if jobs <= 1 or size == 0:
+        results = [
+            carve_tile(cells, width, tile, reserved, seed)
+            for tile, seed in zip(tiles, seeds)
+        ]
+    else:
+        block = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            _buffer(block)[:size] = cells
+            work = [
+                (block.name, width, tile, reserved, seed)
+                for tile, seed in zip(tiles, seeds)
+            ]
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = list(executor.map(_carve_shared_tile, work))
+            cells[:] = _buffer(block)[:size]
+        finally:
+            block.close()
+            block.unlink()
+
+    _stitch(generator, tiles, results)
+
+
+def _stitch(
+    generator: 'MazeGenerator',
+    tiles: List[Tile],
+    results: List['array[int]']
+) -> None:
+    """Opens one seam wall per pair of tile components to be joined."""
+    width = generator.width
+    cells = generator.grid.cells
+
+    # Global union-find id of the component owning each border cell
+    owner: Dict[int, int] = {}
+    next_id = 0
+    for border in results:
+        base = next_id
+        for i in range(0, len(border), 2):
+            owner[border[i]] = base + border[i + 1] - 1
+            next_id = max(next_id, base + border[i + 1])
+
+    # Candidate seam walls: (cell_index, 0 for east / 1 for south)
+    x_seams = sorted({x0 for x0, _, _, _ in tiles if x0 > 0})
+    y_seams = sorted({y0 for _, y0, _, _ in tiles if y0 > 0})
+    seams: List[Tuple[int, int]] = []
+    for x in x_seams:
+        for y in range(generator.height):
+            idx = y * width + x - 1
+            if idx in owner and idx + 1 in owner:
+                seams.append((idx, 0))
+    for y in y_seams:
+        for x in range(width):
+            idx = (y - 1) * width + x
+            if idx in owner and idx + width in owner:
+                seams.append((idx, 1))
+    generator.rng.shuffle(seams)
+
+    parent = array('i', range(next_id))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for idx, kind in seams:
+        other = idx + width if kind else idx + 1
+        root_a, root_b = find(owner[idx]), find(owner[other])
+        if root_a == root_b:
+            continue
+        parent[root_a] = root_b
+        if kind:
+            cells[idx] &= ~WALL_S
+            cells[other] &= ~WALL_N
+        else:
+            cells[idx] &= ~WALL_E
+            cells[other] &= ~WALL_W
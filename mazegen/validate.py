@@ -0,0 +1,590 @@
+"""
+Module for checking the structural invariants of a maze in bulk.
+
+Each check works on whole rows or on the whole grid at once: wall bits
+are turned into 0/1 flag strings with ``bytes.translate`` and combined
+as big integers (one byte per cell), or as NumPy boolean arrays when
+NumPy is installed. Only the connectivity check of the pure Python
+backend and its path walk visit cells one at a time.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .grid import GridLike, MazeGrid
+from .generator import pattern_cells
+from .profiling import span
+
+# Names of the checks, in the order they run
+CHECKS = (
+    'symmetry', 'border', 'reserved', 'open_areas', 'connectivity', 'path'
+)
+BACKENDS = ('auto', 'python', 'numpy')
+
+WALL_N = MazeGrid.WALL_N
+WALL_E = MazeGrid.WALL_E
+WALL_S = MazeGrid.WALL_S
+WALL_W = MazeGrid.WALL_W
+
+# Path moves: (dx, dy, wall crossed)
+_MOVES = {
+    'N': (0, -1, WALL_N), 'E': (1, 0, WALL_E),
+    'S': (0, 1, WALL_S), 'W': (-1, 0, WALL_W),
+}
+
+
+def _flag_table(wall: int, closed: bool) -> bytes:
+    """Maps wall values to 1 where ``wall`` is closed (or open), else 0."""
+    return bytes(
+        1 if bool(value & wall) == closed else 0 for value in range(256)
+    )
+
+
+_CLOSED_N = _flag_table(WALL_N, True)
+_CLOSED_E = _flag_table(WALL_E, True)
+_CLOSED_S = _flag_table(WALL_S, True)
+_CLOSED_W = _flag_table(WALL_W, True)
+_OPEN_E = _flag_table(WALL_E, False)
+_OPEN_S = _flag_table(WALL_S, False)
+
+
+def _as_int(flags: bytes) -> int:
+    """Packs a flag string into an integer, one byte per cell."""
+    return int.from_bytes(flags, 'little')
+
+
+def _first_flag(value: int) -> int:
+    """Returns the index of the first non-zero cell of a packed integer."""
+    # The lowest set bit belongs to the first flagged cell
+    return ((value & -value).bit_length() - 1) // 8
+
+
+class ValidationReport:
+    """
+    Outcome of ``validate_maze``.
+
+    ``checks`` maps every check that ran to True (passed) or False, and
+    ``errors`` holds the first problem found by each failed check.
+    """
+
+    def __init__(self, width: int, height: int, backend: str) -> None:
+        """
+        Initializes an empty report.
+
+        Args:
+            width: Maze width in cells.
+            height: Maze height in cells.
+            backend: 'python' or 'numpy', the backend that ran.
+        """
+        self.width = width
+        self.height = height
+        self.backend = backend
+        self.checks: Dict[str, bool] = {}
+        self.errors: Dict[str, str] = {}
+        self.seconds = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True when every check that ran passed."""
+        return not self.errors
+
+    def record(self, check: str, error: Optional[str]) -> None:
+        """Stores the outcome of one check; ``error`` is None on success."""
+        self.checks[check] = error is None
+        if error is not None:
+            self.errors[check] = error
+
+    def raise_if_invalid(self) -> None:
+        """
+        Raises:
+            ValueError: Listing every failed check, if any failed.
+        """
+        if self.errors:
+            details = "; ".join(
+                f"{check}: {error}" for check, error in self.errors.items()
+            )
+            raise ValueError(f"Invalid maze. {details}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the report as a JSON-ready dictionary."""
+        return {
+            'ok': self.ok,
+            'width': self.width,
+            'height': self.height,
+            'backend': self.backend,
+            'seconds': round(self.seconds, 6),
+            'checks': dict(self.checks),
+            'errors': dict(self.errors),
+        }
+
+    def __repr__(self) -> str:
+        """Returns a short summary of the report."""
+        failed = ", ".join(self.errors) or "none"
+        return f"ValidationReport(ok={self.ok}, failed={failed})"
+
+
+def validate_maze(
+    grid: GridLike,
+    entry: Tuple[int, int],
+    exit_pos: Tuple[int, int],
+    path: Optional[str] = None,
+    reserved: Optional[Iterable[Tuple[int, int]]] = None,
+    backend: str = 'auto'
+) -> ValidationReport:
+    """
+    Checks the structural invariants of a maze.
+
+    * symmetry: every wall is closed on both sides or open on both.
+    * border: the outer border is closed.
+    * reserved: the '42' cells (or ``reserved``) are fully closed.
+    * open_areas: no 3x3 block of cells has all its inner walls open.
+    * connectivity: every other cell is reachable from the entry
+      through walls open on both sides.
+    * path: ``path`` leads from entry to exit without crossing a wall
+      (skipped when ``path`` is None).
+
+    Args:
+        grid: The maze, as a MazeGrid or a list of rows.
+        entry: (x, y) coordinates of the entry.
+        exit_pos: (x, y) coordinates of the exit.
+        path: The solution string to check, e.g. 'EESW'.
+        reserved: Cells that must stay closed, by default the '42'
+            pattern of a maze of this size.
+        backend: 'numpy', 'python', or 'auto' to use NumPy when it is
+            installed.
+
+    Returns:
+        A ValidationReport; call ``raise_if_invalid()`` to turn failures
+        into an exception.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If backend is 'numpy' and NumPy is not installed.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend '{backend}'. "
+            f"Expected one of: {', '.join(BACKENDS)}."
+        )
+    if backend == 'auto':
+        try:
+            import numpy  # noqa: F401
+            backend = 'numpy'
+        except ImportError:
+            backend = 'python'
+
+    maze = MazeGrid.coerce(grid)
+    width, height = maze.width, maze.height
+    if reserved is None:
+        reserved = pattern_cells(width, height)
+    reserved_cells = sorted(
+        (x, y) for x, y in reserved if 0 <= x < width and 0 <= y < height
+    )
+
+    report = ValidationReport(width, height, backend)
+    started = time.perf_counter()
+    with span('validate', width * height):
+        if width == 0 or height == 0:
+            report.record('symmetry', "The maze is empty.")
+        elif backend == 'numpy':
+            _NumpyChecks(maze).run(report, entry, exit_pos, path,
+                                   reserved_cells)
+        else:
+            _PythonChecks(maze).run(report, entry, exit_pos, path,
+                                    reserved_cells)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+class _Checks(ABC):
+    """Checks shared by both backends, and the order they run in."""
+
+    def __init__(self, maze: MazeGrid) -> None:
+        """Stores the maze being validated."""
+        self.maze = maze
+        self.width = maze.width
+        self.height = maze.height
+
+    def run(
+        self,
+        report: ValidationReport,
+        entry: Tuple[int, int],
+        exit_pos: Tuple[int, int],
+        path: Optional[str],
+        reserved: List[Tuple[int, int]]
+    ) -> None:
+        """Runs every check and records it in ``report``."""
+        report.record('symmetry', self.symmetry())
+        report.record('border', self.border())
+        report.record('reserved', self._reserved(reserved))
+        report.record('open_areas', self.open_areas())
+        report.record('connectivity', self._connectivity(entry, reserved))
+        if path is not None:
+            report.record('path', self._path(entry, exit_pos, path))
+
+    def _cell_name(self, idx: int) -> str:
+        """Formats a flat index as '(x, y)'."""
+        return f"({idx % self.width}, {idx // self.width})"
+
+    def _reserved(self, reserved: List[Tuple[int, int]]) -> Optional[str]:
+        """Checks that every reserved cell is fully closed."""
+        for x, y in reserved:
+            if self.maze.get(x, y) != MazeGrid.ALL_WALLS:
+                return f"Reserved cell ({x}, {y}) is not closed."
+        return None
+
+    def _connectivity(
+        self, entry: Tuple[int, int], reserved: List[Tuple[int, int]]
+    ) -> Optional[str]:
+        """Checks that every unreserved cell is reachable from entry."""
+        x, y = entry
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return f"The entry ({x}, {y}) is outside the maze."
+        start = y * self.width + x
+        blocked = {cy * self.width + cx for cx, cy in reserved}
+        if start in blocked:
+            return f"The entry ({x}, {y}) is a reserved cell."
+        unreached = self.unreached(start, blocked)
+        if unreached != -1:
+            return (
+                f"Cell {self._cell_name(unreached)} cannot be reached "
+                "from the entry."
+            )
+        return None
+
+    def _path(
+        self, entry: Tuple[int, int], exit_pos: Tuple[int, int], path: str
+    ) -> Optional[str]:
+        """Checks that the path leads from entry to exit through walls."""
+        if path.encode('ascii', 'replace').translate(None, b"NESW"):
+            return "Path contains characters other than NESW."
+        if not path:
+            if tuple(entry) == tuple(exit_pos):
+                return None
+            return "Path is empty."
+        return self.walk(entry, exit_pos, path)
+
+    @abstractmethod
+    def symmetry(self) -> Optional[str]:
+        """Checks that neighbours agree on the wall between them."""
+
+    @abstractmethod
+    def border(self) -> Optional[str]:
+        """Checks that the outer border is closed."""
+
+    @abstractmethod
+    def open_areas(self) -> Optional[str]:
+        """Checks that no 3x3 block is left without inner walls."""
+
+    @abstractmethod
+    def unreached(self, start: int, blocked: Iterable[int]) -> int:
+        """Returns an unblocked cell not reachable from start, or -1."""
+
+    @abstractmethod
+    def walk(
+        self, entry: Tuple[int, int], exit_pos: Tuple[int, int], path: str
+    ) -> Optional[str]:
+        """Follows a non-empty path and reports the first bad step."""
+
+
+class _PythonChecks(_Checks):
+    """Pure Python checks on 0/1 flag strings packed into integers."""
+
+    def __init__(self, maze: MazeGrid) -> None:
+        """Computes the per-cell wall flags once for every check."""
+        super().__init__(maze)
+        cells = bytes(maze.cells)
+        self.size = len(cells)
+        self.closed_n = cells.translate(_CLOSED_N)
+        self.closed_e = cells.translate(_CLOSED_E)
+        self.closed_s = cells.translate(_CLOSED_S)
+        self.closed_w = cells.translate(_CLOSED_W)
+        self.cells = cells
+
+    def _column_mask(self, columns: int) -> int:
+        """Packed flags set on the first ``columns`` cells of each row."""
+        columns = max(0, min(columns, self.width))
+        row = b"\x01" * columns + b"\x00" * (self.width - columns)
+        return _as_int(row * self.height)
+
+    def symmetry(self) -> Optional[str]:
+        """Compares east/west and south/north flags of neighbours."""
+        width = self.width
+        # East wall of each cell against the west wall of the next one,
+        # ignoring the last cell of each row
+        east = _as_int(self.closed_e[:-1])
+        west = _as_int(self.closed_w[1:])
+        mismatch = (east ^ west) & self._column_mask(width - 1)
+        if mismatch:
+            idx = _first_flag(mismatch)
+            return (
+                f"East wall of {self._cell_name(idx)} does not match "
+                "its neighbour."
+            )
+        south = self.closed_s[:-width]
+        north = self.closed_n[width:]
+        if south != north:
+            idx = _first_flag(_as_int(south) ^ _as_int(north))
+            return (
+                f"South wall of {self._cell_name(idx)} does not match "
+                "its neighbour."
+            )
+        return None
+
+    def border(self) -> Optional[str]:
+        """Checks the four sides with strided slices of the flags."""
+        width = self.width
+        # (side, flags along it, first cell index, index step)
+        sides = (
+            ("North", self.closed_n[:width], 0, 1),
+            ("South", self.closed_s[-width:], self.size - width, 1),
+            ("West", self.closed_w[::width], 0, width),
+            ("East", self.closed_e[width - 1::width], width - 1, width),
+        )
+        for name, flags, first, step in sides:
+            gap = flags.find(0)
+            if gap != -1:
+                idx = first + gap * step
+                return f"{name} border is open at {self._cell_name(idx)}."
+        return None
+
+    def open_areas(self) -> Optional[str]:
+        """Finds 3x3 blocks with every inner wall open, all at once."""
+        width = self.width
+        if width < 3 or self.height < 3:
+            return None
+        row = 8 * width  # Bits between a cell and the one below it
+        cells = self.cells
+        open_e = _as_int(cells.translate(_OPEN_E))
+        open_s = _as_int(cells.translate(_OPEN_S))
+        # Blocks starting at columns 0 .. width - 3
+        mask = self._column_mask(width - 2)
+        # Cells x and x + 1 both open to the east
+        pairs = open_e & (open_e >> 8) & mask
+        # Cells x, x + 1 and x + 2 all open to the south
+        triples = open_s & (open_s >> 8) & (open_s >> 16) & mask
+        blocks = pairs & (pairs >> row) & (pairs >> 2 * row) \
+            & triples & (triples >> row)
+        if blocks:
+            idx = _first_flag(blocks)
+            return f"The 3x3 block at {self._cell_name(idx)} is fully open."
+        return None
+
+    def unreached(self, start: int, blocked: Iterable[int]) -> int:
+        """Breadth-first search through walls open on both sides."""
+        width, size = self.width, self.size
+        cells = self.cells
+        seen = bytearray(size)
+        for idx in blocked:
+            seen[idx] = 1
+        seen[start] = 1
+        queue = array('i', [start])
+        head = 0
+        while head < len(queue):
+            idx = queue[head]
+            head += 1
+            cell = cells[idx]
+            x = idx % width
+            if not cell & WALL_N and idx >= width \
+                    and not seen[idx - width] \
+                    and not cells[idx - width] & WALL_S:
+                seen[idx - width] = 1
+                queue.append(idx - width)
+            if not cell & WALL_E and x < width - 1 \
+                    and not seen[idx + 1] and not cells[idx + 1] & WALL_W:
+                seen[idx + 1] = 1
+                queue.append(idx + 1)
+            if not cell & WALL_S and idx + width < size \
+                    and not seen[idx + width] \
+                    and not cells[idx + width] & WALL_N:
+                seen[idx + width] = 1
+                queue.append(idx + width)
+            if not cell & WALL_W and x > 0 \
+                    and not seen[idx - 1] and not cells[idx - 1] & WALL_E:
+                seen[idx - 1] = 1
+                queue.append(idx - 1)
+        return seen.find(0)
+
+    def walk(
+        self, entry: Tuple[int, int], exit_pos: Tuple[int, int], path: str
+    ) -> Optional[str]:
+        """Follows the path one move at a time."""
+        width, height = self.width, self.height
+        cells = self.cells
+        x, y = entry
+        if not (0 <= x < width and 0 <= y < height):
+            return f"The entry ({x}, {y}) is outside the maze."
+        for step, char in enumerate(path):
+            dx, dy, wall = _MOVES[char]
+            if cells[y * width + x] & wall:
+                return f"Path step {step} crosses a wall at ({x}, {y})."
+            x, y = x + dx, y + dy
+            if not (0 <= x < width and 0 <= y < height):
+                return f"Path step {step} leaves the maze."
+        if (x, y) != tuple(exit_pos):
+            return f"Path ends at ({x}, {y}), not at the exit."
+        return None
+
+
+class _NumpyChecks(_Checks):
+    """Vectorized checks on a zero-copy (height, width) NumPy view."""
+
+    def __init__(self, maze: MazeGrid) -> None:
+        """Builds the boolean wall arrays once for every check."""
+        super().__init__(maze)
+        import numpy as np
+        self.np = np
+        cells = maze.to_numpy()
+        self.cells = cells
+        self.closed_n = (cells & WALL_N) != 0
+        self.closed_e = (cells & WALL_E) != 0
+        self.closed_s = (cells & WALL_S) != 0
+        self.closed_w = (cells & WALL_W) != 0
+
+    def _first(self, flags: Any, column_offset: int = 0) -> str:
+        """Formats the first True cell of a 2D boolean array."""
+        y, x = self.np.argwhere(flags)[0]
+        return f"({int(x) + column_offset}, {int(y)})"
+
+    def symmetry(self) -> Optional[str]:
+        """Compares neighbouring wall arrays element-wise."""
+        mismatch = self.closed_e[:, :-1] != self.closed_w[:, 1:]
+        if mismatch.any():
+            return (
+                f"East wall of {self._first(mismatch)} does not match "
+                "its neighbour."
+            )
+        mismatch = self.closed_s[:-1] != self.closed_n[1:]
+        if mismatch.any():
+            return (
+                f"South wall of {self._first(mismatch)} does not match "
+                "its neighbour."
+            )
+        return None
+
+    def border(self) -> Optional[str]:
+        """Checks the four edge rows and columns."""
+        width = self.width
+        # (side, flags along it, first cell index, index step)
+        sides = (
+            ("North", self.closed_n[0], 0, 1),
+            ("South", self.closed_s[-1], (self.height - 1) * width, 1),
+            ("West", self.closed_w[:, 0], 0, width),
+            ("East", self.closed_e[:, -1], width - 1, width),
+        )
+        for name, flags, first, step in sides:
+            if not flags.all():
+                idx = first + int(self.np.argmin(flags)) * step
+                return f"{name} border is open at {self._cell_name(idx)}."
+        return None
+
+    def open_areas(self) -> Optional[str]:
+        """Combines shifted open-wall arrays into per-block flags."""
+        if self.width < 3 or self.height < 3:
+            return None
+        open_e = ~self.closed_e
+        open_s = ~self.closed_s
+        pairs = open_e[:, :-2] & open_e[:, 1:-1]
+        triples = open_s[:, :-2] & open_s[:, 1:-1] & open_s[:, 2:]
+        blocks = pairs[:-2] & pairs[1:-1] & pairs[2:] \
+            & triples[:-2] & triples[1:-1]
+        if blocks.any():
+            return f"The 3x3 block at {self._first(blocks)} is fully open."
+        return None
+
+    def unreached(self, start: int, blocked: Iterable[int]) -> int:
+        """
+        Labels connected components by hooking and pointer jumping.
+
+        Each round hooks the root of one end of every edge still joining
+        two components onto the smaller root, then compresses every
+        cell straight to its root, so the number of rounds grows with
+        the logarithm of the maze size rather than with its diameter.
+        """
+        np = self.np
+        width, height = self.width, self.height
+        size = width * height
+        dtype = np.int32 if size < 2 ** 31 else np.int64
+        index = np.arange(size, dtype=dtype).reshape(height, width)
+
+        # Only walls open on both sides join two cells
+        open_e = ~(self.closed_e[:, :-1] | self.closed_w[:, 1:])
+        open_s = ~(self.closed_s[:-1] | self.closed_n[1:])
+        first = np.concatenate(
+            (index[:, :-1][open_e], index[:-1][open_s])
+        )
+        second = np.concatenate(
+            (index[:, 1:][open_e], index[1:][open_s])
+        )
+
+        parent = index.ravel().copy()
+        while first.size:
+            root_a, root_b = parent[first], parent[second]
+            joining = root_a != root_b
+            if not joining.any():
+                break
+            first, second = first[joining], second[joining]
+            root_a, root_b = root_a[joining], root_b[joining]
+            # Any smaller root is a valid target, so no cycle can form
+            parent[np.maximum(root_a, root_b)] = np.minimum(root_a, root_b)
+            while True:
+                jumped = parent[parent]
+                if np.array_equal(jumped, parent):
+                    break
+                parent = jumped
+
+        reached = parent == parent[start]
+        blocked_list = list(blocked)
+        if blocked_list:
+            reached[np.array(blocked_list, dtype=dtype)] = True
+        if reached.all():
+            return -1
+        return int(np.argmin(reached))
+
+    def walk(
+        self, entry: Tuple[int, int], exit_pos: Tuple[int, int], path: str
+    ) -> Optional[str]:
+        """Computes every position with cumulative sums of the moves."""
+        np = self.np
+        width, height = self.width, self.height
+        x0, y0 = entry
+        if not (0 <= x0 < width and 0 <= y0 < height):
+            return f"The entry ({x0}, {y0}) is outside the maze."
+
+        codes = np.frombuffer(path.encode('ascii'), dtype=np.uint8)
+        dx_table = np.zeros(256, dtype=np.int64)
+        dy_table = np.zeros(256, dtype=np.int64)
+        wall_table = np.zeros(256, dtype=np.uint8)
+        for char, (dx, dy, wall) in _MOVES.items():
+            dx_table[ord(char)] = dx
+            dy_table[ord(char)] = dy
+            wall_table[ord(char)] = wall
+
+        # Position after each move
+        xs = x0 + np.cumsum(dx_table[codes])
+        ys = y0 + np.cumsum(dy_table[codes])
+        outside = (xs < 0) | (xs >= width) | (ys < 0) | (ys >= height)
+        # Position before each move
+        before_x = np.concatenate(([x0], xs[:-1]))
+        before_y = np.concatenate(([y0], ys[:-1]))
+
+        last = len(path)
+        if outside.any():
+            last = int(np.argmax(outside))
+        # Steps up to and including the one leaving the maze start inside
+        checked = min(last + 1, len(path))
+        crossed = self.cells[before_y[:checked], before_x[:checked]] \
+            & wall_table[codes[:checked]]
+        if crossed.any():
+            step = int(np.argmax(crossed != 0))
+            return (
+                f"Path step {step} crosses a wall at "
+                f"({int(before_x[step])}, {int(before_y[step])})."
+            )
+        if last < len(path):
+            return f"Path step {last} leaves the maze."
+        end = (int(xs[-1]), int(ys[-1]))
+        if end != tuple(exit_pos):
+            return f"Path ends at ({end[0]}, {end[1]}), not at the exit."
+        return None
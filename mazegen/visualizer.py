@@ -2,9 +2,115 @@
 Module for visualizing the maze in the terminal using ASCII characters.
 """
 
-from typing import List, Dict, Any
+import math
+import re
+import shutil
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import groupby
+from typing import List, Dict, Any, Optional, Tuple
+from .analyzer import MazeAnalysis, MazeAnalyzer
 from .generator import MazeGenerator
+from .grid import MazeGrid
 from .solver import MazeSolver
+from .profiling import span
+
+
+def _wall_flags(wall: int) -> bytes:
+    """Builds a table mapping wall values to 1 (closed) or 0 (open)."""
+    return bytes(1 if value & wall else 0 for value in range(256))
+
+
+_FLAGS_N = _wall_flags(MazeGrid.WALL_N)
+_FLAGS_E = _wall_flags(MazeGrid.WALL_E)
+_FLAGS_S = _wall_flags(MazeGrid.WALL_S)
+_FLAGS_W = _wall_flags(MazeGrid.WALL_W)
+_FLAG_TO_CHAR = bytes.maketrans(b"\x00\x01", b" #")
+
+# Quarter-block glyphs indexed by quadrant bits: 1 top left, 2 top
+# right, 4 bottom left, 8 bottom right
+_QUADRANTS = " ▘▝▀▖▌▞▛▗▚▐▜▄▙▟█"
+_QUADRANT_CHARS = {bits: char for bits, char in enumerate(_QUADRANTS)}
+
+# Runs of symbols sharing a colour: walls, path dots, entry and exit
+_SPAN_PATTERN = re.compile(f'[█{_QUADRANTS[1:-1]}]+|·+|[SE]')
+
+
+def _cell_quadrants(value: int) -> int:
+    """
+    Returns the quadrant bits drawing one cell in a single character:
+    its top left corner post, its north and west walls, and a filled
+    bottom right quadrant when every wall of the cell is closed.
+    """
+    bits = 1
+    if value & MazeGrid.WALL_N:
+        bits |= 2
+    if value & MazeGrid.WALL_W:
+        bits |= 4
+    if value & MazeGrid.ALL_WALLS == MazeGrid.ALL_WALLS:
+        bits |= 8
+    return bits
+
+
+_CELL_TO_QUADRANTS = bytes(_cell_quadrants(value) for value in range(256))
+
+
+def _and_flags(left: bytes, right: bytes) -> bytes:
+    """Combines two equally long 0/1 flag strings with a bitwise AND."""
+    size = len(left)
+    both = int.from_bytes(left, 'little') & int.from_bytes(right, 'little')
+    return both.to_bytes(size, 'little')
+
+
+def _flag_chars(flags: bytes) -> str:
+    """Turns 0/1 wall flags into ' ' and '#' characters."""
+    return flags.translate(_FLAG_TO_CHAR).decode('ascii')
+
+
+def _join_line(even: str, odd: str) -> str:
+    """Interleaves two character strings into one canvas line."""
+    line = [''] * (len(even) + len(odd))
+    line[0::2] = even
+    line[1::2] = odd
+    return ''.join(line).replace('#', '█')
+
+
+def _wall_line(grid: MazeGrid, py: int, x0: int, x1: int) -> str:
+    """
+    Builds canvas line ``py`` between canvas columns ``2 * x0`` and
+    ``2 * x1``, reading only cells ``x0`` to ``x1 - 1`` of the one or two
+    grid rows it borders (and their outer neighbours). A wall is drawn
+    only when it is closed on both of its sides.
+    """
+    width, height = grid.width, grid.height
+    count = x1 - x0
+    closed = bytes([1]) * count
+    if py % 2 == 0:
+        # Horizontal walls between cell rows y - 1 and y
+        y = py // 2
+        above = bytes(grid.row(y - 1)[x0:x1]).translate(_FLAGS_S) \
+            if y > 0 else closed
+        below = bytes(grid.row(y)[x0:x1]).translate(_FLAGS_N) \
+            if y < height else closed
+        return _join_line('#' * (count + 1), _flag_chars(
+            _and_flags(above, below)
+        ))
+
+    row = grid.row(py // 2)
+    cells = bytes(row[x0:x1])
+    east = cells.translate(_FLAGS_E)
+    west = cells.translate(_FLAGS_W)
+    # Walls between neighbours, plus the walls at both ends
+    left = west[:1] if x0 == 0 else _and_flags(
+        bytes(row[x0 - 1:x0]).translate(_FLAGS_E), west[:1]
+    )
+    right = east[-1:] if x1 == width else _and_flags(
+        east[-1:], bytes(row[x1:x1 + 1]).translate(_FLAGS_W)
+    )
+    verticals = left + _and_flags(east[:-1], west[1:]) + right
+    return _join_line(_flag_chars(verticals), ' ' * count)
 
 
 class TerminalVisualizer:
@@ -22,20 +128,77 @@ class TerminalVisualizer:
     ]
     RESET = '\033[0m'
 
-    def __init__(self, config: Dict[str, Any]) -> None:
-        """Initializes the visualizer with the current config."""
+    # 256-colour backgrounds of the distance heatmap, near to far
+    HEAT = [
+        f'\033[48;5;{code}m' for code in (
+            21, 27, 33, 39, 45, 51, 50, 49, 48, 47, 46,
+            82, 118, 154, 190, 226, 220, 214, 208, 202, 196
+        )
+    ]
+
+    # Terminal lines above the canvas: title, underline and a blank line
+    HEADER_LINES = 3
+    # Terminal lines kept below the viewport for the status and menu
+    FOOTER_LINES = 11
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        generator: Optional[MazeGenerator] = None,
+        shortest_path: Optional[str] = None
+    ) -> None:
+        """
+        Initializes the visualizer with the current config.
+
+        Args:
+            config: Maze generation parameters, used when regenerating.
+            generator: An already generated maze to display first. When
+                omitted, a maze is generated from ``config``.
+            shortest_path: The solution of ``generator``'s maze; it is
+                solved here if omitted.
+        """
         self.config = config
         self.color_idx = 0
         self.show_path = False
-        self.generator = MazeGenerator(self.config)
+        self.show_heatmap = False
+        # Viewport: top left cell shown, and cells per character in the
+        # overview (0 for the detailed view)
+        self.view_x = 0
+        self.view_y = 0
+        self.zoom = 0
+        self.generator = generator or MazeGenerator(self.config)
         self.shortest_path = ""
-        self._generate_new_maze()
+        self._reset_cache()
+        if generator is None:
+            self._generate_new_maze()
+        elif shortest_path is None:
+            self._solve()
+        else:
+            self.shortest_path = shortest_path
+
+    def _reset_cache(self) -> None:
+        """Drops every cached layer; called whenever the maze changes."""
+        # Wall layer with the entry and exit, one string per canvas row
+        self._wall_rows: Optional[List[str]] = None
+        # Path layer: only the canvas rows the path goes through
+        self._path_rows: Optional[Dict[int, str]] = None
+        # Sorted canvas columns of the path cells, keyed by canvas row
+        self._marks: Optional[Dict[int, List[int]]] = None
+        # Coloured versions of both layers, keyed by colour index
+        self._colored_walls: Dict[int, List[str]] = {}
+        self._colored_path: Dict[int, Dict[int, str]] = {}
+        # Heatmap rows, keyed by colour index and path visibility
+        self._heat_rows: Dict[Tuple[int, bool], List[str]] = {}
+        self._analysis: Optional[MazeAnalysis] = None
 
     def _generate_new_maze(self) -> None:
         """Generates a new maze and solves it."""
         self.generator = MazeGenerator(self.config)
         self.generator.generate()
+        self._solve()
 
+    def _solve(self) -> None:
+        """Finds the shortest path of the current maze."""
         solver = MazeSolver(
             self.generator.grid,
             self.generator.width,
@@ -44,32 +207,18 @@ class TerminalVisualizer:
             self.generator.exit
         )
         self.shortest_path = solver.find_shortest_path()
+        self._reset_cache()
 
-    def _build_canvas(self) -> List[List[str]]:
+    def _build_wall_rows(self) -> List[str]:
         """
-        Builds a 2D text canvas of the maze.
-        Returns a grid of characters.
+        Builds the wall layer of the canvas, entry and exit included.
+        Returns one string per canvas row.
         """
         w, h = self.generator.width, self.generator.height
-        grid = self.generator.grid
-
-        # Create a blank canvas of walls: (2*h + 1) by (2*w + 1)
-        canvas = [['█' for _ in range(w * 2 + 1)] for _ in range(h * 2 + 1)]
-
-        for y in range(h):
-            for x in range(w):
-                cy, cx = y * 2 + 1, x * 2 + 1
-                canvas[cy][cx] = ' '  # The room itself
-
-                cell = grid[y][x]
-                if not (cell & MazeGenerator.WALL_N):
-                    canvas[cy - 1][cx] = ' '
-                if not (cell & MazeGenerator.WALL_S):
-                    canvas[cy + 1][cx] = ' '
-                if not (cell & MazeGenerator.WALL_E):
-                    canvas[cy][cx + 1] = ' '
-                if not (cell & MazeGenerator.WALL_W):
-                    canvas[cy][cx - 1] = ' '
+        grid = MazeGrid.coerce(self.generator.grid)
+
+        # Build the (2*h + 1) by (2*w + 1) canvas a whole row at a time
+        canvas = [list(_wall_line(grid, py, 0, w)) for py in range(2 * h + 1)]
 
         # Mark Entry (S) and Exit (E)
         ey, ex = self.generator.entry[1] * 2 + \
@@ -78,50 +227,453 @@ class TerminalVisualizer:
         xy, xx = self.generator.exit[1] * 2 + 1, self.generator.exit[0] * 2 + 1
         canvas[xy][xx] = 'E'
 
-        # Draw path if toggled
-        if self.show_path and self.shortest_path:
-            curr_x, curr_y = self.generator.entry
-            for step in self.shortest_path:
-                if step == 'N':
-                    curr_y -= 1
-                elif step == 'S':
-                    curr_y += 1
-                elif step == 'E':
-                    curr_x += 1
-                elif step == 'W':
-                    curr_x -= 1
+        return [''.join(line) for line in canvas]
 
+    def _path_marks(self) -> Dict[int, List[int]]:
+        """
+        Returns the canvas positions of the shortest path's cells: the
+        sorted columns crossed in each canvas row, computed once.
+        """
+        if self._marks is not None:
+            return self._marks
+        marks: Dict[int, List[int]] = {}
+        curr_x, curr_y = self.generator.entry
+        for step in self.shortest_path:
+            if step == 'N':
+                curr_y -= 1
+            elif step == 'S':
+                curr_y += 1
+            elif step == 'E':
+                curr_x += 1
+            elif step == 'W':
+                curr_x -= 1
+            marks.setdefault(curr_y * 2 + 1, []).append(curr_x * 2 + 1)
+        for columns in marks.values():
+            columns.sort()
+        self._marks = marks
+        return marks
+
+    def _build_path_rows(self, wall_rows: List[str]) -> Dict[int, str]:
+        """
+        Builds the path layer: the canvas rows crossed by the shortest
+        path, with the path drawn on top of the walls.
+        """
+        path_rows: Dict[int, str] = {}
+        for py, columns in self._path_marks().items():
+            line = list(wall_rows[py])
+            for px in columns:
                 # Mark path avoiding overwriting Entry/Exit chars
-                py, px = curr_y * 2 + 1, curr_x * 2 + 1
-                if canvas[py][px] not in ('S', 'E'):
-                    canvas[py][px] = '·'
+                if line[px] not in ('S', 'E'):
+                    line[px] = '·'
+            path_rows[py] = ''.join(line)
+        return path_rows
+
+    def _layers(self) -> Tuple[List[str], Dict[int, str]]:
+        """Returns the cached wall and path layers, building them once."""
+        if self._wall_rows is None:
+            self._wall_rows = self._build_wall_rows()
+        if self._path_rows is None:
+            self._path_rows = self._build_path_rows(self._wall_rows)
+        return self._wall_rows, self._path_rows
+
+    def _build_canvas(self) -> List[List[str]]:
+        """
+        Builds a 2D text canvas of the maze.
+        Returns a grid of characters.
+        """
+        wall_rows, path_rows = self._layers()
+        if self.show_path and self.shortest_path:
+            return [
+                list(path_rows.get(py, row))
+                for py, row in enumerate(wall_rows)
+            ]
+        return [list(row) for row in wall_rows]
+
+    def _colorize(self, row: str) -> str:
+        """Wraps each run of identical symbols in a single ANSI span."""
+        wall_color = self.COLORS[self.color_idx]
+        colors = {
+            '█': wall_color,
+            'S': self.COLORS[2],  # Green
+            'E': self.COLORS[1],  # Red
+            '·': self.COLORS[4],  # Blue
+        }
+
+        def paint(match: 're.Match[str]') -> str:
+            text = match.group()
+            # Quarter blocks of the overview are walls too
+            return f"{colors.get(text[0], wall_color)}{text}{self.RESET}"
+
+        return _SPAN_PATTERN.sub(paint, row)
+
+    def analysis(self) -> MazeAnalysis:
+        """Returns the metrics of the current maze, computed once."""
+        if self._analysis is None:
+            self._analysis = MazeAnalyzer(
+                self.generator.grid,
+                self.generator.width,
+                self.generator.height,
+                self.generator.entry,
+                self.generator.exit
+            ).analyze()
+        return self._analysis
+
+    def _cell_levels(
+        self, y: int, distances: 'array[int]', top: int
+    ) -> List[Optional[int]]:
+        """Returns the heat colour index of every cell of row ``y``."""
+        width = self.generator.width
+        if not 0 <= y < self.generator.height:
+            return [None] * width
+        scale = len(self.HEAT) - 1
+        return [
+            d * scale // top if d >= 0 else None
+            for d in distances[y * width:(y + 1) * width]
+        ]
 
-        return canvas
+    def _heat_row(
+        self, py: int, row: str, distances: 'array[int]', top: int
+    ) -> str:
+        """
+        Colours a canvas row, shading every open square (a cell, or the
+        gap between two cells) like its nearest neighbouring cell.
+        """
+        width = self.generator.width
+        # Cell rows touching this canvas row: one for a row of cells,
+        # the rows above and below for a row of horizontal walls
+        touching = [
+            self._cell_levels(y, distances, top)
+            for y in sorted({(py - 1) // 2, py // 2})
+        ]
+        levels: List[Optional[int]] = []
+        for px, char in enumerate(row):
+            level: Optional[int] = None
+            if char == ' ':
+                for cell_levels in touching:
+                    for x in {(px - 1) // 2, px // 2}:
+                        found = cell_levels[x] if 0 <= x < width else None
+                        if found is not None and (
+                                level is None or found < level):
+                            level = found
+            levels.append(level)
+
+        parts: List[str] = []
+        for level, run in groupby(zip(row, levels), key=lambda it: it[1]):
+            text = ''.join(char for char, _ in run)
+            if level is None:
+                parts.append(self._colorize(text))
+            else:
+                parts.append(f"{self.HEAT[level]}{text}{self.RESET}")
+        return ''.join(parts)
+
+    def _heat_frame_rows(self) -> List[str]:
+        """Returns the canvas rows with the distance heatmap applied."""
+        show_path = bool(self.show_path and self.shortest_path)
+        key = (self.color_idx, show_path)
+        rows = self._heat_rows.get(key)
+        if rows is None:
+            wall_rows, path_rows = self._layers()
+            distances = self.analysis().distances
+            top = max(1, max(distances))
+            rows = []
+            for py, row in enumerate(wall_rows):
+                if show_path:
+                    row = path_rows.get(py, row)
+                rows.append(self._heat_row(py, row, distances, top))
+            self._heat_rows[key] = rows
+        return rows
+
+    def _frame_rows(self) -> List[str]:
+        """Returns the coloured canvas rows, reusing cached layers."""
+        if self.show_heatmap:
+            return self._heat_frame_rows()
+        wall_rows, path_rows = self._layers()
+        colored = self._colored_walls.get(self.color_idx)
+        if colored is None:
+            colored = [self._colorize(row) for row in wall_rows]
+            self._colored_walls[self.color_idx] = colored
+        if not (self.show_path and self.shortest_path):
+            return colored
+
+        colored_path = self._colored_path.get(self.color_idx)
+        if colored_path is None:
+            colored_path = {
+                py: self._colorize(row) for py, row in path_rows.items()
+            }
+            self._colored_path[self.color_idx] = colored_path
+        frame = list(colored)
+        for py, row in colored_path.items():
+            frame[py] = row
+        return frame
+
+    def _fits_terminal(self) -> bool:
+        """Whether the whole canvas fits in the terminal."""
+        columns, lines = shutil.get_terminal_size()
+        return (
+            2 * self.generator.width + 1 <= columns
+            and 2 * self.generator.height + 1 + self.HEADER_LINES <= lines
+        )
+
+    def _view_window(self) -> Tuple[int, int, int, int]:
+        """
+        Clamps the viewport to the maze and returns the cells it shows,
+        as ``(x0, y0, x1, y1)`` with exclusive ends. The window is sized
+        from the terminal, less the header and the footer lines.
+        """
+        w, h = self.generator.width, self.generator.height
+        columns, lines = shutil.get_terminal_size()
+        lines -= self.HEADER_LINES + self.FOOTER_LINES
+        columns, lines = max(3, columns), max(3, lines)
+        if self.zoom:
+            # One character per sampled cell, one more for the border
+            across = (columns - 1) * self.zoom
+            down = (lines - 1) * self.zoom
+        else:
+            across, down = (columns - 1) // 2, (lines - 1) // 2
+        across, down = min(w, across), min(h, down)
+        self.view_x = min(max(0, self.view_x), w - across)
+        self.view_y = min(max(0, self.view_y), h - down)
+        return (
+            self.view_x, self.view_y,
+            self.view_x + across, self.view_y + down
+        )
+
+    def _window_lines(self, x0: int, y0: int, x1: int, y1: int) -> List[str]:
+        """
+        Returns the canvas lines of the cells ``x0..x1 - 1`` by
+        ``y0..y1 - 1``, built straight from the grid: the same text as
+        the matching slice of the full canvas, at a cost depending only
+        on the size of the window.
+        """
+        grid = MazeGrid.coerce(self.generator.grid)
+        marks: Dict[int, List[int]] = {}
+        if self.show_path and self.shortest_path:
+            marks = self._path_marks()
+        left, right = 2 * x0, 2 * x1
+        lines = []
+        for py in range(2 * y0, 2 * y1 + 1):
+            line = _wall_line(grid, py, x0, x1)
+            columns = marks.get(py)
+            if columns:
+                chars = list(line)
+                first = bisect_left(columns, left)
+                last = bisect_right(columns, right)
+                for px in columns[first:last]:
+                    chars[px - left] = '·'
+                line = ''.join(chars)
+            lines.append(line)
+
+        # Mark Entry (S) and Exit (E)
+        for char, (x, y) in (
+            ('S', self.generator.entry), ('E', self.generator.exit)
+        ):
+            if x0 <= x < x1 and y0 <= y < y1:
+                py, px = 2 * (y - y0) + 1, 2 * (x - x0) + 1
+                lines[py] = lines[py][:px] + char + lines[py][px + 1:]
+        return lines
+
+    def _overview_lines(
+        self, x0: int, y0: int, x1: int, y1: int, zoom: int
+    ) -> List[str]:
+        """
+        Returns a zoomed out view of cells ``x0..x1 - 1`` by
+        ``y0..y1 - 1``: one quarter-block character for every ``zoom``-th
+        cell of every ``zoom``-th row, drawing its corner post, its north
+        and west walls, and a filled quadrant when the cell is closed.
+        """
+        grid = MazeGrid.coerce(self.generator.grid)
+        w, h = self.generator.width, self.generator.height
+        marks: Dict[int, List[int]] = {}
+        if self.show_path and self.shortest_path:
+            marks = self._path_marks()
+        right_border = '▌' if x1 == w else ''
+        lines = []
+        for y in range(y0, y1, zoom):
+            cells = bytes(grid.row(y)[x0:x1:zoom])
+            line = cells.translate(_CELL_TO_QUADRANTS).decode('latin-1')
+            line = line.translate(_QUADRANT_CHARS) + right_border
+            columns = marks.get(2 * y + 1)
+            if columns:
+                chars = list(line)
+                first = bisect_left(columns, 2 * x0)
+                last = bisect_right(columns, 2 * x1)
+                for px in columns[first:last]:
+                    x = (px - 1) // 2 - x0
+                    if x % zoom == 0:
+                        chars[x // zoom] = '·'
+                line = ''.join(chars)
+            lines.append(line)
+        if y1 == h:
+            count = len(range(x0, x1, zoom))
+            lines.append('▀' * count + ('▘' if x1 == w else ''))
+
+        for char, (x, y) in (
+            ('S', self.generator.entry), ('E', self.generator.exit)
+        ):
+            if x0 <= x < x1 and y0 <= y < y1:
+                row, col = (y - y0) // zoom, (x - x0) // zoom
+                lines[row] = lines[row][:col] + char + lines[row][col + 1:]
+        return lines
+
+    def render_viewport(self) -> None:
+        """
+        Writes the part of the maze that fits in the terminal, starting
+        at ``view_x``, ``view_y``; an overview when ``zoom`` is set. Only
+        the visible cells are read, so the cost of a frame does not
+        depend on the size of the maze. The heatmap is only drawn by
+        the full view.
+        """
+        x0, y0, x1, y1 = self._view_window()
+        with span('render_viewport', (x1 - x0) * (y1 - y0)):
+            if self.zoom:
+                lines = self._overview_lines(x0, y0, x1, y1, self.zoom)
+                scale = f"1 character per {self.zoom}x{self.zoom} cells"
+            else:
+                lines = self._window_lines(x0, y0, x1, y1)
+                scale = "full detail"
+            parts = ['\033[2J\033[H', "A-Maze-ing\n======\n\n"]
+            for line in lines:
+                parts.append(self._colorize(line))
+                parts.append("\n")
+            parts.append(
+                f"Cells {x0}-{x1 - 1} x {y0}-{y1 - 1} of "
+                f"{self.generator.width}x{self.generator.height}, "
+                f"{scale}\n"
+            )
+            sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
 
     def render(self) -> None:
-        """Prints the canvas to the terminal with colors."""
-        canvas = self._build_canvas()
-        color = self.COLORS[self.color_idx]
-
-        # Clear screen (optional, helps keep the terminal clean)
-        print('\033[2J\033[H', end='')
-        print("A-Maze-ing\n======\n")
-
-        for row in canvas:
-            line = ""
-            for char in row:
-                if char == '█':
-                    line += f"{color}{char}{self.RESET}"
-                elif char == 'S':
-                    line += f"{self.COLORS[2]}{char}{self.RESET}"  # Green
-                elif char == 'E':
-                    line += f"{self.COLORS[1]}{char}{self.RESET}"  # Red
-                elif char == '·':
-                    line += f"{self.COLORS[4]}{char}{self.RESET}"  # Blue
+        """
+        Writes the whole coloured frame to the terminal at once, or the
+        viewport when the maze is larger than the terminal or zoomed out.
+        """
+        if self.zoom or not self._fits_terminal():
+            self.render_viewport()
+            return
+        cells = self.generator.width * self.generator.height
+        with span('render', cells):
+            # Clear screen (optional, helps keep the terminal clean)
+            parts = ['\033[2J\033[H', "A-Maze-ing\n======\n\n"]
+            for row in self._frame_rows():
+                parts.append(row)
+                parts.append("\n")
+            parts.append("\n")
+            sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
+
+    def _wall_position(self, x: int, y: int, wall: int) -> Tuple[int, int]:
+        """Returns the 1-based terminal (line, column) of a cell wall."""
+        row, col = 2 * y + 1, 2 * x + 1
+        if wall == MazeGrid.WALL_N:
+            row -= 1
+        elif wall == MazeGrid.WALL_S:
+            row += 1
+        elif wall == MazeGrid.WALL_E:
+            col += 1
+        else:
+            col -= 1
+        return self.HEADER_LINES + row + 1, col + 1
+
+    def animate(self, fps: float = 30.0, seconds: float = 4.0) -> None:
+        """
+        Generates a new maze while drawing every carved wall.
+
+        The closed grid is drawn once; then each frame only moves the
+        cursor to the walls opened since the previous frame and blanks
+        them, in a single write. Carve steps are spread so that the
+        animation lasts about ``seconds``, and frames are throttled to
+        ``fps``. When rendering falls behind, frames are not replayed.
+        A maze larger than the terminal is animated in the detailed
+        viewport at its top left corner.
+
+        Args:
+            fps: Maximum number of frames per second.
+            seconds: Target length of the animation.
+
+        Raises:
+            ValueError: If fps or seconds is not positive.
+        """
+        if fps <= 0 or seconds <= 0:
+            raise ValueError("fps and seconds must be positive.")
+        self.generator = MazeGenerator(self.config)
+        self.shortest_path = ""
+        self._reset_cache()
+        self.view_x = self.view_y = self.zoom = 0
+        self.render()
+        x1, y1 = self.generator.width, self.generator.height
+        if not self._fits_terminal():
+            _, _, x1, y1 = self._view_window()
+        last_line = self.HEADER_LINES + 2 * y1 + 1
+        last_column = 2 * x1 + 1
+
+        cells = self.generator.width * self.generator.height
+        steps_per_frame = max(1, math.ceil(cells / (fps * seconds)))
+        frame_time = 1.0 / fps
+        opened: List[str] = []
+        next_frame = time.perf_counter() + frame_time
+        sys.stdout.write('\033[?25l')  # Hide the cursor
+        try:
+            steps = self.generator.iter_carve()
+            for count, (x, y, wall) in enumerate(steps, start=1):
+                line, column = self._wall_position(x, y, wall)
+                if line <= last_line and column <= last_column:
+                    opened.append(f"\033[{line};{column}H ")
+                if count % steps_per_frame:
+                    continue
+                sys.stdout.write(''.join(opened))
+                sys.stdout.flush()
+                opened.clear()
+                delay = next_frame - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                    next_frame += frame_time
                 else:
-                    line += char
-            print(line)
-        print()
+                    next_frame = time.perf_counter() + frame_time
+            sys.stdout.write(''.join(opened))
+        finally:
+            sys.stdout.write('\033[?25h')  # Show the cursor again
+            sys.stdout.flush()
+
+        self._solve()
+
+    def browse(self) -> None:
+        """
+        Scrolls and zooms the viewport until the user goes back: w, a,
+        s and d move by half a screen, + and - zoom in and out, o zooms
+        out until the whole maze fits and q returns to the menu.
+        """
+        w, h = self.generator.width, self.generator.height
+        while True:
+            self.render_viewport()
+            print("w/a/s/d: scroll  +/-: zoom in/out  "
+                  "o: whole maze  q: back")
+            key = input("Move? ").strip().lower()
+            x0, y0, x1, y1 = self._view_window()
+            step_x, step_y = max(1, (x1 - x0) // 2), max(1, (y1 - y0) // 2)
+            if key == 'w':
+                self.view_y -= step_y
+            elif key == 's':
+                self.view_y += step_y
+            elif key == 'a':
+                self.view_x -= step_x
+            elif key == 'd':
+                self.view_x += step_x
+            elif key == '+':
+                self.zoom //= 2
+            elif key == '-':
+                self.zoom = max(1, self.zoom * 2)
+            elif key == 'o':
+                columns, lines = shutil.get_terminal_size()
+                lines -= self.HEADER_LINES + self.FOOTER_LINES
+                self.zoom = max(
+                    1,
+                    math.ceil(w / max(1, columns - 1)),
+                    math.ceil(h / max(1, lines - 1))
+                )
+                self.view_x = self.view_y = 0
+            elif key == 'q':
+                break
 
     def run(self) -> None:
         """Main loop for user interaction."""
@@ -131,8 +683,19 @@ class TerminalVisualizer:
             print("2. Show/Hide path from entry to exit")
             print("3. Rotate maze colors")
             print("4. Quit")
+            print("5. Watch a new maze being generated")
+            print("6. Show/Hide distance heatmap")
+            print("7. Browse: scroll and zoom the maze")
+            if self.show_heatmap:
+                stats = self.analysis()
+                print(
+                    f"   Distance 0-{stats.max_distance}, "
+                    f"{stats.dead_ends} dead ends, "
+                    f"{stats.junctions} junctions, "
+                    f"{stats.solution_fraction:.1%} of cells on the path"
+                )
 
-            choice = input("Choice? (1-4): ").strip()
+            choice = input("Choice? (1-7): ").strip()
 
             if choice == '1':
                 # Remove seed to allow random generation on redraw
@@ -146,5 +709,13 @@ class TerminalVisualizer:
             elif choice == '4':
                 print("Exiting A-Maze-ing. Goodbye!")
                 break
+            elif choice == '5':
+                if 'SEED' in self.config:
+                    del self.config['SEED']
+                self.animate()
+            elif choice == '6':
+                self.show_heatmap = not self.show_heatmap
+            elif choice == '7':
+                self.browse()
             else:
-                print("Invalid choice, please select 1-4.")
+                print("Invalid choice, please select 1-7.")